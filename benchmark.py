@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from threading import Event, Lock, Thread
+
+parser = argparse.ArgumentParser(description='LiSP micro-benchmarks')
+subparsers = parser.add_subparsers(dest='benchmark')
+
+signal_parser = subparsers.add_parser(
+    'signal', help='Signal.emit with 1/10/100 slots, from many threads')
+signal_parser.add_argument('-e', '--emits', type=int, default=20000,
+                           help='Emissions for every thread')
+signal_parser.add_argument('-t', '--threads', type=int, nargs='+',
+                           default=[1, 4], help='Number of emitting threads')
+
+properties_parser = subparsers.add_parser(
+    'properties', help='properties() time')
+properties_parser.add_argument('-c', '--cues', type=int, default=5000,
+                               help='Number of cues')
+
+executor_parser = subparsers.add_parser(
+    'executor', help='Latency of a burst of cue start commands')
+executor_parser.add_argument('-c', '--cues', type=int, default=100,
+                             help='Number of cues started together')
+executor_parser.add_argument('-r', '--rounds', type=int, default=20,
+                             help='Number of bursts')
+
+loader_parser = subparsers.add_parser(
+    'loader', help='Session loading time and longest UI stall')
+loader_parser.add_argument('-c', '--cues', type=int, default=500,
+                           help='Number of cues in the session')
+loader_parser.add_argument('-m', '--media', action='store_true',
+                           help='Load media cues (requires GStreamer)')
+
+session_parser = subparsers.add_parser(
+    'session-file', help='Size and load time of plain/compressed sessions')
+session_parser.add_argument('-c', '--cues', type=int, default=1000,
+                            help='Number of (media) cues in the session')
+session_parser.add_argument('-r', '--rounds', type=int, default=10,
+                            help='Number of loads')
+
+mixer_parser = subparsers.add_parser(
+    'mixer', help='CPU usage of direct outputs and of the shared mixer')
+mixer_parser.add_argument('-c', '--cues', type=int, nargs='+',
+                          default=[8, 32, 64], help='Playing cues')
+mixer_parser.add_argument('-d', '--duration', type=float, default=5,
+                          help='Seconds of playback for every run')
+mixer_parser.add_argument('-l', '--latency', type=int, default=20,
+                          help='Mixer latency in milliseconds')
+mixer_parser.add_argument('-s', '--sink', default='fakesink sync=true',
+                          help='Output sink (e.g. pulsesink, jackaudiosink)')
+
+
+def run_threads(threads, target, *args):
+    """Run `target(*args)` in the given number of threads, return the time."""
+    workers = [Thread(target=target, args=args) for _ in range(threads)]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return time.perf_counter() - start
+
+
+def signal_benchmark(args):
+    from lisp.core.signal import Signal
+
+    class Receiver:
+        def __init__(self):
+            self.calls = 0
+
+        def slot(self, value):
+            self.calls += 1
+
+    def emitter(signal, emits):
+        for n in range(emits):
+            signal.emit(n)
+
+    print('slots  threads  emits/s     us/emit')
+    for slots in (1, 10, 100):
+        signal = Signal()
+        receivers = [Receiver() for _ in range(slots)]
+        for receiver in receivers:
+            signal.connect(receiver.slot)
+
+        for threads in args.threads:
+            total = threads * args.emits
+            duration = run_threads(threads, emitter, signal, args.emits)
+            print('{:<6} {:<8} {:<11.0f} {:.2f}'.format(
+                slots, threads, total / duration, duration / total * 10**6))
+
+
+def properties_benchmark(args):
+    from lisp.cues.cue import Cue
+
+    cues = [Cue() for _ in range(args.cues)]
+    for n, cue in enumerate(cues):
+        cue.name = 'Cue {}'.format(n)
+
+    print('{} cues'.format(len(cues)))
+    for only_changed in (False, True):
+        start = time.perf_counter()
+        for cue in cues:
+            cue.properties(only_changed=only_changed)
+        duration = time.perf_counter() - start
+
+        print('properties(only_changed={}): {:.1f} ms'.format(
+            only_changed, duration * 1000))
+
+
+def executor_benchmark(args):
+    from lisp.cues.cue import Cue
+
+    lock = Lock()
+    done = Event()
+    latencies = []
+
+    class BenchCue(Cue):
+        def __start__(self, fade=False):
+            with lock:
+                latencies.append(time.perf_counter() - self.requested_at)
+                if len(latencies) == args.cues:
+                    done.set()
+            return False
+
+    cues = [BenchCue() for _ in range(args.cues)]
+    rounds = []
+
+    for _ in range(args.rounds):
+        latencies.clear()
+        done.clear()
+
+        start = time.perf_counter()
+        for cue in cues:
+            cue.requested_at = time.perf_counter()
+            cue.start()
+        # The time the caller (e.g. the GO) is blocked
+        calls = time.perf_counter() - start
+        done.wait(10)
+        rounds.append((calls, time.perf_counter() - start,
+                       sum(latencies) / len(latencies), max(latencies)))
+
+    print('{} cues, {} bursts (averages in ms)'.format(args.cues, args.rounds))
+    print('calls: {:.2f}, burst: {:.2f}, latency: {:.2f}, max: {:.2f}'.format(
+        *(sum(r[i] for r in rounds) / len(rounds) * 1000 for i in range(4))))
+
+
+def loader_benchmark(args):
+    from uuid import uuid4
+
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+
+    from lisp.core.configuration import config
+    from lisp.cues.cue import Cue
+    from lisp.cues.cue_factory import CueFactory
+    from lisp.cues.cue_model import CueModel
+    from lisp.session_loader import SessionLoader
+
+    app = QApplication([])
+
+    if args.media:
+        from lisp.modules.gst_backend import elements
+        from lisp.modules.gst_backend.gi_repository import Gst
+        from lisp.modules.gst_backend.gst_cue_factories import \
+            register_factories
+
+        Gst.init(None)
+        elements.load()
+        register_factories()
+
+        # Test-source and fake-sink elements are not available, use an
+        # (unreadable) uri, the pipelines are built anyway
+        cue_type = 'MediaCue'
+        pipe = ['UriInput', 'Volume', 'DbMeter', 'AutoSink']
+        extra = {'_media_': {'pipe': pipe, 'elements': {
+            'UriInput': {'uri': 'file:///dev/null'}}}}
+        lazy = config['Gst']['LazyPipeline']
+    else:
+        cue_type = 'Cue'
+        extra = {}
+        lazy = 'n/a'
+        if not CueFactory.has_factory('Cue'):
+            CueFactory.register_factory('Cue', Cue)
+
+    session = {'application': {'layout': 'ListLayout'}, 'plugins': {},
+               'cues': [dict({'_type_': cue_type, 'id': str(uuid4()),
+                              'index': n, 'name': 'Cue {}'.format(n)},
+                             **extra)
+                        for n in range(args.cues)]}
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.lsp',
+                                     delete=False) as file:
+        json.dump(session, file)
+
+    class Receiver:
+        def __init__(self):
+            self.stall = 0
+            self.last = time.perf_counter()
+
+        def tick(self):
+            now = time.perf_counter()
+            self.stall = max(self.stall, now - self.last)
+            self.last = now
+
+        def finished(self, loader, completed):
+            self.time = time.perf_counter() - self.start
+            app.quit()
+
+    receiver = Receiver()
+    timer = QTimer()
+    timer.setInterval(1)
+    timer.timeout.connect(receiver.tick)
+
+    try:
+        loader = SessionLoader(file.name, CueModel())
+        loader.finished.connect(receiver.finished)
+
+        receiver.start = receiver.last = time.perf_counter()
+        timer.start()
+        loader.start()
+        app.exec_()
+
+        print('{} cues (type "{}", lazy pipelines: {})'.format(
+            args.cues, cue_type, lazy))
+        print('load: {:.1f} ms, longest UI stall: {:.1f} ms'.format(
+            receiver.time * 1000, receiver.stall * 1000))
+    finally:
+        os.remove(file.name)
+
+
+def session_file_benchmark(args):
+    from uuid import uuid4
+
+    from lisp.core.session_file import read_session, write_session
+
+    # Similar to the cues saved by the application (only changed values)
+    session = {'application': {'layout': 'ListLayout'}, 'plugins': {},
+               'cues': [{'_type_': 'MediaCue', 'id': str(uuid4()), 'index': n,
+                         'name': 'Track {}'.format(n), '_media_': {
+                             'pipe': ['UriInput', 'Volume', 'Equalizer10',
+                                      'DbMeter', 'AutoSink'],
+                             'elements': {
+                                 'UriInput': {'uri': 'file:///home/user/'
+                                              'show/track_{}.wav'.format(n)},
+                                 'Volume': {'volume': 0.8}}}}
+                        for n in range(args.cues)]}
+
+    print('{} cues, {} loads'.format(args.cues, args.rounds))
+    for compressed in (False, True):
+        path = tempfile.mktemp(suffix='.lsp')
+        try:
+            start = time.perf_counter()
+            write_session(path, session, compressed=compressed)
+            write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                read_session(path)
+            read = (time.perf_counter() - start) / args.rounds
+
+            print('{:<10} {:>9} bytes, write {:.1f} ms, read {:.1f} ms'.format(
+                'compressed' if compressed else 'plain', os.path.getsize(path),
+                write * 1000, read * 1000))
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def mixer_benchmark(args):
+    from lisp.modules.gst_backend.gi_repository import Gst
+    from lisp.modules.gst_backend.gst_output_mixer import set_inter_latency
+
+    Gst.init(None)
+    source = 'audiotestsrc is-live=true volume=0.1 ! audioconvert'
+
+    def direct(cues):
+        return [Gst.parse_launch('{} ! audioresample ! {}'.format(
+            source, args.sink)) for _ in range(cues)]
+
+    def shared(cues):
+        mixer = Gst.parse_launch('audiomixer name=mixer ! audioconvert ! '
+                                 'audioresample ! ' + args.sink)
+        pipelines = [mixer]
+
+        for n in range(cues):
+            channel = 'lisp-bench-{}'.format(n)
+            pipeline = Gst.parse_launch(
+                '{} ! interaudiosink name=sink channel={}'.format(source,
+                                                                  channel))
+            set_inter_latency(pipeline.get_by_name('sink'), args.latency)
+            pipelines.append(pipeline)
+
+            branch = Gst.parse_bin_from_description(
+                'interaudiosrc name=src channel={} ! audioconvert ! '
+                'audioresample'.format(channel), True)
+            set_inter_latency(branch.get_by_name('src'), args.latency)
+            mixer.add(branch)
+            branch.link(mixer.get_by_name('mixer'))
+
+        return pipelines
+
+    print('{:.0f}s of playback, sink "{}", mixer latency {} ms'.format(
+        args.duration, args.sink, args.latency))
+    print('cues   direct (CPU s)  shared (CPU s)')
+    for cues in args.cues:
+        results = []
+        for build in (direct, shared):
+            pipelines = build(cues)
+
+            start = time.process_time()
+            for pipeline in pipelines:
+                pipeline.set_state(Gst.State.PLAYING)
+            time.sleep(args.duration)
+            for pipeline in pipelines:
+                pipeline.set_state(Gst.State.NULL)
+
+            results.append(time.process_time() - start)
+
+        print('{:<6} {:<15.2f} {:.2f}'.format(cues, *results))
+
+
+BENCHMARKS = {
+    'signal': signal_benchmark,
+    'properties': properties_benchmark,
+    'executor': executor_benchmark,
+    'loader': loader_benchmark,
+    'session-file': session_file_benchmark,
+    'mixer': mixer_benchmark
+}
+
+args = parser.parse_args()
+
+if args.benchmark in BENCHMARKS:
+    BENCHMARKS[args.benchmark](args)
+else:
+    parser.print_help()
@@ -17,7 +17,6 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
-import json
 from os.path import exists
 
 from PyQt5.QtWidgets import QDialog, qApp
@@ -28,11 +27,14 @@ from lisp import plugins
 from lisp.core import configuration as cfg
 from lisp.core.actions_handler import MainActionsHandler
 from lisp.core.memento_model import AdapterMementoModel
+from lisp.core.session_file import write_session
 from lisp.core.singleton import Singleton
-from lisp.cues.cue_factory import CueFactory
 from lisp.cues.cue_model import CueModel
+from lisp.session_journal import SessionJournal, journal_path
+from lisp.session_loader import SessionLoader
 from lisp.ui import elogging
 from lisp.ui.layoutselect import LayoutSelect
+from lisp.ui.loading_dialog import LoadingDialog
 from lisp.ui.mainwindow import MainWindow
 from lisp.ui.settings.app_settings import AppSettings
 from lisp.ui.settings.pages.app_general import General
@@ -46,10 +48,13 @@ class Application(metaclass=Singleton):
         self._layout = None
         self._memento_model = None
         self._cue_model = CueModel()
+        self._loader = None
+        self._journal = None
 
         # Connect mainWindow actions
         self._mainWindow.new_session.connect(self.new_session_dialog)
         self._mainWindow.save_session.connect(self._save_to_file)
+        self._mainWindow.export_session.connect(self._export_to_file)
         self._mainWindow.open_session.connect(self._load_from_file)
 
         # Register general settings widget
@@ -115,6 +120,12 @@ class Application(metaclass=Singleton):
         plugins.init_plugins()
 
     def _delete_session(self):
+        # Stop the loading of the session, if in progress
+        self.__stop_loader()
+
+        # The unsaved changes are discarded
+        self.__discard_journal()
+
         if self._layout is not None:
             MainActionsHandler.clear()
             plugins.reset_plugins()
@@ -135,6 +146,33 @@ class Application(metaclass=Singleton):
 
     def _save_to_file(self, session_file):
         """Save the current session into a file."""
+        if self._loader is not None:
+            elogging.warning('Cannot save the session while loading')
+            return
+
+        compressed = cfg.config['Session'].getboolean('Compressed')
+        write_session(session_file, self._session(), compressed=compressed)
+
+        # The saved changes are no more needed in the journal
+        if (self._journal is not None and
+                self._journal.path == journal_path(session_file)):
+            self._journal.compact()
+        else:
+            self.__discard_journal()
+            self.__start_journal(session_file)
+
+        MainActionsHandler.set_saved()
+        self._mainWindow.update_window_title()
+
+    def _export_to_file(self, session_file):
+        """Save a copy of the current session, in the plain (JSON) format."""
+        if self._loader is not None:
+            elogging.warning('Cannot export the session while loading')
+            return
+
+        write_session(session_file, self._session(), compressed=False)
+
+    def _session(self):
         session = {"cues": [], "plugins": {}, "application": []}
 
         # Add the cues
@@ -146,45 +184,104 @@ class Application(metaclass=Singleton):
         session['plugins'] = plugins.get_plugin_settings()
         session['application'] = self._app_conf
 
-        # Write to a file the json-encoded dictionary
-        with open(session_file, mode='w', encoding='utf-8') as file:
-            file.write(json.dumps(session, sort_keys=True, indent=4))
-
-        MainActionsHandler.set_saved()
-        self._mainWindow.update_window_title()
+        return session
 
     def _load_from_file(self, session_file):
-        """ Load a saved session from file """
-        try:
-            with open(session_file, mode='r', encoding='utf-8') as file:
-                session = json.load(file)
+        """Load a saved session from file, in background.
+
+        The session is read by a worker thread, the cues are then added
+        progressively, the loading can be cancelled by the user.
+        """
+        self.__stop_loader()
+
+        # Discard the journal before the new one is replayed (may be the same)
+        self.__discard_journal()
+
+        self._loader = SessionLoader(session_file, self._cue_model)
+        self._loader.parsed.connect(self.__session_parsed)
+        self._loader.finished.connect(self.__session_loaded)
+        self._loader.failed.connect(self.__session_failed)
 
-            # New session
+        LoadingDialog(self._loader, parent=self._mainWindow)
+        self._loader.start()
+
+    def __stop_loader(self):
+        if self._loader is not None:
+            # The loader may still emit, it must not affect the next session
+            self._loader.parsed.disconnect(self.__session_parsed)
+            self._loader.finished.disconnect(self.__session_loaded)
+            self._loader.failed.disconnect(self.__session_failed)
+            self._loader.cancel()
+            self._loader = None
+
+    def __session_parsed(self, loader, session):
+        if loader is not self._loader:
+            return
+
+        try:
+            # New session (the current loader is kept)
+            self._loader = None
             self._new_session(
                 layouts.get_layout(session['application']['layout']))
+            # The changes done while loading are not saved
+            MainActionsHandler.set_saved()
             # Get the application settings
             self._app_conf = session['application']
-
-            # Load cues
-            for cue_conf in session['cues']:
-                cue_type = cue_conf.pop('_type_', 'Undefined')
-                cue_id = cue_conf.pop('id')
-                try:
-                    cue = CueFactory.create_cue(cue_type, cue_id=cue_id)
-                    cue.update_properties(cue_conf)
-                    self._cue_model.add(cue)
-                except Exception as e:
-                    elogging.exception('Unable to create the cue', e)
-
-            MainActionsHandler.set_saved()
-            self._mainWindow.update_window_title()
-
             # Load plugins settings
             plugins.set_plugins_settings(session['plugins'])
 
-            # Update the main-window
-            self._mainWindow.filename = session_file
-            self._mainWindow.update()
+            self._loader = loader
         except Exception as e:
+            loader.cancel()
             elogging.exception('Error during file reading', e)
             self.new_session_dialog()
+
+    def __session_loaded(self, loader, completed):
+        if loader is not self._loader:
+            return
+
+        self._loader = None
+
+        if self._layout is None:
+            # Cancelled before the session is created (e.g. at startup)
+            self.new_session_dialog()
+            return
+
+        if completed:
+            self._mainWindow.filename = loader.session_file
+            self.__start_journal(loader.session_file)
+        else:
+            # Avoid to overwrite the file with a partial session
+            self._mainWindow.filename = ''
+            elogging.warning(
+                'Session loading cancelled, {} of {} cues loaded'.format(
+                    len(self._cue_model), loader.total), dialog=False)
+
+        if loader.recovered:
+            # Recovered changes are not saved in the session file
+            MainActionsHandler.set_unsaved()
+            elogging.warning(
+                'Recovered {} unsaved changes of the session'.format(
+                    loader.recovered), dialog=False)
+
+        self._mainWindow.update_window_title()
+        self._mainWindow.update()
+
+    def __start_journal(self, session_file):
+        if cfg.config['Session'].getboolean('Journal'):
+            self._journal = SessionJournal(
+                session_file, self._cue_model, self._layout.model_adapter,
+                interval=cfg.config['Session'].getfloat('JournalInterval'))
+
+    def __discard_journal(self):
+        if self._journal is not None:
+            self._journal.discard()
+            self._journal = None
+
+    def __session_failed(self, loader, exception):
+        if loader is not self._loader:
+            return
+
+        self._loader = None
+        elogging.exception('Error during file reading', exception)
+        self.new_session_dialog()
@@ -85,6 +85,15 @@ class Media(HasProperties):
         :rtype: MediaState
         """
 
+    def arm(self):
+        """Prepare the (stopped) media to start the playback without delay.
+
+        Not supported by default, in that case nothing is done.
+        """
+
+    def disarm(self):
+        """Release the resources reserved by `arm`."""
+
     @abstractmethod
     def current_time(self):
         """
@@ -55,3 +55,37 @@ class Action:
         :rtype: str
         """
         return ''
+
+
+class CompoundAction(Action):
+    """Group many actions into a single one.
+
+    Actions are undone in reverse order, and redone in the original order.
+    """
+
+    __slots__ = ('name', '_actions')
+
+    def __init__(self, name='', actions=()):
+        self.name = name
+        self._actions = list(actions)
+
+    def append(self, action):
+        self._actions.append(action)
+
+    def do(self):
+        for action in self._actions:
+            action.do()
+
+    def undo(self):
+        for action in reversed(self._actions):
+            action.undo()
+
+    def redo(self):
+        for action in self._actions:
+            action.redo()
+
+    def log(self):
+        return self.name
+
+    def __len__(self):
+        return len(self._actions)
@@ -19,14 +19,23 @@
 
 import logging
 from collections import deque
+from contextlib import contextmanager
+from threading import local
 
 from lisp.core import configuration as cfg
-from lisp.core.action import Action
+from lisp.core.action import Action, CompoundAction
 from lisp.core.signal import Signal
 
 
 class ActionsHandler:
-    """Provide a classic undo/redo mechanism based on stacks."""
+    """Provide a classic undo/redo mechanism based on stacks.
+
+    Many actions can be recorded as a single one using `transaction()`, or
+    executed without being recorded using `suspended()`.
+
+    Transactions and suspensions only affect the thread that opened them,
+    actions done meanwhile by other threads are recorded as usual.
+    """
 
     MaxStackSize = int(cfg.config['Actions']['MaxStackSize'])
 
@@ -44,12 +53,16 @@ class ActionsHandler:
             self._redo.maxlen = self.MaxStackSize
 
         self._saved_action = None
+        self._unsaved = False
+        # Per-thread "transaction" and "suspended" state
+        self._local = local()
 
     def clear(self):
         """Clear the `undo` and `redo` stacks."""
         self._undo.clear()
         self._redo.clear()
         self._saved_action = None
+        self._unsaved = False
 
     def do_action(self, action: Action):
         """Execute the action, and add it the `undo` stack.
@@ -59,9 +72,61 @@ class ActionsHandler:
          * is appended to the `undo` stack
          * the `redo` stack is cleared to maintain consistency
          * the `action_done` signal is emitted
+
+        Within a transaction the action is only executed and added to the
+        transaction, when recording is suspended is only executed.
         """
         action.do()
 
+        if getattr(self._local, 'suspended', 0):
+            return
+
+        transaction = getattr(self._local, 'transaction', None)
+        if transaction is not None:
+            transaction.append(action)
+        else:
+            self._record(action)
+
+    @contextmanager
+    def transaction(self, name=''):
+        """Record the actions done in the context as a single action.
+
+        Nested transactions are merged into the outermost one.
+
+        .. Usage::
+
+            with handler.transaction('Renumber cues'):
+                handler.do_action(action1)
+                handler.do_action(action2)
+        """
+        if getattr(self._local, 'transaction', None) is not None:
+            yield
+            return
+
+        transaction = self._local.transaction = CompoundAction(name)
+        try:
+            yield
+        finally:
+            self._local.transaction = None
+
+            # Record even if interrupted, what is done can be undone
+            if transaction:
+                self._record(transaction)
+
+    @contextmanager
+    def suspended(self):
+        """Execute the actions done in the context without recording them.
+
+        Useful for bulk operations that cannot (or should not) be undone,
+        e.g. loading a session.
+        """
+        self._local.suspended = getattr(self._local, 'suspended', 0) + 1
+        try:
+            yield
+        finally:
+            self._local.suspended -= 1
+
+    def _record(self, action):
         self._logging(action, 'Last action: ')
         self._undo.append(action)
         # Clean the redo stack for maintain consistency
@@ -107,13 +172,22 @@ class ActionsHandler:
 
     def set_saved(self):
         """Set the action at the _top_ of the `undo` stack as `save-point`."""
-        if self._undo:
-            self._saved_action = self._undo[-1]
+        self._unsaved = False
+        self._saved_action = self._undo[-1] if self._undo else None
+
+    def set_unsaved(self):
+        """Mark the session as changed, until the next `set_saved`.
+
+        Used for changes that are not actions (e.g. recovered ones).
+        """
+        self._unsaved = True
 
     def is_saved(self) -> bool:
         """Return True if the action at the _top_ of the `undo` stack is the
         `save-point`.
         """
+        if self._unsaved:
+            return False
         if self._undo:
             return self._undo[-1] is self._saved_action
         else:
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import time
+from collections import deque
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+from lisp.core.configuration import config
+
+
+class GoLatencyTracer:
+    """Measure the latency between a GO and the audible output of a cue.
+
+    Every stage of the execution is "marked" with a timestamp, the latency of
+    a stage is the time elapsed since the beginning of the trace (the GO or,
+    when the cue is executed in other ways, the execution request).
+    Latencies of the traces starting a cue are aggregated in per
+    cue-type/stage histograms, the last traces (of any action) are kept to
+    be exported as CSV.
+
+    Objects other than the cue (e.g. its media) can be traced as "aliases" of
+    the cue that own them.
+    """
+
+    # Execution stages, in order
+    STAGES = ('go', 'execute', 'lock', 'start', 'playing', 'output')
+    # Actions (values) of the traces aggregated in the statistics
+    START_ACTIONS = ('Start', 'FadeInStart')
+
+    # Histogram buckets upper limits (in seconds), the last is "unbounded"
+    BUCKETS = (0.001, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5)
+    BUCKETS_NAMES = ('<1ms', '<5ms', '<10ms', '<20ms', '<50ms', '<100ms',
+                     '<200ms', '<500ms', '>=500ms')
+
+    # Marks received after this time (in seconds) do not belong to the trace
+    TIMEOUT = 10
+    # Maximum number of traces kept for the export
+    MAX_TRACES = 10000
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = Lock()
+        self._aliases = WeakKeyDictionary()
+        self._current = WeakKeyDictionary()
+        self._traces = deque(maxlen=self.MAX_TRACES)
+        self._stats = {}
+
+    def enable(self, enable=True):
+        self.enabled = enable
+
+    def reset(self):
+        with self._lock:
+            self._current.clear()
+            self._traces.clear()
+            self._stats.clear()
+
+    def alias(self, obj, cue):
+        """Trace the stages marked on `obj` as stages of `cue`."""
+        self._aliases[obj] = cue
+
+    def mark(self, obj, stage, action=None):
+        """Mark the given stage for `obj` (a cue or one of its aliases).
+
+        The "go" stage always begin a new trace, "execute" begin a new trace
+        unless the cue was just "go"ed, other stages are recorded only once
+        in the current trace.
+
+        :param action: the executed action value, given with "execute", only
+                       the traces of the START_ACTIONS are aggregated
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        cue = self._aliases.get(obj, obj)
+
+        with self._lock:
+            trace = self._current.get(cue)
+            if trace is not None and now - trace['begin'] > self.TIMEOUT:
+                trace = None
+
+            if stage == 'go' or (stage == 'execute' and (
+                    trace is None or 'execute' in trace['stages'])):
+                trace = {
+                    'time': time.time(),
+                    'begin': now,
+                    'id': cue.id,
+                    'name': cue.name,
+                    'type': type(cue).__name__,
+                    'action': None,
+                    'stages': {}
+                }
+                self._current[cue] = trace
+                self._traces.append(trace)
+            elif trace is None or stage in trace['stages']:
+                return
+
+            latency = now - trace['begin']
+            trace['stages'][stage] = latency
+
+            if stage == 'execute':
+                trace['action'] = action
+                if action in self.START_ACTIONS:
+                    # Also the stages marked before the action was known
+                    for name, latency in trace['stages'].items():
+                        self.__stage_stats(trace['type'], name, latency)
+            elif trace['action'] in self.START_ACTIONS:
+                self.__stage_stats(trace['type'], stage, latency)
+
+    def report(self):
+        """Return a copy of the collected statistics (start actions only).
+
+        :return: {cue_type: {stage: {'count', 'total', 'max', 'histogram'}}}
+            (times in seconds)
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                cue_type: {
+                    stage: dict(stats, histogram=dict(stats['histogram']))
+                    for stage, stats in stages.items()
+                }
+                for cue_type, stages in self._stats.items()
+            }
+
+    def dump_csv(self, path):
+        """Write the recorded traces in a CSV file (latencies in ms)."""
+        with self._lock:
+            traces = [dict(trace, stages=dict(trace['stages']))
+                      for trace in self._traces]
+
+        with open(path, mode='w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(('time', 'cue_id', 'cue_name', 'cue_type',
+                             'action') + self.STAGES)
+
+            for trace in traces:
+                row = [time.strftime('%Y-%m-%d %H:%M:%S',
+                                     time.localtime(trace['time'])),
+                       trace['id'], trace['name'], trace['type'],
+                       trace['action'] or '']
+                for stage in self.STAGES:
+                    latency = trace['stages'].get(stage)
+                    row.append('' if latency is None else
+                               '{:.3f}'.format(latency * 1000))
+
+                writer.writerow(row)
+
+    def __stage_stats(self, cue_type, stage, latency):
+        stats = self._stats.setdefault(cue_type, {}).get(stage)
+        if stats is None:
+            stats = self._stats[cue_type][stage] = {
+                'count': 0,
+                'total': 0,
+                'max': 0,
+                'histogram': {name: 0 for name in self.BUCKETS_NAMES}
+            }
+
+        stats['count'] += 1
+        stats['total'] += latency
+        stats['max'] = max(stats['max'], latency)
+
+        for limit, name in zip(self.BUCKETS, self.BUCKETS_NAMES):
+            if latency < limit:
+                stats['histogram'][name] += 1
+                break
+        else:
+            stats['histogram'][self.BUCKETS_NAMES[-1]] += 1
+
+
+GoLatency = GoLatencyTracer()
+GoLatency.enable(config['Cue'].getboolean('LatencyTracing'))
@@ -18,15 +18,37 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from abc import ABCMeta
+from collections import OrderedDict
+from contextlib import contextmanager
 from copy import deepcopy
+from enum import Enum
 
 from lisp.core.signal import Signal
 from lisp.core.util import subclasses
 
 
+def is_immutable(value):
+    """Return True if the given value is (deeply) immutable."""
+    if isinstance(value, (type(None), bool, int, float, complex, str, bytes,
+                          Enum)):
+        return True
+    elif isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+
+    return False
+
+
 class Property:
     """Descriptor to be used in HasProperties subclasses to define properties.
 
+    Values are stored in the instance only when written, immutable defaults
+    are shared between all the instances, while mutable ones are copied on
+    the first access.
+
+    The names of the properties that may differ from the default are tracked
+    in the instance `_changed_properties` set, properties not in the set are
+    considered unchanged.
+
     .. warning::
         To be able to save properties into a session, the stored value
         MUST be JSON-serializable.
@@ -34,29 +56,60 @@ class Property:
     .. warning::
         If extended any subclass *MUST*:
         1) if the __get__ method receive a None instance return self;
-        2) if the __get__ is called while the value is not set, set it with a
-           safe copy of 'default' and return.
+        2) if the __get__ is called while the value is not set, return the
+           default if immutable, otherwise set it with a safe copy of
+           'default' and return it.
         3) After the value is changed call the __changed__ method.
+        4) When the value may differ from the default, add the property
+           name to the instance `_changed_properties` set.
     """
 
     def __init__(self, default=None):
         self.name = 'unnamed_property'
         self.default = default
+        self._shared_default = is_immutable(default)
 
     def __get__(self, instance, owner=None):
         if instance is None:
             return self
-        elif self.name not in instance.__dict__:
-            instance.__dict__[self.name] = deepcopy(self.default)
 
-        return instance.__dict__.get(self.name)
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            if self._shared_default:
+                return self.default
+
+            value = instance.__dict__[self.name] = deepcopy(self.default)
+            # The value could be modified "in-place"
+            instance._changed_properties.add(self.name)
+            return value
 
     def __set__(self, instance, value):
-        if instance is not None:
-            # Only change the value if different
-            if value != instance.__dict__.get(self.name, self.default):
-                instance.__dict__[self.name] = value
-                self.__changed__(instance, value)
+        if instance is not None and self.set_silently(instance, value):
+            self.__changed__(instance, value)
+
+    def set_silently(self, instance, value):
+        """Set the value without notifying the change.
+
+        Useful to keep up-to-date values (e.g. positions) for many instances,
+        when the change is notified in another (cheaper) way.
+
+        :return: True if the value is changed, False otherwise
+        """
+        # Only change the value if different
+        if value != instance.__dict__.get(self.name, self.default):
+            instance.__dict__[self.name] = value
+
+            # A mutable value equal to the default could still be modified
+            # "in-place", so it must remain tracked
+            if value == self.default and is_immutable(value):
+                instance._changed_properties.discard(self.name)
+            else:
+                instance._changed_properties.add(self.name)
+
+            return True
+
+        return False
 
     def changed(self, instance):
         if instance is not None:
@@ -66,11 +119,7 @@ class Property:
         return False, self.default
 
     def __changed__(self, instance, value):
-        instance.property_changed.emit(instance, self.name, value)
-        # Get the related signal
-        property_signal = instance.changed_signals.get(self.name)
-        if property_signal is not None:
-            property_signal.emit(value)
+        instance._property_changed(self.name, value)
 
 
 class WriteOnceProperty(Property):
@@ -130,8 +179,12 @@ class HasPropertiesMeta(ABCMeta):
     """Metaclass for HasProperties classes.
 
     This metaclass manage the 'propagation' of the properties in all subclasses,
-    this process involves overwriting __properties__ with a set containing all
-    the properties names.
+    this process involves compiling, for every class, the properties layout:
+     * __properties_layout__: a tuple with all the properties descriptors,
+       base-classes properties first
+     * __properties__: a set containing all the properties names
+     * __properties_map__: a dictionary {name: descriptor}
+     * __nested_properties__: a tuple with the NestedProperties descriptors
 
     ..note::
         This metaclass is derived form :class:`abc.ABCMeta`, so abstract
@@ -141,17 +194,28 @@ class HasPropertiesMeta(ABCMeta):
     def __init__(cls, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Use a set for avoiding repetitions
-        cls.__properties__ = set()
-
-        # Populate with all the properties
         for name, attribute in vars(cls).items():
             if isinstance(attribute, Property):
-                cls.__properties__.add(name)
                 attribute.name = name
 
-        for base in cls.__bases__:
-            cls.__properties__.update(getattr(base, '__properties__', ()))
+        cls._compile_properties()
+
+    def _compile_properties(cls):
+        layout = OrderedDict()
+
+        # Walk the MRO from the base classes, subclasses can override
+        # the properties descriptors, keeping the original position
+        for klass in reversed(cls.__mro__):
+            for name, attribute in vars(klass).items():
+                if isinstance(attribute, Property):
+                    layout[name] = attribute
+
+        cls.__properties_layout__ = tuple(layout.values())
+        cls.__properties__ = set(layout.keys())
+        cls.__properties_map__ = dict(layout)
+        cls.__nested_properties__ = tuple(
+            prop for prop in layout.values()
+            if isinstance(prop, NestedProperties))
 
 
 class HasProperties(metaclass=HasPropertiesMeta):
@@ -169,10 +233,28 @@ class HasProperties(metaclass=HasPropertiesMeta):
     """
 
     __properties__ = set()
+    __properties_layout__ = ()
+    __properties_map__ = {}
+    __nested_properties__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        instance = super().__new__(cls)
+        # Created here, properties can be read before __init__ is called
+        instance._changed_properties = set()
+        """Names of the properties that may differ from the default"""
+
+        return instance
 
     def __init__(self):
-        self.property_changed = Signal()
-        #: Emitted after property change (self, name, value)
+        self.property_changed = Signal(
+            name=type(self).__name__ + '.property_changed')
+        #: Emitted after a property change, outside a batch (self, name, value)
+
+        self.properties_changed = Signal(
+            name=type(self).__name__ + '.properties_changed')
+        #: Emitted after a batch of changes (self, {name: value})
+
+        self._batch = None
 
         self.changed_signals = {}
         """Contains signals that are emitted after the associated property is
@@ -189,10 +271,10 @@ class HasProperties(metaclass=HasPropertiesMeta):
         if name not in cls.__properties__:
             prop.name = name
             setattr(cls, name, prop)
-            cls.__properties__.add(name)
+            cls._compile_properties()
 
             for subclass in subclasses(cls):
-                subclass.__properties__.add(name)
+                subclass._compile_properties()
 
     def changed(self, property_name):
         """
@@ -206,7 +288,8 @@ class HasProperties(metaclass=HasPropertiesMeta):
         signal = self.changed_signals.get(property_name, None)
 
         if signal is None:
-            signal = Signal()
+            signal = Signal(
+                name='{}.changed({})'.format(type(self).__name__, property_name))
             self.changed_signals[property_name] = signal
 
         return signal
@@ -221,14 +304,20 @@ class HasProperties(metaclass=HasPropertiesMeta):
         """
         if only_changed:
             properties = {}
-            for name in self.__properties__:
-                changed, value = getattr(self.__class__, name).changed(self)
+
+            # Only the tracked properties need to be checked, nested
+            # properties track their changes independently
+            for prop in self.__nested_properties__ + tuple(
+                    self.__properties_map__[name]
+                    for name in tuple(self._changed_properties)):
+                changed, value = prop.changed(self)
                 if changed:
-                    properties[name] = value
+                    properties[prop.name] = value
 
             return properties
 
-        return {name: getattr(self, name) for name in self.__properties__}
+        return {prop.name: prop.__get__(self)
+                for prop in self.__properties_layout__}
 
     @classmethod
     def properties_defaults(cls):
@@ -236,14 +325,67 @@ class HasProperties(metaclass=HasPropertiesMeta):
         :return: The default properties as a dictionary {name: default_value}
         :rtype: dict
         """
-        return {name: getattr(cls, name).default for name in cls.__properties__}
+        return {prop.name: prop.default for prop in cls.__properties_layout__}
 
     def update_properties(self, properties):
         """Set the given properties.
 
+        The changes are notified in a single batch, see :func:`batch_update`.
+
         :param properties: The element properties
         :type properties: dict
         """
-        for name, value in properties.items():
-            if name in self.__properties__:
-                setattr(self, name, value)
+        with self.batch_update():
+            for name, value in properties.items():
+                if name in self.__properties__:
+                    setattr(self, name, value)
+
+    @contextmanager
+    def batch_update(self):
+        """Context manager to notify many properties changes at once.
+
+        Inside the context the changes notifications are postponed, on exit
+        the `changed` signals are emitted for every changed property, followed
+        by a single `properties_changed` emission with all the changes.
+        Nested contexts are merged with the outermost one.
+
+        .. note::
+            `property_changed` is not emitted for the changes in a batch,
+            to be notified of any change connect to both.
+
+        .. Usage::
+
+            with instance.batch_update():
+                instance.prop1 = 42
+                instance.prop2 = 'something'
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = OrderedDict()
+        try:
+            yield
+        finally:
+            changes = self._batch
+            self._batch = None
+
+            for name, value in changes.items():
+                self.__emit_changed(name, value)
+
+            if changes:
+                self.properties_changed.emit(self, dict(changes))
+
+    def _property_changed(self, name, value):
+        """Notify the change of a property, called by the Property objects."""
+        if self._batch is not None:
+            self._batch[name] = value
+        else:
+            self.property_changed.emit(self, name, value)
+            self.__emit_changed(name, value)
+
+    def __emit_changed(self, name, value):
+        # Get the related signal
+        property_signal = self.changed_signals.get(name)
+        if property_signal is not None:
+            property_signal.emit(value)
@@ -62,6 +62,11 @@ class load_classes:
 
     def load(self):
         """Generate lists of tuples (class-name, class-object)."""
+        for mod_name in self.modules():
+            yield from self.load_module(mod_name)
+
+    def modules(self):
+        """Generate the names of the (not excluded) package modules."""
         for entry in os.scandir(self.pkg_path):
 
             # Exclude __init__, __pycache__ and likely
@@ -81,22 +86,26 @@ class load_classes:
             if mod_name in self.excluded:
                 continue
 
-            mod_path = self.pkg + '.' + mod_name
+            yield mod_name
+
+    def load_module(self, mod_name):
+        """Generate tuples (class-name, class-object) from the given module."""
+        mod_path = self.pkg + '.' + mod_name
 
-            try:
-                # Import module
-                module = import_module(mod_path)
+        try:
+            # Import module
+            module = import_module(mod_path)
 
-                # Load class from imported module
-                for prefix, suffix in zip(self.prefixes, self.suffixes):
-                    name = self._class_name(mod_name, prefix, suffix)
-                    if hasattr(module, name):
-                        cls = getattr(module, name)
-                        yield (name, cls)
+            # Load class from imported module
+            for prefix, suffix in zip(self.prefixes, self.suffixes):
+                name = self._class_name(mod_name, prefix, suffix)
+                if hasattr(module, name):
+                    cls = getattr(module, name)
+                    yield (name, cls)
 
-            except ImportError:
-                logging.warning('Cannot load module: {0}'.format(mod_name))
-                logging.debug(traceback.format_exc())
+        except ImportError:
+            logging.warning('Cannot load module: {0}'.format(mod_name))
+            logging.debug(traceback.format_exc())
 
     @staticmethod
     def _class_name(mod_name, pre='', suf=''):
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import sys
+import traceback
+from collections import OrderedDict
+from importlib.util import find_spec
+from inspect import ismodule
+
+from lisp.core.loading import load_classes
+from lisp.core.startup_profiler import StartupProfile
+
+
+def modification_time(path):
+    """Return the latest modification time of the files under `path`."""
+    if os.path.isfile(path):
+        return os.path.getmtime(path)
+
+    mtime = 0
+    for root, dirs, files in os.walk(path):
+        # Compiled files are not relevant
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        for file in files:
+            mtime = max(mtime, os.path.getmtime(os.path.join(root, file)))
+
+    return mtime
+
+
+def third_party_modules(names):
+    """Return the (top-level) modules, in `names`, not part of the stdlib."""
+    modules = set()
+
+    for name in names:
+        module = sys.modules.get(name.split('.')[0])
+        path = getattr(module, '__file__', None) or ''
+        if 'site-packages' in path or 'dist-packages' in path:
+            modules.add(module.__name__)
+
+    return modules
+
+
+def referenced_modules(package):
+    """Return the names of the modules referenced by `package` (and by its
+    sub-modules), also the ones imported before the package itself.
+    """
+    names = set()
+
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == package or
+                                  name.startswith(package + '.')):
+            continue
+
+        for value in list(vars(module).values()):
+            if ismodule(value):
+                names.add(value.__name__)
+            elif isinstance(getattr(value, '__module__', None), str):
+                names.add(value.__module__)
+
+    return names
+
+
+def is_available(module):
+    """Return True if the given module is imported or can be imported."""
+    if module in sys.modules:
+        return True
+
+    try:
+        return find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class Manifest:
+    """Cached description of the modules of a package.
+
+    Every entry describe a module: the name of the loaded class, the features
+    it provides (e.g. the cue types) and the third-party packages it needs.
+    An entry is valid until the module files are modified.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = {}
+        self._changed = False
+
+        try:
+            with open(self.path, mode='r', encoding='utf-8') as file:
+                self._entries = json.load(file)
+        except (OSError, ValueError):
+            pass
+
+    def get(self, key, mtime):
+        """Return the entry for `key`, None if missing or outdated."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.get('mtime') == mtime:
+            return entry
+
+    def set(self, key, entry):
+        self._entries[key] = entry
+        self._changed = True
+
+    def save(self):
+        if self._changed:
+            try:
+                with open(self.path, mode='w', encoding='utf-8') as file:
+                    json.dump(self._entries, file, sort_keys=True, indent=4)
+                self._changed = False
+            except OSError:
+                logging.warning('Cannot save the manifest: ' + self.path)
+
+
+class DeferredLoader:
+    """Load the classes of a package, deferring the ones in the manifest.
+
+    Modules without a (valid) manifest entry are loaded immediately, and
+    their entry is created, "probing" the provided features before and after
+    the class is instantiated. The others are loaded only when one of the
+    features they provide is `require`d (e.g. a cue type, a menu or a
+    settings page).
+
+    Modules providing nothing (e.g. a server) or any of the `eager` features
+    (e.g. keyboard shortcuts) cannot be loaded on demand, and are loaded
+    immediately.
+    """
+
+    def __init__(self, pkg, pkg_path, manifest, create, probes=None,
+                 eager=(), deferred=True):
+        """
+        :param manifest: the manifest of the package
+        :type manifest: Manifest
+        :param create: callable(name, cls) creating the instance of a class,
+                       must return False if the creation fails
+        :param probes: {feature: callable} returning the provided names
+        :param eager: features that cannot be provided on demand
+        :param deferred: if False all the classes are loaded immediately
+        """
+        self.pkg = pkg
+        self.pkg_path = pkg_path
+        self.manifest = manifest
+        self.create = create
+        self.probes = probes if probes is not None else {}
+        self.eager = eager
+        self.deferred = deferred
+
+        self._classes = load_classes(pkg, pkg_path)
+        # {class-name: (module-name, entry)}
+        self._pending = OrderedDict()
+
+    def load(self):
+        """Load the not-deferrable classes, defer the others."""
+        for mod_name in self._classes.modules():
+            mtime = modification_time(self.__mod_path(mod_name))
+            entry = self.manifest.get(mod_name, mtime)
+
+            if entry is None or not self.deferred or \
+                    not self.__deferrable(entry):
+                self.__load(mod_name, mtime)
+            else:
+                missing = [module for module in entry['requires']
+                           if not is_available(module)]
+                if missing:
+                    logging.warning('Cannot load "{}", missing: {}'.format(
+                        entry['class'], ', '.join(missing)))
+                else:
+                    self._pending[entry['class']] = (mod_name, entry)
+
+        self.manifest.save()
+
+    def require(self, feature, names=None):
+        """Load the deferred classes providing any of the given names.
+
+        :param names: if None, load the classes providing anything for
+                      the given feature
+        """
+        if names is not None:
+            names = set(names)
+
+        for name, (mod_name, entry) in list(self._pending.items()):
+            provided = entry['provides'].get(feature, ())
+            if (names is None and provided) or \
+                    (names is not None and names.intersection(provided)):
+                self._pending.pop(name)
+                self.__load(mod_name)
+
+        self.manifest.save()
+
+    def require_class(self, name):
+        """Load the deferred class `name` (case insensitive), if any."""
+        for pending in list(self._pending):
+            if pending.lower() == name.lower():
+                self.__load(self._pending.pop(pending)[0])
+                self.manifest.save()
+
+    def __deferrable(self, entry):
+        provides = entry['provides']
+        # Entries created with different probes are outdated
+        if set(provides) != set(self.probes):
+            return False
+
+        return (any(provides.values()) and
+                not any(provides.get(feature) for feature in self.eager))
+
+    def __mod_path(self, mod_name):
+        path = os.path.join(self.pkg_path, mod_name)
+        return path if os.path.isdir(path) else path + '.py'
+
+    def __probe(self):
+        provided = {}
+        for feature, probe in self.probes.items():
+            try:
+                provided[feature] = set(probe())
+            except Exception:
+                logging.debug(traceback.format_exc())
+                provided[feature] = set()
+
+        return provided
+
+    def __load(self, mod_name, mtime=None):
+        # Import and creation time
+        with StartupProfile.phase('{}.{}'.format(self.pkg, mod_name)):
+            self.__load_module(mod_name, mtime)
+
+    def __load_module(self, mod_name, mtime):
+        if mtime is None:
+            mtime = modification_time(self.__mod_path(mod_name))
+
+        modules_before = set(sys.modules)
+        provided_before = self.__probe()
+
+        for name, cls in self._classes.load_module(mod_name):
+            if not self.create(name, cls):
+                continue
+
+            provided = self.__probe()
+            self.manifest.set(mod_name, {
+                'class': name,
+                'mtime': mtime,
+                'provides': {
+                    feature: sorted(provided[feature] -
+                                    provided_before[feature])
+                    for feature in provided
+                },
+                'requires': sorted(third_party_modules(
+                    set(sys.modules).difference(modules_before).union(
+                        referenced_modules(self.pkg + '.' + mod_name))))
+            })
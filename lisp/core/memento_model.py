@@ -18,8 +18,8 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from lisp.core.actions_handler import MainActionsHandler
-from lisp.core.memento_model_actions import AddItemAction, RemoveItemAction, \
-    MoveItemAction
+from lisp.core.memento_model_actions import AddItemAction, AddItemsAction, \
+    RemoveItemAction, MoveItemAction
 from lisp.core.proxy_model import ReadOnlyProxyModel
 
 
@@ -48,6 +48,10 @@ class MementoModel(ReadOnlyProxyModel):
         if not self._locked:
             self._handler.do_action(AddItemAction(self, self.model, item))
 
+    def _items_added(self, items):
+        if not self._locked:
+            self._handler.do_action(AddItemsAction(self, self.model, items))
+
     def _item_removed(self, item):
         if not self._locked:
             self._handler.do_action(RemoveItemAction(self, self.model, item))
@@ -73,6 +73,22 @@ class AddItemAction(MementoAction):
         self._model.add(self.__item)
 
 
+class AddItemsAction(MementoAction):
+
+    __slots__ = '__items'
+
+    def __init__(self, m_model, model, items):
+        super().__init__(m_model, model)
+        self.__items = tuple(items)
+
+    def __undo__(self):
+        for item in reversed(self.__items):
+            self._model.remove(item)
+
+    def __redo__(self):
+        self._model.add_many(self.__items)
+
+
 class RemoveItemAction(MementoAction):
 
     __slots__ = '__item'
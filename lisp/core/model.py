@@ -39,10 +39,14 @@ class Model(Sized, Iterable, Container):
     __iter__ must provide an iterator over the items
     __len__ must return the number of stored items
     __contains__ must return True/False if the given item is in/not in the model
+
+    Many items can be added at once using add_many, in that case a single
+    items_added signal is emitted, instead of an item_added for every item.
     """
 
     def __init__(self):
         self.item_added = Signal()
+        self.items_added = Signal()
         self.item_removed = Signal()
         self.model_reset = Signal()
 
@@ -50,6 +54,11 @@ class Model(Sized, Iterable, Container):
     def add(self, item):
         pass
 
+    def add_many(self, items):
+        """Add the given items, by default one at the time"""
+        for item in items:
+            self.add(item)
+
     @abstractmethod
     def remove(self, item):
         pass
@@ -29,6 +29,12 @@ class ModelAdapter(ProxyModel):
     def __init__(self, model):
         super().__init__(model)
         self.item_moved = Signal()
+        self.positions_shifted = Signal()
+        """Emitted (start, stop, delta) when the items in the positions from
+        `start` to `stop`-1 (to the end if `stop` is -1) are shifted by
+        `delta` without notifying the change (e.g. see CueListModel).
+        Emitted before notifying the insertion/removal/move that caused
+        the shift."""
 
     @abstractmethod
     def insert(self, item, index):
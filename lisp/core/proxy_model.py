@@ -42,12 +42,16 @@ class ProxyModel(Model):
 
         self.__model = model
         self.__model.item_added.connect(self._item_added)
+        self.__model.items_added.connect(self._items_added)
         self.__model.item_removed.connect(self._item_removed)
         self.__model.model_reset.connect(self._model_reset)
 
     def add(self, item):
         self.__model.add(item)
 
+    def add_many(self, items):
+        self.__model.add_many(items)
+
     def remove(self, item):
         self.__model.remove(item)
 
@@ -66,6 +70,11 @@ class ProxyModel(Model):
     def _item_added(self, item):
         pass
 
+    def _items_added(self, items):
+        """By default handle the items one at the time"""
+        for item in items:
+            self._item_added(item)
+
     @abstractmethod
     def _item_removed(self, item):
         pass
@@ -84,6 +93,9 @@ class ReadOnlyProxyModel(ProxyModel):
     def add(self, item):
         raise ModelException('cannot add items into a read-only model')
 
+    def add_many(self, items):
+        raise ModelException('cannot add items into a read-only model')
+
     def remove(self, item):
         raise ModelException('cannot remove items from a read-only model')
 
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import gzip
+import json
+
+# First bytes of a gzip stream
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def is_compressed(path):
+    """Return True if the session file is gzip-compressed."""
+    with open(path, mode='rb') as file:
+        return file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+def read_session(path):
+    """Read a session file, the format (plain or compressed) is detected.
+
+    :rtype: dict
+    """
+    if is_compressed(path):
+        with gzip.open(path, mode='rt', encoding='utf-8') as file:
+            return json.load(file)
+    else:
+        with open(path, mode='r', encoding='utf-8') as file:
+            return json.load(file)
+
+
+def write_session(path, session, compressed):
+    """Write a session file.
+
+    Compressed sessions are saved as gzip-compressed compact JSON, the
+    others as indented (human readable) JSON.
+
+    .. note::
+        The module doesn't depend on the application configuration, so it
+        can be used by standalone scripts (e.g. update_04_session.py).
+    """
+    if compressed:
+        # Compression level 6 is way faster than the default (9)
+        with gzip.open(path, mode='wt', encoding='utf-8',
+                       compresslevel=6) as file:
+            json.dump(session, file, sort_keys=True, separators=(',', ':'))
+    else:
+        with open(path, mode='w', encoding='utf-8') as file:
+            file.write(json.dumps(session, sort_keys=True, indent=4))
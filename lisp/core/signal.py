@@ -18,21 +18,147 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 import inspect
+import json
 import logging
+import sys
+import time
 import traceback
 import weakref
 from enum import Enum
-from threading import RLock
+from threading import Lock, RLock
 from types import MethodType, BuiltinMethodType
 
 from PyQt5.QtCore import QEvent, QObject
 from PyQt5.QtWidgets import QApplication
 
-from lisp.core.decorators import async
+from lisp.core.configuration import config
 from lisp.core.util import weak_call_proxy
+from lisp.core.worker_pool import WorkerPool, SerialQueue
 
 __all__ = ['Signal', 'Connection']
 
+# Shared pool used to execute asynchronous slots
+AsyncSlotsPool = WorkerPool(config['Signal'].getint('AsyncWorkers'),
+                            name='AsyncSlot')
+
+
+class SignalsInstrumentation:
+    """Collect signals/slots statistics, disabled by default.
+
+    For every signal (by name) are recorded the number of emissions and of
+    connected slots, for every slot the number of calls and an histogram of
+    the execution times, for Qt slots also the delay between the emission and
+    the delivery in the Qt event-loop.
+
+    .. note::
+        Unnamed signals are named after the location (module:line) where they
+        are created.
+    """
+
+    # Histogram buckets upper limits (in seconds), the last is "unbounded"
+    BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1)
+    BUCKETS_NAMES = ('<0.1ms', '<1ms', '<10ms', '<100ms', '<1s', '>=1s')
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = Lock()
+        self._signals = {}
+
+    def enable(self, enable=True):
+        self.enabled = enable
+
+    def reset(self):
+        with self._lock:
+            self._signals.clear()
+
+    def emitted(self, signal_name, slots):
+        with self._lock:
+            stats = self.__signal_stats(signal_name)
+            stats['emits'] += 1
+            stats['slots'] = slots
+
+    def slot_executed(self, slot, duration):
+        with self._lock:
+            stats = self.__slot_stats(slot)
+            stats['calls'] += 1
+            stats['total'] += duration
+            stats['max'] = max(stats['max'], duration)
+            stats['histogram'][self.__bucket(duration)] += 1
+
+    def slot_delivered(self, slot, delay):
+        with self._lock:
+            stats = self.__slot_stats(slot)
+            stats['deliveries'] += 1
+            stats['delivery_total'] += delay
+            stats['delivery_max'] = max(stats['delivery_max'], delay)
+
+    def report(self):
+        """Return a copy of the collected data.
+
+        :return: {signal_name: {'emits', 'slots', 'connections': {
+                    slot_name: {'mode', 'calls', 'total', 'max', 'histogram',
+                                'deliveries', 'delivery_total',
+                                'delivery_max'}}}}
+            times are in seconds
+        :rtype: dict
+        """
+        with self._lock:
+            report = {}
+            for name, stats in self._signals.items():
+                connections = {}
+                for slot_name, slot_stats in stats['connections'].items():
+                    slot_stats = slot_stats.copy()
+                    slot_stats['histogram'] = dict(
+                        zip(self.BUCKETS_NAMES, slot_stats['histogram']))
+                    connections[slot_name] = slot_stats
+
+                report[name] = {'emits': stats['emits'],
+                                'slots': stats['slots'],
+                                'connections': connections}
+
+            return report
+
+    def dump(self, path):
+        """Write the collected data, JSON encoded, in the given file."""
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump(self.report(), file, sort_keys=True, indent=4)
+
+    def __bucket(self, duration):
+        for index, limit in enumerate(self.BUCKETS):
+            if duration < limit:
+                return index
+
+        return len(self.BUCKETS)
+
+    def __signal_stats(self, signal_name):
+        if signal_name is None:
+            signal_name = 'Unnamed'
+
+        stats = self._signals.get(signal_name)
+        if stats is None:
+            stats = {'emits': 0, 'slots': 0, 'connections': {}}
+            self._signals[signal_name] = stats
+
+        return stats
+
+    def __slot_stats(self, slot):
+        connections = self.__signal_stats(slot.signal_name)['connections']
+        key = '{} [{}]'.format(slot.name, Connection(type(slot)).name)
+
+        stats = connections.get(key)
+        if stats is None:
+            stats = {'mode': Connection(type(slot)).name,
+                     'calls': 0, 'total': 0, 'max': 0,
+                     'histogram': [0] * (len(self.BUCKETS) + 1),
+                     'deliveries': 0, 'delivery_total': 0, 'delivery_max': 0}
+            connections[key] = stats
+
+        return stats
+
+
+Instrumentation = SignalsInstrumentation()
+Instrumentation.enable(config['Signal'].getboolean('Instrumentation'))
+
 
 def slot_id(slot_callable):
     """Return the id of the given slot_callable.
@@ -48,9 +174,48 @@ def slot_id(slot_callable):
         return id(slot_callable)
 
 
+# Cache the number of parameters of the slots underlying functions
+__parameters_cache = weakref.WeakKeyDictionary()
+
+
+def slot_parameters(slot_callable):
+    """Return the number of parameters accepted by the given slot_callable.
+
+    The result is cached for the underlying function, this way bounded methods
+    of different instances require only one inspection.
+    """
+    if isinstance(slot_callable, MethodType):
+        # Do not count the "self" parameter
+        function, bounded = slot_callable.__func__, 1
+    else:
+        function, bounded = slot_callable, 0
+
+    try:
+        return __parameters_cache[function] - bounded
+    except KeyError:
+        count = __parameters_count(function)
+        __parameters_cache[function] = count
+        return count - bounded
+    except TypeError:
+        # The callable cannot be weak-referenced (e.g. builtins)
+        return __parameters_count(slot_callable)
+
+
+def __parameters_count(function):
+    parameters = inspect.signature(function).parameters.values()
+    # With *args (e.g. a method "def m(*args)") any number is accepted
+    if any(p.kind == p.VAR_POSITIONAL for p in parameters):
+        return sys.maxsize
+
+    return len(parameters)
+
+
 class Slot:
     """Synchronous slot."""
 
+    # Name of the signal owning the slot, used by the instrumentation
+    signal_name = None
+
     def __init__(self, slot_callable, callback=None):
         if isinstance(slot_callable, MethodType):
             self._reference = weakref.WeakMethod(slot_callable, self._expired)
@@ -61,10 +226,23 @@ class Slot:
 
         self._callback = callback
         self._slot_id = slot_id(slot_callable)
-        self._no_args = len(inspect.signature(slot_callable).parameters) == 0
+        self._no_args = slot_parameters(slot_callable) == 0
+
+    @property
+    def name(self):
+        slot_callable = self._reference()
+        return getattr(slot_callable, '__qualname__', repr(slot_callable))
 
     def call(self, *args, **kwargs):
         """Call the callable object within the given parameters."""
+        if Instrumentation.enabled:
+            start = time.perf_counter()
+            self._call(*args, **kwargs)
+            Instrumentation.slot_executed(self, time.perf_counter() - start)
+        else:
+            self._call(*args, **kwargs)
+
+    def _call(self, *args, **kwargs):
         try:
             if self.is_alive():
                 if self._no_args:
@@ -82,11 +260,17 @@ class Slot:
 
 
 class AsyncSlot(Slot):
-    """Asynchronous slot, NOT queued, any call is performed in a new thread."""
+    """Asynchronous slot, the calls are performed by the AsyncSlotsPool.
+
+    Calls to the same slot are queued, and executed in the emission order.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._queue = SerialQueue(AsyncSlotsPool)
 
-    @async
     def call(self, *args, **kwargs):
-        super().call(*args, **kwargs)
+        self._queue.put(super().call, *args, **kwargs)
 
 
 class QtSlot(Slot):
@@ -108,6 +292,10 @@ class QtSlot(Slot):
         return QSlotEvent(self._reference, *args, **kwargs)
 
     def _custom_event(self, event):
+        if Instrumentation.enabled:
+            Instrumentation.slot_delivered(
+                self, time.perf_counter() - event.posted)
+
         super().call(*event.args, **event.kwargs)
 
 
@@ -119,6 +307,59 @@ class QtQueuedSlot(QtSlot):
                                           self._event(*args, **kwargs))
 
 
+class QtQueuedLatestSlot(QtSlot):
+    """Qt queued (safe) slot, coalescing the pending calls.
+
+    Only the arguments of the last call are kept, while a call is pending the
+    new ones replace its arguments, so at most one call per event-loop
+    iteration is performed.
+    Useful for high-rate signals where only the last value matters
+    (e.g. time notifications).
+    """
+
+    __coalesced = 0
+    __coalesced_lock = Lock()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._lock = Lock()
+        self._posted = False
+        self._args = ()
+        self._kwargs = {}
+
+    def call(self, *args, **kwargs):
+        with self._lock:
+            self._args = args
+            self._kwargs = kwargs
+
+            if self._posted:
+                with QtQueuedLatestSlot.__coalesced_lock:
+                    QtQueuedLatestSlot.__coalesced += 1
+                return
+
+            self._posted = True
+
+        QApplication.instance().postEvent(self._invoker, self._event())
+
+    def _custom_event(self, event):
+        if Instrumentation.enabled:
+            Instrumentation.slot_delivered(
+                self, time.perf_counter() - event.posted)
+
+        with self._lock:
+            args, kwargs = self._args, self._kwargs
+            self._args, self._kwargs = (), {}
+            self._posted = False
+
+        Slot.call(self, *args, **kwargs)
+
+    @staticmethod
+    def coalesced():
+        """Return the number of coalesced (not delivered) calls."""
+        return QtQueuedLatestSlot.__coalesced
+
+
 class QSlotEvent(QEvent):
     EVENT_TYPE = QEvent.Type(QEvent.registerEventType())
 
@@ -127,6 +368,7 @@ class QSlotEvent(QEvent):
         self.reference = reference
         self.args = args
         self.kwargs = kwargs
+        self.posted = time.perf_counter()
 
 
 class Connection(Enum):
@@ -135,6 +377,7 @@ class Connection(Enum):
     Async = AsyncSlot
     QtDirect = QtSlot
     QtQueued = QtQueuedSlot
+    QtQueuedLatest = QtQueuedLatestSlot
 
     def new_slot(self, slot_callable, callback=None):
         return self.value(slot_callable, callback)
@@ -153,6 +396,10 @@ class Signal:
         * Internally, weak-references are used, so disconnection is not needed
           before delete a slot-owner object.
         * Signals with "arguments" can be connected to slot without arguments
+        * The slots are stored in an immutable tuple, replaced on every
+          connect/disconnect (copy-on-write), `emit` iterates over the tuple
+          without locking, so slow slots do not block other threads.
+          A slot disconnected during an emission can still receive it.
 
     .. warning::
         Because of weakrefs, connecting like the following can't work:
@@ -162,10 +409,34 @@ class Signal:
         signal.connect(something_not_referenced)
     """
 
-    def __init__(self):
+    def __init__(self, name=None):
+        """
+        :param name: the signal name, used by the instrumentation
+        :type name: str
+        """
+        if name is None:
+            # Only keep the creation site, the name is built when needed
+            caller = sys._getframe(1)
+            self.__origin = (caller.f_globals.get('__name__'),
+                             caller.f_lineno)
+
+        self.__name = name
         self.__slots = {}
+        self.__snapshot = ()
         self.__lock = RLock()
 
+    @property
+    def name(self):
+        """The signal name, by default the creation site (module:line)."""
+        if self.__name is None:
+            self.__name = '{}:{}'.format(*self.__origin)
+
+        return self.__name
+
+    @name.setter
+    def name(self, name):
+        self.__name = name
+
     def connect(self, slot_callable, mode=Connection.Direct):
         """Connect the given slot, if not already connected.
 
@@ -181,8 +452,11 @@ class Signal:
             # Create a new Slot object, use a weakref for the callback
             # to avoid cyclic references.
             callback = weak_call_proxy(weakref.WeakMethod(self.__remove_slot))
-            self.__slots[slot_id(slot_callable)] = mode.new_slot(slot_callable,
-                                                                 callback)
+            slot = mode.new_slot(slot_callable, callback)
+            slot.signal_name = self.name
+
+            self.__slots[slot_id(slot_callable)] = slot
+            self.__publish()
 
     def disconnect(self, slot=None):
         """Disconnect the given slot, or all if no slot is specified.
@@ -194,16 +468,26 @@ class Signal:
         else:
             with self.__lock:
                 self.__slots.clear()
+                self.__publish()
 
     def emit(self, *args, **kwargs):
         """Emit the signal within the given arguments"""
-        with self.__lock:
-            for slot in self.__slots.values():
-                try:
-                    slot.call(*args, **kwargs)
-                except Exception:
-                    traceback.print_exc()
+        snapshot = self.__snapshot
+
+        if Instrumentation.enabled:
+            Instrumentation.emitted(self.name, len(snapshot))
+
+        for slot in snapshot:
+            try:
+                slot.call(*args, **kwargs)
+            except Exception:
+                traceback.print_exc()
+
+    def __publish(self):
+        # Must be called holding the lock, the assignment is atomic
+        self.__snapshot = tuple(self.__slots.values())
 
     def __remove_slot(self, id_):
         with self.__lock:
-            self.__slots.pop(id_, None)
+            if self.__slots.pop(id_, None) is not None:
+                self.__publish()
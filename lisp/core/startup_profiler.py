@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# Process (interpreter) start, as close as possible
+_START_WALL = time.perf_counter()
+_START_CPU = time.process_time()
+
+
+class StartupProfiler:
+    """Record the wall and CPU time of the application startup phases.
+
+    Phases can be nested, the report is printed as a tree (the slowest
+    phases first), the trace can be loaded in a trace viewer
+    (e.g. chrome://tracing). After the report is created nothing is
+    recorded anymore.
+
+    .. Usage::
+
+        with StartupProfile.phase('Load something'):
+            load_something()
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # The phases lists, the first one is the top-level one, the others
+        # are the children of the phases in progress
+        self._stack = [[]]
+
+    def enable(self, enable=True):
+        self.enabled = enable
+
+    @contextmanager
+    def phase(self, name):
+        """Record the time spent in the context as the phase `name`."""
+        if not self.enabled:
+            yield
+            return
+
+        children = []
+        self._stack.append(children)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            self._record(name, wall, time.perf_counter(), cpu,
+                         time.process_time(), children)
+
+    def since_start(self, name):
+        """Record the time since the process start as the phase `name`."""
+        if self.enabled:
+            self._record(name, _START_WALL, time.perf_counter(), _START_CPU,
+                         time.process_time())
+
+    def report(self):
+        """Return a textual report, and stop recording.
+
+        The phases are printed as a tree, the slowest ones first.
+        """
+        self.enabled = False
+
+        lines = ['{:>10} {:>10}  {}'.format('Wall (ms)', 'CPU (ms)', 'Phase')]
+        self.__report(self._stack[0], lines, 0)
+
+        return '\n'.join(lines)
+
+    def dump_trace(self, path):
+        """Write the phases in the "trace event" (JSON) format."""
+        events = []
+        for phase in self.__phases(self._stack[0]):
+            events.append({
+                'name': phase['name'],
+                'ph': 'X',
+                'ts': (phase['start'] - _START_WALL) * 1000000,
+                'dur': phase['wall'] * 1000000,
+                'pid': os.getpid(),
+                'tid': 0,
+                'args': {'cpu_ms': phase['cpu'] * 1000}
+            })
+
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump({'traceEvents': events}, file, indent=4)
+
+    def _record(self, name, wall_start, wall_end, cpu_start, cpu_end,
+                children=()):
+        if self.enabled:
+            self._stack[-1].append({
+                'name': name,
+                'start': wall_start,
+                'wall': wall_end - wall_start,
+                'cpu': cpu_end - cpu_start,
+                'children': list(children)
+            })
+
+    def __report(self, phases, lines, depth):
+        for phase in sorted(phases, key=lambda p: p['wall'], reverse=True):
+            lines.append('{:>10.1f} {:>10.1f}  {}{}'.format(
+                phase['wall'] * 1000, phase['cpu'] * 1000, '  ' * depth,
+                phase['name']))
+            self.__report(phase['children'], lines, depth + 1)
+
+    def __phases(self, phases):
+        for phase in phases:
+            yield phase
+            yield from self.__phases(phase['children'])
+
+
+StartupProfile = StartupProfiler()
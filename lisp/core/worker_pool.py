@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import time
+import traceback
+from collections import deque
+from queue import Queue, Empty
+from threading import Lock, Thread, current_thread, get_ident, local
+
+
+class WorkerPool:
+    """Bounded pool of long-lived (daemon) worker threads.
+
+    Tasks are executed in submission order by the first available worker.
+    The pool keep track of the number of pending tasks and of the time spent
+    by the tasks waiting in the queue.
+
+    An "elastic" pool, when all the workers are busy, start temporary workers
+    that terminate after being idle for `idle_timeout` seconds, this is useful
+    when tasks can block for a long time (e.g. waits) and must not delay
+    the others. Alternatively a task can `detach` its worker from the pool
+    before a long blocking operation.
+
+    .. Usage::
+
+        pool = WorkerPool(4, name='MyPool')
+        pool.submit(some_function, arg1, key=arg2)
+    """
+
+    def __init__(self, workers=4, name='WorkerPool', elastic=False,
+                 idle_timeout=30):
+        """
+        :param workers: maximum (or minimum if elastic) number of threads
+        :param name: name used for the threads
+        :param elastic: if True temporary workers are started when needed
+        :param idle_timeout: idle time (seconds) before temporary workers exit
+        """
+        self.name = name
+        self.elastic = elastic
+        self.idle_timeout = idle_timeout
+
+        self._queue = Queue()
+        self._workers = []
+        self._size = 0
+        self._idle = 0
+        self._temporary = 0
+        self._detached = 0
+        self._lock = Lock()
+        self._local = local()
+
+        # Statistics
+        self._pending = 0
+        self._max_pending = 0
+        self._executed = 0
+        self._wait_total = 0
+        self._wait_max = 0
+
+        self.resize(workers)
+
+    @property
+    def size(self):
+        """The number of workers."""
+        return self._size
+
+    def resize(self, workers):
+        """Change the number of workers.
+
+        When reducing the workers, the exceeding threads terminate after
+        completing their current task.
+        """
+        workers = max(1, int(workers))
+
+        with self._lock:
+            # Remove the already terminated workers
+            self._workers = [w for w in self._workers if w.is_alive()]
+
+            while len(self._workers) < workers:
+                worker = Thread(target=self.__worker, daemon=True,
+                                name='{}-{}'.format(self.name,
+                                                    len(self._workers)))
+                self._workers.append(worker)
+                worker.start()
+
+            # Ask the exceeding workers to stop (None is the "stop" task)
+            for __ in range(len(self._workers) - workers):
+                self._queue.put(None)
+                self._workers.pop()
+
+            self._size = workers
+
+    def submit(self, target, *args, **kwargs):
+        """Schedule the execution of `target(*args, **kwargs)`."""
+        self._task_queued()
+        self._queue.put((time.monotonic(), target, args, kwargs))
+
+        if self.elastic:
+            with self._lock:
+                if self._idle < self._pending:
+                    self._temporary += 1
+                    Thread(target=self.__worker, args=(self.idle_timeout,),
+                           daemon=True, name=self.name + '-temp').start()
+
+    def detach(self):
+        """Remove the calling worker from the pool, replacing it.
+
+        To be called by a task before a long blocking operation (e.g. a wait),
+        so that the other tasks are not delayed; the detached thread
+        terminates after completing the task.
+
+        :return: False if not called by a (not detached) worker of the pool
+        """
+        if getattr(self._local, 'detached', True):
+            return False
+
+        self._local.detached = True
+        timeout = self._local.timeout
+        worker = Thread(target=self.__worker, args=(timeout,), daemon=True,
+                        name=current_thread().name)
+
+        with self._lock:
+            self._detached += 1
+            if timeout is None:
+                # Replace the permanent worker, if not already removed
+                for index, thread in enumerate(self._workers):
+                    if thread is current_thread():
+                        self._workers[index] = worker
+            else:
+                self._temporary += 1
+
+        worker.start()
+        return True
+
+    def stats(self):
+        """Return the pool statistics.
+
+        :return: {'workers', 'temporary', 'detached', 'pending',
+                  'max_pending', 'executed', 'wait_avg', 'wait_max'}
+                  (times in seconds)
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'workers': self._size,
+                'temporary': self._temporary,
+                'detached': self._detached,
+                'pending': self._pending,
+                'max_pending': self._max_pending,
+                'executed': self._executed,
+                'wait_avg': (self._wait_total / self._executed
+                             if self._executed else 0),
+                'wait_max': self._wait_max
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._max_pending = self._pending
+            self._executed = 0
+            self._wait_total = 0
+            self._wait_max = 0
+
+    def _task_queued(self):
+        with self._lock:
+            self._pending += 1
+            if self._pending > self._max_pending:
+                self._max_pending = self._pending
+
+    def _schedule(self, target):
+        """Schedule an internal (not accounted) task."""
+        self._queue.put((None, target, (), {}))
+
+    def _tasks_discarded(self, count):
+        with self._lock:
+            self._pending -= count
+
+    def _task_started(self, queued_at):
+        wait = time.monotonic() - queued_at
+
+        with self._lock:
+            self._pending -= 1
+            self._executed += 1
+            self._wait_total += wait
+            if wait > self._wait_max:
+                self._wait_max = wait
+
+    def __worker(self, timeout=None):
+        self._local.timeout = timeout
+        self._local.detached = False
+
+        while True:
+            with self._lock:
+                self._idle += 1
+
+            try:
+                task = self._queue.get(timeout=timeout)
+            except Empty:
+                # Temporary worker, idle for too long
+                with self._lock:
+                    self._idle -= 1
+                    self._temporary -= 1
+                return
+
+            with self._lock:
+                self._idle -= 1
+
+            if task is None:
+                return
+
+            queued_at, target, args, kwargs = task
+            # Internal tasks (queued_at is None) are not accounted
+            if queued_at is not None:
+                self._task_started(queued_at)
+
+            try:
+                target(*args, **kwargs)
+            except Exception:
+                logging.error(traceback.format_exc())
+
+            if self._local.detached:
+                # Replaced by another worker (see detach)
+                with self._lock:
+                    self._detached -= 1
+                    if timeout is not None:
+                        self._temporary -= 1
+                return
+
+
+class SerialQueue:
+    """Execute tasks one at a time, in FIFO order, using a WorkerPool.
+
+    Different queues sharing the same pool are executed concurrently, but the
+    tasks of a single queue never overlap and preserve their order.
+    Queued tasks are accounted in the pool statistics.
+    """
+
+    def __init__(self, pool):
+        """
+        :param pool: the pool used to execute the tasks
+        :type pool: WorkerPool
+        """
+        self._pool = pool
+        self._tasks = deque()
+        self._lock = Lock()
+        self._scheduled = False
+        # Identifier of the thread executing a task of the queue
+        self._runner = None
+
+    def put(self, target, *args, **kwargs):
+        """Enqueue the execution of `target(*args, **kwargs)`."""
+        self._pool._task_queued()
+
+        with self._lock:
+            self._tasks.append((time.monotonic(), target, args, kwargs))
+
+            if not self._scheduled:
+                self._scheduled = True
+                self._pool._schedule(self.__run_next)
+
+    def pending(self):
+        """Return the number of tasks waiting in the queue."""
+        return len(self._tasks)
+
+    def detach(self):
+        """Let the next tasks run while the current one is still executing.
+
+        To be called by a task of the queue before a long blocking operation
+        (e.g. a wait), the worker is detached from the pool (see
+        `WorkerPool.detach`).
+
+        :return: False if not called by the task currently executed
+        """
+        with self._lock:
+            if self._runner != get_ident():
+                return False
+
+            self._runner = None
+            self._pool.detach()
+
+            if self._tasks:
+                self._pool._schedule(self.__run_next)
+            else:
+                self._scheduled = False
+
+        return True
+
+    def clear(self):
+        """Remove the pending tasks, return how many tasks have been removed.
+        """
+        with self._lock:
+            removed = len(self._tasks)
+            self._tasks.clear()
+
+        self._pool._tasks_discarded(removed)
+        return removed
+
+    def __run_next(self):
+        with self._lock:
+            if not self._tasks:
+                self._scheduled = False
+                return
+
+            queued_at, target, args, kwargs = self._tasks.popleft()
+            self._runner = get_ident()
+
+        self._pool._task_started(queued_at)
+
+        try:
+            target(*args, **kwargs)
+        except Exception:
+            logging.error(traceback.format_exc())
+        finally:
+            with self._lock:
+                # If detached the queue is already proceeding
+                if self._runner == get_ident():
+                    self._runner = None
+
+                    if self._tasks:
+                        # Re-schedule at the end of the pool queue, this way
+                        # a busy queue cannot monopolize the workers
+                        self._pool._schedule(self.__run_next)
+                    else:
+                        self._scheduled = False
@@ -17,15 +17,96 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+import time
+from functools import wraps
 from threading import Lock
 from uuid import uuid4
 
-from lisp.core.decorators import async
+from lisp.core.configuration import config
 from lisp.core.fade_functions import FadeInType, FadeOutType
+from lisp.core.go_latency import GoLatency
 from lisp.core.has_properties import HasProperties, Property, WriteOnceProperty
 from lisp.core.rwait import RWait
 from lisp.core.signal import Signal
 from lisp.core.util import EqEnum
+from lisp.core.worker_pool import WorkerPool, SerialQueue
+
+# Shared pool used to execute the cues commands (start, stop, ...)
+CueExecutor = WorkerPool(config['Cue'].getint('ExecutorWorkers'),
+                         name='CueExecutor')
+
+
+class CueCommandsStats:
+    """Statistics of the cues commands execution.
+
+    The latency is the time between the command request and the moment it
+    acquires the cue state-lock (times are in seconds).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.executed = 0
+            self.merged = 0
+            self.latency_total = 0
+            self.latency_max = 0
+
+    def command_merged(self):
+        with self._lock:
+            self.merged += 1
+
+    def command_executed(self, latency):
+        with self._lock:
+            self.executed += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'merged': self.merged,
+                'latency_avg': (self.latency_total / self.executed
+                                if self.executed else 0),
+                'latency_max': self.latency_max
+            }
+
+
+CommandsStats = CueCommandsStats()
+
+
+def cue_command(target):
+    """Decorator. Make a Cue method an asynchronous "command".
+
+    The commands of a cue are queued, and executed in order, by the
+    CueExecutor pool, the cue state-lock (`_st_lock`) is acquired before
+    calling the decorated method, that is responsible to release it.
+    While a command is queued, the identical ones (same method and arguments)
+    are merged with it.
+
+    Before a long wait (e.g. pre-wait or fade) a command must call
+    `_commands_queue.detach()`, so that the following commands (e.g. stop)
+    can be executed meanwhile.
+    """
+
+    @wraps(target)
+    def wrapped(self, *args, **kwargs):
+        key = (target.__name__, args, tuple(sorted(kwargs.items())))
+
+        with self._commands_lock:
+            if key in self._commands:
+                CommandsStats.command_merged()
+                return
+
+            self._commands.add(key)
+
+        self._commands_queue.put(self._execute_command, key,
+                                 time.monotonic(), target, *args, **kwargs)
+
+    return wrapped
 
 
 class CueState:
@@ -126,6 +207,9 @@ class Cue(HasProperties):
         self._type_ = self.__class__.__name__
 
         self._st_lock = Lock()
+        self._commands_lock = Lock()
+        self._commands = set()
+        self._commands_queue = SerialQueue(CueExecutor)
         self._state = CueState.Stop
         self._prewait = RWait()
         self._postwait = RWait()
@@ -176,6 +260,8 @@ class Cue(HasProperties):
             else:
                 action = CueAction(self.default_start_action)
 
+        GoLatency.mark(self, 'execute', action.value)
+
         if action is CueAction.Interrupt:
             self.interrupt()
         elif action is CueAction.FadeOutInterrupt:
@@ -194,13 +280,20 @@ class Cue(HasProperties):
             elif action == CueAction.FadeOutPause:
                 self.pause(fade=self.fadeout_duration > 0)
 
-    @async
+    def _execute_command(self, key, requested_at, command, *args, **kwargs):
+        # The command is responsible to release the state-lock
+        self._st_lock.acquire()
+
+        with self._commands_lock:
+            self._commands.discard(key)
+
+        CommandsStats.command_executed(time.monotonic() - requested_at)
+        command(self, *args, **kwargs)
+
+    @cue_command
     def start(self, fade=False):
         """Start the cue."""
-
-        # If possible acquire the state-lock, otherwise return
-        if not self._st_lock.acquire(blocking=False):
-            return
+        GoLatency.mark(self, 'lock')
 
         try:
             # If we are already running release and return
@@ -215,6 +308,7 @@ class Cue(HasProperties):
                 self._state = CueState.PreWait
                 # Start the wait, the lock is released during the wait and
                 # re-acquired after
+                self._commands_queue.detach()
                 if not self._prewait.wait(self.pre_wait, lock=self._st_lock):
                     # PreWait interrupted, check the state to be correct
                     if self._state & CueState.PreWait:
@@ -226,6 +320,7 @@ class Cue(HasProperties):
                         CueState.Pause |
                         CueState.PreWait_Pause):
 
+                GoLatency.mark(self, 'start')
                 running = self.__start__(fade)
                 self._state = CueState.Running
                 self.started.emit(self)
@@ -240,6 +335,7 @@ class Cue(HasProperties):
                 if self.next_action == CueNextAction.AutoNext:
                     self._state |= CueState.PostWait
 
+                    self._commands_queue.detach()
                     if self._postwait.wait(self.post_wait, lock=self._st_lock):
                         # PostWait ended
                         self._state ^= CueState.PostWait
@@ -279,14 +375,10 @@ class Cue(HasProperties):
         """
         return False
 
-    @async
+    @cue_command
     def stop(self, fade=False):
         """Stop the cue."""
 
-        # If possible acquire the state-lock, otherwise return
-        if not self._st_lock.acquire(blocking=False):
-            return
-
         # Stop PreWait (if in PreWait(_Pause) nothing else is "running")
         if self._state & (CueState.PreWait | CueState.PreWait_Pause):
             self._state = CueState.Stop
@@ -324,7 +416,7 @@ class Cue(HasProperties):
 
         Long running task should block this function (i.e. the fade should
         "block" this function), when this happen `_st_lock` must be released and
-        than re-acquired.
+        than re-acquired, and `_commands_queue.detach()` called before.
 
         If called during a `fadeout` operation this should be interrupted,
         the cue stopped and return `True`.
@@ -336,14 +428,10 @@ class Cue(HasProperties):
         """
         return True
 
-    @async
+    @cue_command
     def pause(self, fade=False):
         """Pause the cue."""
 
-        # If possible acquire the state-lock, otherwise return
-        if not self._st_lock.acquire(blocking=False):
-            return
-
         # Pause PreWait (if in PreWait nothing else is "running")
         if self._state & CueState.PreWait:
             self._state ^= CueState.PreWait
@@ -374,7 +462,7 @@ class Cue(HasProperties):
 
         Long running task should block this function (i.e. the fade should
         "block" this function), when this happen `_st_lock` must be released and
-        than re-acquired.
+        than re-acquired, and `_commands_queue.detach()` called before.
 
         If called during a `fadeout` operation this should be interrupted,
         the cue paused and return `True`.
@@ -389,14 +477,14 @@ class Cue(HasProperties):
         """
         return True
 
-    @async
+    @cue_command
     def interrupt(self, fade=False):
         """Interrupt the cue.
 
         :param fade: True if a fade should be performed (when supported)
         :type fade: bool
         """
-        with self._st_lock:
+        try:
             # Stop PreWait (if in PreWait(_Pause) nothing else is "running")
             if self._state & (CueState.PreWait | CueState.PreWait_Pause):
                 self._state = CueState.Stop
@@ -422,6 +510,8 @@ class Cue(HasProperties):
                     )
                     self._state |= CueState.Stop
                     self.interrupted.emit()
+        finally:
+            self._st_lock.release()
 
     def __interrupt__(self, fade=False):
         """Implement the cue `interrupt` behavior.
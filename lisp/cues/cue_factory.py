@@ -18,15 +18,21 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 from copy import deepcopy
+from threading import RLock
 
 
 class CueFactory:
     """Provide a generic factory to build different cues types.
 
     Cues can be register via `register_factory` function.
+
+    The registry can be safely accessed by different threads, e.g. cues are
+    created by workers while (deferred) modules register their factories.
     """
 
     __REGISTRY = {}
+    __LOCK = RLock()
+    __REQUIRE = None
 
     # Register methods
 
@@ -38,7 +44,17 @@ class CueFactory:
         :type cue_type: str
         :param factory: The cue class or a factory function
         """
-        cls.__REGISTRY[cue_type] = factory
+        with cls.__LOCK:
+            cls.__REGISTRY[cue_type] = factory
+
+    @classmethod
+    def set_require_hook(cls, hook):
+        """Set the function called when a cue-type is not registered.
+
+        :param hook: callable([cue_type]) that can register the missing
+                     cue-type (e.g. loading a deferred module)
+        """
+        cls.__REQUIRE = hook
 
     @classmethod
     def has_factory(cls, cue_type):
@@ -48,7 +64,17 @@ class CueFactory:
         :rtype cue_type: str
         :rtype: bool
         """
-        return cue_type in cls.__REGISTRY
+        with cls.__LOCK:
+            return cue_type in cls.__REGISTRY
+
+    @classmethod
+    def cue_types(cls):
+        """Return the registered cue types
+
+        :rtype: list[str]
+        """
+        with cls.__LOCK:
+            return list(cls.__REGISTRY.keys())
 
     @classmethod
     def remove_factory(cls, cue_type):
@@ -56,7 +82,8 @@ class CueFactory:
 
         :param cue_type: the cue class name (the same used for registration)
         """
-        cls.__REGISTRY.pop(cue_type)
+        with cls.__LOCK:
+            cls.__REGISTRY.pop(cue_type)
 
     # Create methods
 
@@ -71,7 +98,13 @@ class CueFactory:
         :param cue_type: The cue type
         :rtype: lisp.cues.cue.Cue
         """
-        factory = cls.__REGISTRY.get(cue_type)
+        with cls.__LOCK:
+            factory = cls.__REGISTRY.get(cue_type)
+
+        if factory is None and cls.__REQUIRE is not None:
+            cls.__REQUIRE([cue_type])
+            with cls.__LOCK:
+                factory = cls.__REGISTRY.get(cue_type)
 
         if not callable(factory):
             raise Exception(
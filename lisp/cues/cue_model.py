@@ -25,24 +25,52 @@ class CueModel(Model):
 
     The model can be iterated to retrieve the cues, to get id-cue pairs
     use the items() function, to get only the id(s) use the keys() function.
+
+    Cues are also indexed by type, to speed-up :func:`filter`.
     """
 
     def __init__(self):
         super().__init__()
         self.__cues = {}
 
+        # {concrete-class: {cue.id: cue}}
+        self.__types = {}
+        # {cue_class: [concrete-classes]}, cache for "filter"
+        self.__subtypes = {}
+
     def add(self, cue):
         if cue.id in self.__cues:
             raise ValueError('the cue is already in the layout')
 
         self.__cues[cue.id] = cue
+        self.__index(cue)
+
         self.item_added.emit(cue)
 
+    def add_many(self, cues):
+        """Add the given cues, emitting a single `items_added` signal"""
+        cues = list(cues)
+
+        ids = set()
+        for cue in cues:
+            if cue.id in self.__cues or cue.id in ids:
+                raise ValueError('the cue is already in the layout')
+            ids.add(cue.id)
+
+        for cue in cues:
+            self.__cues[cue.id] = cue
+            self.__index(cue)
+
+        if cues:
+            self.items_added.emit(cues)
+
     def remove(self, cue):
         self.pop(cue.id)
 
     def pop(self, cue_id):
         cue = self.__cues.pop(cue_id)
+        self.__unindex(cue)
+
         self.item_removed.emit(cue)
 
         return cue
@@ -60,13 +88,21 @@ class CueModel(Model):
 
     def reset(self):
         self.__cues.clear()
+        self.__types.clear()
+        self.__subtypes.clear()
+
         self.model_reset.emit()
 
     def filter(self, cue_class=Cue):
         """Return an iterator over cues that are instances of the given class"""
-        for cue in self.__cues.values():
-            if isinstance(cue, cue_class):
-                yield cue
+        subtypes = self.__subtypes.get(cue_class)
+        if subtypes is None:
+            subtypes = [type_ for type_ in self.__types
+                        if issubclass(type_, cue_class)]
+            self.__subtypes[cue_class] = subtypes
+
+        for type_ in subtypes:
+            yield from self.__types[type_].values()
 
     def __iter__(self):
         return self.__cues.values().__iter__()
@@ -76,3 +112,15 @@ class CueModel(Model):
 
     def __contains__(self, cue):
         return cue.id in self.__cues
+
+    def __index(self, cue):
+        type_ = type(cue)
+        if type_ not in self.__types:
+            self.__types[type_] = {}
+            # A new type, the subtypes must be re-computed
+            self.__subtypes.clear()
+
+        self.__types[type_][cue.id] = cue
+
+    def __unindex(self, cue):
+        self.__types[type(cue)].pop(cue.id, None)
@@ -22,11 +22,12 @@ from threading import Lock
 from PyQt5.QtCore import QT_TRANSLATE_NOOP
 
 from lisp.core.configuration import config
-from lisp.core.decorators import async
+from lisp.core.decorators import async_in_pool
 from lisp.core.fade_functions import FadeInType, FadeOutType
 from lisp.core.fader import Fader
+from lisp.core.go_latency import GoLatency
 from lisp.core.has_properties import NestedProperties
-from lisp.cues.cue import Cue, CueAction, CueState
+from lisp.cues.cue import Cue, CueAction, CueState, CueExecutor
 
 
 class MediaCue(Cue):
@@ -45,23 +46,66 @@ class MediaCue(Cue):
         self.default_stop_action = CueAction.FadeOutStop.value
 
         self.media = media
+        GoLatency.alias(self.media, self)
         self.media.changed('duration').connect(self._duration_change)
         self.media.elements_changed.connect(self.__elements_changed)
         self.media.error.connect(self._on_error)
         self.media.eos.connect(self._on_eos)
+        # When armed, the media is re-armed every time it goes back to stop
+        self.media.stopped.connect(self.__update_arming)
+        self.media.interrupted.connect(self.__update_arming)
+        self.media.eos.connect(self.__update_arming)
+        self.media.elements_changed.connect(self.__update_arming)
+        self.media.changed('start_time').connect(self.__rearm)
+        self.media.changed('stop_time').connect(self.__rearm)
 
         self.__in_fadein = False
         self.__in_fadeout = False
+        self.__armed = False
 
-        self.__volume = self.media.element('Volume')
-        self.__fader = Fader(self.__volume, 'current_volume')
+        self.__volume = None
+        self.__fader = Fader(None, 'current_volume')
         self.__fade_lock = Lock()
 
+        # A "lazy" media create the elements only when needed
+        if self.media.elements():
+            self.__elements_changed()
+
     def __elements_changed(self):
         self.__volume = self.media.element('Volume')
         self.__fader.target = self.__volume
 
+    def arm(self):
+        """Keep the media ready to start (see `Media.arm`) while stopped."""
+        self.__armed = True
+        self.__update_arming()
+
+    def disarm(self):
+        """Stop keeping the media ready to start."""
+        self.__armed = False
+        self.__update_arming()
+
+    @async_in_pool(CueExecutor)
+    def __update_arming(self, *args):
+        with self._st_lock:
+            if not self.__armed:
+                self.media.disarm()
+            elif self._state & CueState.IsStopped:
+                self.media.arm()
+
+    @async_in_pool(CueExecutor)
+    def __rearm(self, *args):
+        # Move an armed media to the new start position
+        with self._st_lock:
+            if self.__armed and self._state & CueState.IsStopped:
+                self.media.disarm()
+                self.media.arm()
+
     def __start__(self, fade=False):
+        if fade:
+            # Build the elements of a "lazy" media, to fade its volume
+            self.media.element('Volume')
+
         if fade and self._can_fade(self.fadein_duration):
             self.__volume.current_volume = 0
 
@@ -79,6 +123,7 @@ class MediaCue(Cue):
                 self.__fader.stop()
 
             if self._state & CueState.Running and fade:
+                self._commands_queue.detach()
                 self._st_lock.release()
                 if not self._on_stop_fade():
                     return False
@@ -95,6 +140,7 @@ class MediaCue(Cue):
                 self.__fader.stop()
 
             if fade:
+                self._commands_queue.detach()
                 self._st_lock.release()
                 if not self._on_stop_fade():
                     return False
@@ -111,7 +157,7 @@ class MediaCue(Cue):
 
         self.media.interrupt()
 
-    @async
+    @async_in_pool(CueExecutor)
     def fadein(self, duration, fade_type):
         if not self._st_lock.acquire(timeout=0.1):
             return
@@ -124,12 +170,13 @@ class MediaCue(Cue):
                     self.__volume.current_volume = self.__volume.volume
                 else:
                     self._st_lock.release()
+                    CueExecutor.detach()
                     self.__fadein(duration, self.__volume.volume, fade_type)
                     return
 
         self._st_lock.release()
 
-    @async
+    @async_in_pool(CueExecutor)
     def fadeout(self, duration, fade_type):
         if not self._st_lock.acquire(timeout=0.1):
             return
@@ -142,6 +189,7 @@ class MediaCue(Cue):
                     self.__volume.current_volume = 0
                 else:
                     self._st_lock.release()
+                    CueExecutor.detach()
                     self.__fadeout(duration, 0, fade_type)
                     return
 
@@ -196,9 +244,11 @@ class MediaCue(Cue):
     def _can_fade(self, duration):
         return self.__volume is not None and duration > 0
 
-    @async
+    @async_in_pool(CueExecutor)
     def _on_start_fade(self):
-        if self.__volume is not None:
+        if self._can_fade(self.fadein_duration):
+            # A long task, do not hold the executor worker
+            CueExecutor.detach()
             self.__fadein(self.fadein_duration,
                           self.__volume.volume,
                           FadeInType[self.fadein_type])
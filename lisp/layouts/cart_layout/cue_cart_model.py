@@ -109,12 +109,15 @@ class CueCartModel(ModelAdapter):
             yield self.__cues[index]
 
     def _item_added(self, item):
-        if item.index == -1 or item.index in self.__cues:
-            item.index = self.first_empty()
-
-        self.__cues[item.index] = item
+        self.__insert(item)
         self.item_added.emit(item)
 
+    def _items_added(self, items):
+        for item in items:
+            self.__insert(item)
+
+        self.items_added.emit(items)
+
     def _item_removed(self, item):
         self.__cues.pop(item.index)
         self.item_removed.emit(item)
@@ -123,5 +126,11 @@ class CueCartModel(ModelAdapter):
         self.__cues.clear()
         self.model_reset.emit()
 
+    def __insert(self, item):
+        if item.index == -1 or item.index in self.__cues:
+            item.index = self.first_empty()
+
+        self.__cues[item.index] = item
+
     def __iter__(self):
         return iter(self.__cues.values())
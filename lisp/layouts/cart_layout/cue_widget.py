@@ -257,7 +257,8 @@ class CueWidget(QWidget):
             self.seekSlider.sliderJumped.connect(self.cue.media.seek)
 
         self._cue_time = CueTime(self.cue)
-        self._cue_time.notify.connect(self._update_time, Connection.QtQueued)
+        self._cue_time.notify.connect(self._update_time,
+                                      Connection.QtQueuedLatest)
 
         self._update_name(cue.name)
         self._update_style(cue.stylesheet)
@@ -72,6 +72,7 @@ class CartLayout(QTabWidget, CueLayout):
 
         self._model_adapter = CueCartModel(cue_model, self.__rows, self.__columns)
         self._model_adapter.item_added.connect(self.__cue_added, Connection.QtQueued)
+        self._model_adapter.items_added.connect(self.__cues_added, Connection.QtQueued)
         self._model_adapter.item_removed.connect(self.__cue_removed, Connection.QtQueued)
         self._model_adapter.item_moved.connect(self.__cue_moved, Connection.QtQueued)
         self._model_adapter.model_reset.connect(self.__model_reset)
@@ -423,6 +424,10 @@ class CartLayout(QTabWidget, CueLayout):
         self.__pages[page].add_widget(widget, row, column)
         self.setCurrentIndex(page)
 
+    def __cues_added(self, cues):
+        for cue in cues:
+            self.__cue_added(cue)
+
     def __cue_removed(self, cue):
         if isinstance(cue, MediaCue):
             cue.media.interrupt()
@@ -158,6 +158,13 @@ class CueLayout:
             menu_edit.move(menu_edit.x() - menu_edit.width(), menu_edit.y())
 
     def show_cue_context_menu(self, position):
+        # Imported here, modules and plugins import this module
+        from lisp import modules, plugins
+
+        # Add the entries of the deferred modules/plugins
+        modules.require('cue_menus')
+        plugins.require('cue_menus')
+
         menu = QMenu(self)
 
         cue_class = self.get_context_cue().__class__
@@ -54,6 +54,11 @@ class CueListItem(QTreeWidgetItem):
         self._selected = value
         self.setIcon(0, load_icon('mark-location' if value else ''))
 
+    def update_index(self):
+        """Show the current cue index (the change may not be notified)."""
+        if self.text(self.num_column) != str(self.cue.index):
+            self._update_index(self.cue.index)
+
     def _update_index(self, index):
         self.setText(self.num_column, str(index))
 
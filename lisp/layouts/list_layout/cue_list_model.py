@@ -19,10 +19,19 @@
 
 from lisp.core.model_adapter import ModelAdapter
 from lisp.core.proxy_model import ReadOnlyProxyModel
+from lisp.cues.cue import Cue
 from lisp.cues.media_cue import MediaCue
 
 
 class CueListModel(ModelAdapter):
+    """Keep the cues in a list, the position is stored in the cue "index".
+
+    When a change shift the position of many cues, the "index" values are
+    updated without notifying the change (one notification per cue would be
+    too expensive on large lists), the views should update the visible
+    positions when notified of the item(s) added/moved/removed.
+    The shift itself is notified with `positions_shifted`.
+    """
 
     def __init__(self, model):
         super().__init__(model)
@@ -35,6 +44,20 @@ class CueListModel(ModelAdapter):
         item.index = index
         self.add(item)
 
+    def insert_many(self, items, index):
+        """Insert the items, in order, starting from the given index.
+
+        The positions of the following cues are updated only once.
+        """
+        if not 0 <= index <= len(self.__cues):
+            index = len(self.__cues)
+
+        items = list(items)
+        for offset, item in enumerate(items):
+            item.index = index + offset
+
+        self.add_many(items)
+
     def pop(self, index):
         cue = self.__cues[index]
         self.model.remove(cue)
@@ -56,34 +79,102 @@ class CueListModel(ModelAdapter):
                 max_index = old_index
 
             self._update_indices(min_index, max_index + 1)
-            self.item_moved.emit(old_index, new_index)
+            self.__moved(old_index, new_index)
+
+    def move_many(self, indices, new_index):
+        """Move the cues at the given indices before the cue at `new_index`.
+
+        The moved cues keep their relative order, one `item_moved` is emitted
+        for every move, and the positions are updated only once.
+        """
+        indices = sorted(set(indices))
+        if not indices:
+            return
+
+        if not 0 <= new_index <= len(self.__cues):
+            new_index = len(self.__cues)
+
+        # First position of the moved cues, after the move
+        target = new_index - len([i for i in indices if i < new_index])
+        min_index = min(indices[0], target)
+        max_index = max(indices[-1], target + len(indices) - 1)
+
+        # Cues coming from before the target are moved from the last, the
+        # others from the first, this way every move leaves the
+        # already-placed cues in their final position
+        before = [(offset, self.__cues[index])
+                  for offset, index in enumerate(indices) if index < new_index]
+        after = [(offset, self.__cues[index])
+                 for offset, index in enumerate(indices) if index >= new_index]
+
+        for offset, cue in before[::-1] + after:
+            old_index = self.__cues.index(cue)
+            if old_index != target + offset:
+                self.__cues.insert(target + offset, self.__cues.pop(old_index))
+                self.__moved(old_index, target + offset)
+
+        self._update_indices(min_index, max_index + 1)
 
     def _model_reset(self):
         self.__cues.clear()
         self.model_reset.emit()
 
     def _item_added(self, item):
-        if not isinstance(item.index, int) or not 0 <= item.index <= len(self.__cues):
-            item.index = len(self.__cues)
-
-        self.__cues.insert(item.index, item)
-        self._update_indices(item.index)
+        self.__insert(item)
+        self._update_indices(item.index + 1)
+        self.positions_shifted.emit(item.index, -1, 1)
 
         self.item_added.emit(item)
 
+    def _items_added(self, items):
+        # Insert by position, so that every cue is placed in its final
+        # position, the following cues are updated only once
+        items = sorted(items, key=self.__sort_key)
+        start = len(self.__cues)
+        for item in items:
+            self.__insert(item)
+            start = min(start, item.index)
+            self.positions_shifted.emit(item.index, -1, 1)
+
+        self._update_indices(start)
+        self.items_added.emit(items)
+
     def _item_removed(self, item):
         self.__cues.pop(item.index)
         self._update_indices(item.index)
+        self.positions_shifted.emit(item.index + 1, -1, -1)
 
         self.item_removed.emit(item)
 
     def _update_indices(self, start, stop=-1):
-        """Update the indices of cues from start to stop-1"""
+        """Update, silently, the indices of cues from start to stop-1"""
         if not 0 <= stop <= len(self.__cues):
             stop = len(self.__cues)
 
+        set_index = Cue.index.set_silently
         for index in range(start, stop):
-            self.__cues[index].index = index
+            set_index(self.__cues[index], index)
+
+    def __moved(self, old_index, new_index):
+        if old_index < new_index:
+            self.positions_shifted.emit(old_index + 1, new_index + 1, -1)
+        else:
+            self.positions_shifted.emit(new_index, old_index, 1)
+
+        self.item_moved.emit(old_index, new_index)
+
+    def __insert(self, item):
+        if not isinstance(item.index, int) or not 0 <= item.index <= len(self.__cues):
+            item.index = len(self.__cues)
+
+        self.__cues.insert(item.index, item)
+
+    @staticmethod
+    def __sort_key(item):
+        # Invalid positions last (appended), in the given order
+        if isinstance(item.index, int) and item.index >= 0:
+            return 0, item.index
+        return 1, 0
 
     def __iter__(self):
         return self.__cues.__iter__()
@@ -19,7 +19,7 @@
 
 from PyQt5 import QtCore
 from PyQt5.QtCore import pyqtSignal, Qt, QDataStream, QIODevice, \
-    QT_TRANSLATE_NOOP
+    QT_TRANSLATE_NOOP, QPoint
 from PyQt5.QtGui import QKeyEvent, QContextMenuEvent, QMouseEvent
 from PyQt5.QtWidgets import QTreeWidget, QHeaderView, qApp
 
@@ -58,6 +58,7 @@ class CueListView(QTreeWidget):
         super().__init__(parent)
         self._model = cue_model
         self._model.item_added.connect(self.__cue_added, Connection.QtQueued)
+        self._model.items_added.connect(self.__cues_added, Connection.QtQueued)
         self._model.item_moved.connect(self.__cue_moved, Connection.QtQueued)
         self._model.item_removed.connect(self.__cue_removed, Connection.QtQueued)
         self._model.model_reset.connect(self.__model_reset)
@@ -84,6 +85,8 @@ class CueListView(QTreeWidget):
 
         self.__guard = False
         self.verticalScrollBar().rangeChanged.connect(self.__update_range)
+        self.verticalScrollBar().valueChanged.connect(
+            self.__update_visible_indices)
 
     def dropEvent(self, event):
         # Decode mimedata information about the drag&drop event, since only
@@ -105,6 +108,10 @@ class CueListView(QTreeWidget):
         else:
             self._model.move(start_index, new_index)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.__update_visible_indices()
+
     def contextMenuEvent(self, event):
         if self.itemAt(event.pos()) is not None:
             self.context_event.emit(event)
@@ -144,11 +151,28 @@ class CueListView(QTreeWidget):
 
         self.insertTopLevelItem(cue.index, item)
         self.__init_item(item, cue)
+        self.updateGeometries()
 
         # Select the added item and scroll to it
         self.setCurrentItem(item)
         # Ensure that the focus is set
         self.setFocus()
+        self.__update_visible_indices()
+
+    def __cues_added(self, cues):
+        # The cues are sorted by position
+        for cue in cues:
+            item = CueListItem(cue)
+            item.setFlags(item.flags() & ~Qt.ItemIsDropEnabled)
+
+            self.insertTopLevelItem(cue.index, item)
+            self.__init_item(item, cue)
+
+        self.updateGeometries()
+
+        # Batches are not user insertions (e.g. a session is loading), the
+        # selection (the GO cursor) and the focus are left untouched
+        self.__update_visible_indices()
 
     def __cue_moved(self, start, end):
         item = self.takeTopLevelItem(start)
@@ -156,6 +180,8 @@ class CueListView(QTreeWidget):
         self.insertTopLevelItem(end, item)
         self.setCurrentItem(item)
         self.__init_item(item, self._model.item(end))
+        self.updateGeometries()
+        self.__update_visible_indices()
 
     def __cue_removed(self, cue):
         self.takeTopLevelItem(cue.index)
@@ -164,6 +190,7 @@ class CueListView(QTreeWidget):
         if index > 0:
             index -= 1
         self.setCurrentIndex(self.model().index(index, 0))
+        self.__update_visible_indices()
 
     def __model_reset(self):
         self.reset()
@@ -175,7 +202,21 @@ class CueListView(QTreeWidget):
             if widget is not None:
                 self.setItemWidget(item, index, widget(cue))
 
-        self.updateGeometries()
+    def __update_visible_indices(self, *args):
+        """Update the position shown by the visible items.
+
+        The model doesn't notify the cues position changes, so only the
+        visible items are updated, when needed.
+        """
+        count = self.topLevelItemCount()
+        if count:
+            first = self.indexAt(QPoint(0, 0)).row()
+            last = self.indexAt(
+                QPoint(0, self.viewport().height() - 1)).row()
+
+            for row in range(max(first, 0), last + 1 if last >= 0 else count):
+                item = self.topLevelItem(row)
+                item.update_index()
 
     def __update_range(self, min_, max_):
         if not self.__guard:
@@ -26,6 +26,7 @@ from PyQt5.QtWidgets import QWidget, QAction, qApp, QGridLayout, \
 
 from lisp.core.configuration import config
 from lisp.core.fade_functions import FadeInType, FadeOutType
+from lisp.core.go_latency import GoLatency
 from lisp.core.signal import Connection
 from lisp.cues.cue import Cue, CueAction
 from lisp.cues.media_cue import MediaCue
@@ -74,7 +75,10 @@ class ListLayout(QWidget, CueLayout):
 
         self._model_adapter = CueListModel(self._cue_model)
         self._model_adapter.item_added.connect(self.__cue_added)
+        self._model_adapter.items_added.connect(self.__cues_added)
         self._model_adapter.item_removed.connect(self.__cue_removed)
+        self._model_adapter.item_moved.connect(self.__update_armed)
+        self._model_adapter.model_reset.connect(self.__update_armed)
 
         self._playing_model = PlayingMediaCueModel(self._cue_model)
         self._context_item = None
@@ -88,6 +92,7 @@ class ListLayout(QWidget, CueLayout):
         self._go_key = config['ListLayout']['GoKey']
         self._go_key_sequence = QKeySequence(self._go_key,
                                              QKeySequence.NativeText)
+        self._armed_cues = set()
 
         try:
             self._end_list = EndListBehavior(config['ListLayout']['EndList'])
@@ -228,6 +233,7 @@ class ListLayout(QWidget, CueLayout):
     def go(self, action=CueAction.Default, advance=1):
         current_cue = self.current_cue()
         if current_cue is not None:
+            GoLatency.mark(current_cue, 'go')
             current_cue.execute(action)
             self.cue_executed.emit(current_cue)
 
@@ -357,6 +363,11 @@ class ListLayout(QWidget, CueLayout):
     def finalize(self):
         MainWindow().menuLayout.clear()
 
+        # Release the armed media
+        for cue in self._armed_cues:
+            cue.disarm()
+        self._armed_cues.clear()
+
         # Disconnect menu-actions signals
         self.edit_action.triggered.disconnect()
         self.remove_action.triggered.disconnect()
@@ -400,10 +411,46 @@ class ListLayout(QWidget, CueLayout):
         except IndexError:
             self.infoPanel.cue_changed(None)
 
+        self.__update_armed()
+
+    def __update_armed(self, *args):
+        """Arm the media-cues from the current one, disarm the others."""
+        window = set()
+
+        index = self.current_index()
+        if index >= 0:
+            # Read every time, the option can be changed at runtime
+            armed = config['ListLayout'].getint('ArmedCues')
+            stop = min(index + armed, len(self._model_adapter))
+            for cue_index in range(index, stop):
+                cue = self._model_adapter.item(cue_index)
+                if isinstance(cue, MediaCue):
+                    window.add(cue)
+
+        for cue in self._armed_cues - window:
+            cue.disarm()
+        for cue in window - self._armed_cues:
+            cue.arm()
+
+        self._armed_cues = window
+
     def __cue_added(self, cue):
         cue.next.connect(self.__cue_next, Connection.QtQueued)
+        self.__update_armed()
+
+    def __cues_added(self, cues):
+        for cue in cues:
+            cue.next.connect(self.__cue_next, Connection.QtQueued)
+
+        self.__update_armed()
 
     def __cue_removed(self, cue):
+        if cue in self._armed_cues:
+            self._armed_cues.discard(cue)
+            cue.disarm()
+
+        self.__update_armed()
+
         if isinstance(cue, MediaCue):
             cue.media.interrupt()
         else:
@@ -21,7 +21,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import QDoubleSpinBox
 from PyQt5.QtWidgets import QGroupBox, QVBoxLayout, QCheckBox, QComboBox, \
-    QHBoxLayout, QLabel, QKeySequenceEdit, QGridLayout
+    QHBoxLayout, QLabel, QKeySequenceEdit, QGridLayout, QSpinBox
 
 from lisp.ui.settings.settings_page import SettingsPage
 from lisp.ui.ui_utils import translate
@@ -76,6 +76,16 @@ class ListLayoutSettings(SettingsPage):
         self.goKeyLayout.setStretch(0, 2)
         self.goKeyLayout.setStretch(1, 5)
 
+        self.armedCuesLayout = QHBoxLayout()
+        self.behaviorsGroup.layout().addLayout(self.armedCuesLayout)
+        self.armedCuesLabel = QLabel(self.behaviorsGroup)
+        self.armedCuesLayout.addWidget(self.armedCuesLabel)
+        self.armedCuesSpin = QSpinBox(self.behaviorsGroup)
+        self.armedCuesSpin.setRange(0, 16)
+        self.armedCuesLayout.addWidget(self.armedCuesSpin)
+        self.armedCuesLayout.setStretch(0, 2)
+        self.armedCuesLayout.setStretch(1, 5)
+
         self.useFadeGroup = QGroupBox(self)
         self.useFadeGroup.setLayout(QGridLayout())
         self.layout().addWidget(self.useFadeGroup)
@@ -132,6 +142,11 @@ class ListLayoutSettings(SettingsPage):
         self.autoNext.setText(translate('ListLayout', 'Auto-select next cue'))
         self.endListLabel.setText(translate('ListLayout', 'At list end:'))
         self.goKeyLabel.setText(translate('ListLayout', 'Go key:'))
+        self.armedCuesLabel.setText(
+            translate('ListLayout', 'Pre-armed cues:'))
+        self.armedCuesSpin.setToolTip(
+            translate('ListLayout', 'Media cues, from the current one, kept '
+                                    'ready to start'))
 
         self.useFadeGroup.setTitle(translate('ListLayout', 'Use fade'))
         self.stopCueFade.setText(translate('ListLayout', 'Stop Cue'))
@@ -158,6 +173,7 @@ class ListLayoutSettings(SettingsPage):
             'endlist': str(self.endListBehavior.currentData()),
             'gokey': self.goKeyEdit.keySequence().toString(
                 QKeySequence.NativeText),
+            'armedcues': str(self.armedCuesSpin.value()),
             'stopcuefade': str(self.stopCueFade.isChecked()),
             'pausecuefade': str(self.pauseCueFade.isChecked()),
             'restartcuefade': str(self.restartCueFade.isChecked()),
@@ -185,6 +201,7 @@ class ListLayoutSettings(SettingsPage):
         self.goKeyEdit.setKeySequence(
             QKeySequence(settings.get('gokey', 'Space'),
                          QKeySequence.NativeText))
+        self.armedCuesSpin.setValue(int(settings.get('armedcues', 2)))
 
         self.stopCueFade.setChecked(settings.get('stopcuefade') == 'True')
         self.pauseCueFade.setChecked(settings.get('pausecuefade') == 'True')
@@ -156,7 +156,8 @@ class CueTimeWidget(TimeWidget):
             self._update_duration, Connection.QtQueued)
 
         self.cue_time = CueTime(self.cue)
-        self.cue_time.notify.connect(self._update_time, Connection.QtQueued)
+        self.cue_time.notify.connect(self._update_time,
+                                     Connection.QtQueuedLatest)
 
         if cue.state & CueState.Running:
             self._running()
@@ -188,7 +189,8 @@ class PreWaitWidget(TimeWidget):
         self._update_duration(self.cue.pre_wait)
 
         self.wait_time = CueWaitTime(self.cue, mode=CueWaitTime.Mode.Pre)
-        self.wait_time.notify.connect(self._update_time, Connection.QtQueued)
+        self.wait_time.notify.connect(self._update_time,
+                                      Connection.QtQueuedLatest)
 
     def _update_duration(self, duration):
         # The wait time is in seconds, we need milliseconds
@@ -249,7 +251,8 @@ class PostWaitWidget(TimeWidget):
             self.cue.changed('duration').connect(
                 self._update_duration, Connection.QtQueued)
 
-            self.cue_time.notify.connect(self._update_time, Connection.QtQueued)
+            self.cue_time.notify.connect(
+                self._update_time, Connection.QtQueuedLatest)
             self._update_duration(self.cue.duration)
         else:
             self.cue.postwait_start.connect(self._running, Connection.QtQueued)
@@ -260,7 +263,7 @@ class PostWaitWidget(TimeWidget):
                 self._update_duration, Connection.QtQueued)
 
             self.wait_time.notify.connect(
-                self._update_time, Connection.QtQueued)
+                self._update_time, Connection.QtQueuedLatest)
             self._update_duration(self.cue.post_wait)
 
     def _stop(self):
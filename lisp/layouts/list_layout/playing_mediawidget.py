@@ -40,7 +40,8 @@ class PlayingMediaWidget(QWidget):
 
         self.cue = cue
         self.cue_time = CueTime(cue)
-        self.cue_time.notify.connect(self._time_updated, Connection.QtQueued)
+        self.cue_time.notify.connect(self._time_updated,
+                                     Connection.QtQueuedLatest)
 
         self._dbmeter_element = None
         self._accurate_time = False
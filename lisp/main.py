@@ -17,13 +17,16 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
+# Imported first, to measure the time spent importing the other modules
+from lisp.core.startup_profiler import StartupProfile
+
 import argparse
 import logging
 import sys
 from itertools import chain
 from os import path
 
-from PyQt5.QtCore import QTranslator, QLocale, QLibraryInfo
+from PyQt5.QtCore import QTranslator, QLocale, QLibraryInfo, QTimer
 from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtWidgets import QApplication
 
@@ -42,9 +45,17 @@ def main():
     parser.add_argument('-l', '--log', choices=['debug', 'info', 'warning'],
                         default='warning', help='Log level')
     parser.add_argument('--locale', default='', help='Force specified locale')
+    parser.add_argument('--profile-startup', default=None, nargs='?',
+                        const='', metavar='TRACE_FILE',
+                        help='Print the startup times, optionally write a '
+                             'JSON trace to TRACE_FILE')
 
     args = parser.parse_args()
 
+    if args.profile_startup is not None:
+        StartupProfile.enable()
+        StartupProfile.since_start('Imports (and configuration check)')
+
     # Set the logging level
     if args.log == 'debug':
         log = logging.DEBUG
@@ -64,18 +75,20 @@ def main():
     )
 
     # Create the QApplication
-    qt_app = QApplication(sys.argv)
-    qt_app.setApplicationName('Linux Show Player')
-    qt_app.setQuitOnLastWindowClosed(True)
-
-    # Force light font, for environment with "bad" QT support.
-    appFont = qt_app.font()
-    appFont.setWeight(QFont.Light)
-    qt_app.setFont(appFont)
-    # Set icons and theme from the application configuration
-    QIcon.setThemeSearchPaths(styles.IconsThemePaths)
-    QIcon.setThemeName(config['Theme']['icons'])
-    styles.apply_style(config['Theme']['theme'])
+    with StartupProfile.phase('QApplication'):
+        qt_app = QApplication(sys.argv)
+        qt_app.setApplicationName('Linux Show Player')
+        qt_app.setQuitOnLastWindowClosed(True)
+
+    with StartupProfile.phase('Theme and style'):
+        # Force light font, for environment with "bad" QT support.
+        appFont = qt_app.font()
+        appFont.setWeight(QFont.Light)
+        qt_app.setFont(appFont)
+        # Set icons and theme from the application configuration
+        QIcon.setThemeSearchPaths(styles.IconsThemePaths)
+        QIcon.setThemeName(config['Theme']['icons'])
+        styles.apply_style(config['Theme']['theme'])
 
     # Get/Set the locale
     locale = args.locale
@@ -84,39 +97,50 @@ def main():
 
     logging.info('Using {} locale'.format(QLocale().name()))
 
-    # Main app translations
-    translator = QTranslator()
-    translator.load(QLocale(), 'lisp', '_',
-                    path.join(path.dirname(path.realpath(__file__)), 'i18n'))
-
-    qt_app.installTranslator(translator)
-    ui_translators = [translator]
-
-    # Qt platform translation
-    translator = QTranslator()
-    translator.load(QLocale(), 'qt', '_',
-                    QLibraryInfo.location(QLibraryInfo.TranslationsPath))
+    with StartupProfile.phase('Translations'):
+        # Main app translations
+        translator = QTranslator()
+        translator.load(QLocale(), 'lisp', '_',
+                        path.join(path.dirname(path.realpath(__file__)),
+                                  'i18n'))
 
-    qt_app.installTranslator(translator)
-    ui_translators.append(translator)
+        qt_app.installTranslator(translator)
+        ui_translators = [translator]
 
-    # Modules and plugins translations
-    for tr_file in chain(modules.translations(),
-                         plugins.translations()):
+        # Qt platform translation
         translator = QTranslator()
-        translator.load(QLocale(), tr_file, '_')
+        translator.load(QLocale(), 'qt', '_',
+                        QLibraryInfo.location(QLibraryInfo.TranslationsPath))
 
         qt_app.installTranslator(translator)
         ui_translators.append(translator)
 
+        # Modules and plugins translations
+        for tr_file in chain(modules.translations(),
+                             plugins.translations()):
+            translator = QTranslator()
+            translator.load(QLocale(), tr_file, '_')
+
+            qt_app.installTranslator(translator)
+            ui_translators.append(translator)
+
     # Create the application
-    lisp_app = Application()
+    with StartupProfile.phase('Application'):
+        lisp_app = Application()
     # Load modules and plugins
-    modules.load_modules()
-    plugins.load_plugins()
+    with StartupProfile.phase('Modules'):
+        modules.load_modules()
+    with StartupProfile.phase('Plugins'):
+        plugins.load_plugins()
 
     # Start/Initialize LiSP Application
-    lisp_app.start(session_file=args.file)
+    with StartupProfile.phase('Application start'):
+        lisp_app.start(session_file=args.file)
+
+    if StartupProfile.enabled:
+        # Report when the event-loop starts (i.e. the first frame)
+        QTimer.singleShot(0, lambda: startup_report(args.profile_startup))
+
     # Start Qt Application (block until exit)
     exit_code = qt_app.exec_()
 
@@ -126,5 +150,16 @@ def main():
     sys.exit(exit_code)
 
 
+def startup_report(trace_file):
+    StartupProfile.since_start('Startup (until the event-loop)')
+    print(StartupProfile.report())
+
+    if trace_file:
+        try:
+            StartupProfile.dump_trace(trace_file)
+        except OSError:
+            logging.exception('Cannot write the startup trace')
+
+
 if __name__ == '__main__':
     main()
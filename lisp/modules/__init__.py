@@ -19,19 +19,88 @@
 
 import os
 
-from lisp.core.loading import load_classes
+from PyQt5.QtWidgets import QAction
+
+from lisp.core.configuration import config, CFG_DIR
+from lisp.core.manifest import DeferredLoader, Manifest
+from lisp.cues.cue_factory import CueFactory
+from lisp.layouts.cue_layout import CueLayout
 from lisp.ui import elogging
+from lisp.ui.mainwindow import MainWindow
+from lisp.ui.settings.app_settings import AppSettings
+from lisp.ui.settings.cue_settings import CueSettingsRegistry
 
 __MODULES = {}
 
 
+def __create(name, module):
+    try:
+        __MODULES[name] = module()
+        elogging.debug('MODULES: Loaded "{0}"'.format(name))
+        return True
+    except Exception as e:
+        elogging.exception('Failed "{0}" lading'.format(name), e)
+        return False
+
+
+def __cue_settings_pages():
+    registry = CueSettingsRegistry()
+    return [page.__name__ for ref_class in list(registry.ref_classes())
+            for page in registry.filter(ref_class)]
+
+
+def __cue_menu_entries():
+    registry = CueLayout.cm_registry
+    return [item.text() if isinstance(item, QAction) else item.title()
+            for ref_class in list(registry.ref_classes())
+            for item in registry.filter(ref_class)
+            if not (isinstance(item, QAction) and item.isSeparator())]
+
+
+__LOADER = DeferredLoader(
+    __package__, os.path.dirname(__file__),
+    Manifest(os.path.join(CFG_DIR, 'modules_manifest.json')),
+    __create,
+    probes={
+        'cue_types': CueFactory.cue_types,
+        'settings': lambda: [w.__name__ for w in AppSettings.SettingsWidgets],
+        'cue_settings': lambda: __cue_settings_pages(),
+        'cue_menus': lambda: __cue_menu_entries(),
+        'menus': lambda: [a.text() for a in MainWindow().menus_actions()],
+        'shortcuts': lambda: [a.shortcut().toString()
+                              for a in MainWindow().menus_actions()
+                              if not a.shortcut().isEmpty()]
+    },
+    # Shortcuts are available only when the modules are loaded
+    eager=('shortcuts', ),
+    deferred=config['Modules'].getboolean('Deferred'))
+
+
 def load_modules():
-    for name, module in load_classes(__package__, os.path.dirname(__file__)):
-        try:
-            __MODULES[name] = module()
-            elogging.debug('MODULES: Loaded "{0}"'.format(name))
-        except Exception as e:
-            elogging.exception('Failed "{0}" lading'.format(name), e)
+    """Load the modules, the ones in the manifest are loaded when needed.
+
+    Deferred modules are loaded when one of the features they provide is
+    required, e.g. a cue type, a menu or a settings page (see `require`).
+    """
+    __LOADER.load()
+    # Cues of deferred types can be created at any time (e.g. from presets)
+    CueFactory.set_require_hook(require_cue_types)
+
+
+def require(feature, names=None):
+    """Load the deferred modules providing the given feature.
+
+    :param feature: one of "cue_types", "settings", "cue_settings",
+                    "cue_menus" or "menus"
+    :param names: the needed names, if None any module providing the
+                  feature is loaded
+    """
+    __LOADER.require(feature, names)
+
+
+def require_cue_types(cue_types):
+    """Load the deferred modules providing the given cue types."""
+    __LOADER.require('cue_types', cue_types)
 
 
 def translations():
@@ -53,4 +122,6 @@ def terminate_modules():
 
 
 def check_module(modname):
+    # A deferred module is needed by the caller, load it now
+    __LOADER.require_class(modname)
     return modname.lower() in [mod.lower() for mod in __MODULES]
@@ -22,6 +22,7 @@ from PyQt5.QtCore import QT_TRANSLATE_NOOP
 from lisp.backend.media_element import ElementType, MediaType
 from lisp.core.signal import Signal
 from lisp.modules.gst_backend.gi_repository import Gst
+from lisp.modules.gst_backend.gst_bus_dispatcher import bus_dispatcher
 from lisp.modules.gst_backend.gst_element import GstMediaElement, GstProperty
 
 
@@ -52,14 +53,12 @@ class DbMeter(GstMediaElement):
 
         self.level.link(self.audio_convert)
 
-        bus = self.pipeline.get_bus()
-        bus.add_signal_watch()
-        self._handler = bus.connect('message::element', self.__on_message)
+        bus_dispatcher(self.pipeline).subscribe(
+            Gst.MessageType.ELEMENT, self.__on_message, self.level)
 
     def dispose(self):
-        bus = self.pipeline.get_bus()
-        bus.remove_signal_watch()
-        bus.disconnect(self._handler)
+        bus_dispatcher(self.pipeline).unsubscribe(
+            Gst.MessageType.ELEMENT, self.__on_message, self.level)
 
     def sink(self):
         return self.level
@@ -67,10 +66,9 @@ class DbMeter(GstMediaElement):
     def src(self):
         return self.audio_convert
 
-    def __on_message(self, bus, message):
-        if message.src == self.level:
-            structure = message.get_structure()
-            if structure is not None and structure.has_name('level'):
-                self.level_ready.emit(structure.get_value('peak'),
-                                      structure.get_value('rms'),
-                                      structure.get_value('decay'))
+    def __on_message(self, message):
+        structure = message.get_structure()
+        if structure is not None and structure.has_name('level'):
+            self.level_ready.emit(structure.get_value('peak'),
+                                  structure.get_value('rms'),
+                                  structure.get_value('decay'))
@@ -19,11 +19,14 @@
 
 import jack
 import logging
+from threading import Lock
+
 from PyQt5.QtCore import QT_TRANSLATE_NOOP
 
 from lisp.backend.media_element import ElementType, MediaType
 from lisp.core.has_properties import Property
 from lisp.modules.gst_backend.gi_repository import Gst
+from lisp.modules.gst_backend.gst_bus_dispatcher import bus_dispatcher
 from lisp.modules.gst_backend.gst_element import GstMediaElement, GstProperty
 
 
@@ -37,20 +40,26 @@ class JackSink(GstMediaElement):
 
     _ControlClient = None
     _clients = []
+    # Pipelines can be built concurrently (e.g. when loading a session)
+    _clients_lock = Lock()
 
     connections = Property(default=[[] for _ in range(8)])
 
     def __init__(self, pipeline):
         super().__init__()
 
-        if JackSink._ControlClient is None:
-            JackSink._ControlClient = jack.Client('LinuxShowPlayer_Control')
+        with JackSink._clients_lock:
+            if JackSink._ControlClient is None:
+                JackSink._ControlClient = jack.Client(
+                    'LinuxShowPlayer_Control')
+
+            self._client_id = JackSink.__register_client_id()
+            control_client = JackSink._ControlClient
 
         self.pipeline = pipeline
         self.audio_resample = Gst.ElementFactory.make('audioresample')
         self.jack_sink = Gst.ElementFactory.make('jackaudiosink', 'sink')
 
-        self._client_id = JackSink.__register_client_id()
         self._client_name = JackSink.CLIENT_NAME + '-' + str(self._client_id)
         self.jack_sink.set_property('client-name', self._client_name)
         self.jack_sink.set_property('connect', JackSink.CONNECT_MODE)
@@ -60,24 +69,26 @@ class JackSink(GstMediaElement):
 
         self.audio_resample.link(self.jack_sink)
 
-        self.connections = self.default_connections(JackSink._ControlClient)
+        self.connections = self.default_connections(control_client)
         self.changed('connections').connect(self.__prepare_connections)
 
-        bus = self.pipeline.get_bus()
-        bus.add_signal_watch()
-        self._handler = bus.connect('message', self.__on_message)
+        bus_dispatcher(self.pipeline).subscribe(
+            Gst.MessageType.STATE_CHANGED, self.__on_message, self.jack_sink)
 
     def sink(self):
         return self.audio_resample
 
     def dispose(self):
-        try:
-            self.pipeline.get_bus().disconnect(self._handler)
-            JackSink._clients.remove(self._client_id)
-        finally:
-            if not JackSink._clients:
-                JackSink._ControlClient.close()
-                JackSink._ControlClient = None
+        bus_dispatcher(self.pipeline).unsubscribe(
+            Gst.MessageType.STATE_CHANGED, self.__on_message, self.jack_sink)
+
+        with JackSink._clients_lock:
+            try:
+                JackSink._clients.remove(self._client_id)
+            finally:
+                if not JackSink._clients:
+                    JackSink._ControlClient.close()
+                    JackSink._ControlClient = None
 
     @classmethod
     def default_connections(cls, client):
@@ -103,6 +114,7 @@ class JackSink(GstMediaElement):
 
     @classmethod
     def __register_client_id(cls):
+        # Must be called holding `_clients_lock`
         n = 0
         for n, client in enumerate(cls._clients):
             if n != client:
@@ -136,13 +148,10 @@ class JackSink(GstMediaElement):
                 else:
                     break
 
-    def __on_message(self, bus, message):
-        if message.src == self.jack_sink:
-            if message.type == Gst.MessageType.STATE_CHANGED:
-                change = message.parse_state_changed()
+    def __on_message(self, message):
+        change = message.parse_state_changed()
 
-                # The jack ports are available when the the jackaudiosink
-                # change from READY to PAUSED state
-                if (change[0] == Gst.State.READY and
-                        change[1] == Gst.State.PAUSED):
-                    self.__jack_connect()
+        # The jack ports are available when the the jackaudiosink
+        # change from READY to PAUSED state
+        if change[0] == Gst.State.READY and change[1] == Gst.State.PAUSED:
+            self.__jack_connect()
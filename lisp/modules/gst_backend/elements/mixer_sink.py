@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from uuid import uuid4
+
+from PyQt5.QtCore import QT_TRANSLATE_NOOP
+
+from lisp.backend.media_element import ElementType, MediaType
+from lisp.core.has_properties import Property
+from lisp.modules.gst_backend.gi_repository import Gst
+from lisp.modules.gst_backend.gst_element import GstMediaElement
+from lisp.modules.gst_backend.gst_output_mixer import output_mixer, \
+    set_inter_latency
+
+
+class MixerSink(GstMediaElement):
+    """Send the audio to the shared output mixer of a device.
+
+    The media is connected to the mixer only while playing (or paused).
+    The audio reach the mixer with the given `latency` (milliseconds), see
+    `set_inter_latency` for the trade-off.
+    """
+    ElementType = ElementType.Output
+    MediaType = MediaType.Audio
+    Name = QT_TRANSLATE_NOOP('MediaElementName', 'Shared Out')
+
+    device = Property(default='auto')
+    latency = Property(default=20)
+
+    def __init__(self, pipe):
+        super().__init__()
+
+        self._channel = 'lisp-' + uuid4().hex
+        self._mixer = None
+
+        self.audio_convert = Gst.ElementFactory.make('audioconvert', None)
+        self.inter_sink = Gst.ElementFactory.make('interaudiosink', 'sink')
+        self.inter_sink.set_property('channel', self._channel)
+        set_inter_latency(self.inter_sink, self.latency)
+
+        pipe.add(self.audio_convert)
+        pipe.add(self.inter_sink)
+
+        self.audio_convert.link(self.inter_sink)
+
+        self.changed('device').connect(self.__reconnect)
+        self.changed('latency').connect(self.__latency_changed)
+
+    def sink(self):
+        return self.audio_convert
+
+    def play(self):
+        if self._mixer is None:
+            self._mixer = output_mixer(self.device)
+            self._mixer.connect(self._channel, self.latency)
+
+    def stop(self):
+        self.__disconnect()
+
+    def interrupt(self):
+        self.__disconnect()
+
+    def dispose(self):
+        self.__disconnect()
+
+    def __disconnect(self):
+        if self._mixer is not None:
+            self._mixer.disconnect(self._channel)
+            self._mixer = None
+
+    def __latency_changed(self, latency):
+        # Applied by the sink when started (e.g. the next play)
+        set_inter_latency(self.inter_sink, latency)
+        self.__reconnect()
+
+    def __reconnect(self, *args):
+        # Move to the new mixer (or branch), if playing
+        if self._mixer is not None:
+            self.__disconnect()
+            self.play()
@@ -22,6 +22,7 @@ from PyQt5.QtCore import QT_TRANSLATE_NOOP
 from lisp.backend.media_element import ElementType, MediaType
 from lisp.core.has_properties import Property
 from lisp.modules.gst_backend.gi_repository import Gst
+from lisp.modules.gst_backend.gst_bus_dispatcher import bus_dispatcher
 from lisp.modules.gst_backend.gst_element import GstMediaElement
 
 
@@ -44,9 +45,8 @@ class Speed(GstMediaElement):
 
         self.scale_tempo.link(self.audio_convert)
 
-        bus = self.pipeline.get_bus()
-        bus.add_signal_watch()
-        self._handler = bus.connect("message", self.__on_message)
+        bus_dispatcher(self.pipeline).subscribe(
+            Gst.MessageType.STATE_CHANGED, self.__on_message, self.scale_tempo)
 
         self._old_speed = self.speed
         self.changed('speed').connect(self.__prepare_speed)
@@ -65,14 +65,11 @@ class Speed(GstMediaElement):
         return self.audio_convert
 
     def dispose(self):
-        bus = self.pipeline.get_bus()
-        bus.remove_signal_watch()
-        bus.disconnect(self._handler)
-
-    def __on_message(self, bus, message):
-        if (message.type == Gst.MessageType.STATE_CHANGED and
-                    message.src == self.scale_tempo and
-                    message.parse_state_changed()[1] == Gst.State.PLAYING):
+        bus_dispatcher(self.pipeline).unsubscribe(
+            Gst.MessageType.STATE_CHANGED, self.__on_message, self.scale_tempo)
+
+    def __on_message(self, message):
+        if message.parse_state_changed()[1] == Gst.State.PLAYING:
             self.__change_speed()
 
     def __change_speed(self):
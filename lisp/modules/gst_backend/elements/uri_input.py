@@ -31,6 +31,25 @@ from lisp.modules.gst_backend.gst_element import GstProperty, \
 from lisp.modules.gst_backend.gst_utils import gst_uri_duration
 
 
+def check_uri(uri, mtime, duration):
+    """Check if the duration of the media at `uri` must be (re)computed.
+
+    :param mtime: the last known modification time of the file
+    :param duration: the last known duration
+    :return: (mtime, True if the duration must be computed)
+    """
+    current = mtime
+    # If the uri is a file, then update the current mtime
+    if uri.split('://')[0] == 'file':
+        if path.exists(uri.split('//')[1]):
+            current = path.getmtime(uri.split('//')[1])
+    else:
+        mtime = None
+
+    # If something is changed or the duration is invalid
+    return current, mtime != current or duration < 0
+
+
 class UriInput(GstSrcElement):
     MediaType = MediaType.Audio
     Name = QT_TRANSLATE_NOOP('MediaElementName', 'URI Input')
@@ -68,16 +87,8 @@ class UriInput(GstSrcElement):
 
     def __uri_changed(self, value):
         # Save the current mtime (file flag for last-change time)
-        mtime = self._mtime
-        # If the uri is a file, then update the current mtime
-        if value.split('://')[0] == 'file':
-            if path.exists(value.split('//')[1]):
-                self._mtime = path.getmtime(value.split('//')[1])
-        else:
-            mtime = None
-
-        # If something is changed or the duration is invalid
-        if mtime != self._mtime or self.duration < 0:
+        self._mtime, outdated = check_uri(value, self._mtime, self.duration)
+        if outdated:
             self.__duration()
 
     @async_in_pool(pool=ThreadPoolExecutor(1))
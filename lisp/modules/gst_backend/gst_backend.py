@@ -21,23 +21,26 @@ from lisp import backend
 from lisp.backend.backend import Backend as BaseBackend
 from lisp.core.decorators import memoize
 from lisp.core.module import Module
+from lisp.core.startup_profiler import StartupProfile
 from lisp.cues.media_cue import MediaCue
 from lisp.modules.gst_backend.gst_utils import gst_parse_tag_list
-from lisp.modules.gst_backend.gst_utils import gst_uri_metadata, gst_mime_types, \
-    gst_uri_duration
+from lisp.modules.gst_backend.gst_utils import gst_uri_metadata, \
+    gst_cached_mime_types, gst_uri_duration
 from lisp.ui.settings.app_settings import AppSettings
 from lisp.ui.settings.cue_settings import CueSettingsRegistry
 from lisp.modules.gst_backend import elements, settings
 from lisp.modules.gst_backend.gi_repository import Gst
 from lisp.modules.gst_backend.gst_cue_factories import register_factories
 from lisp.modules.gst_backend.gst_media_settings import GstMediaSettings
+from lisp.modules.gst_backend.gst_output_mixer import dispose_mixers
 from lisp.modules.gst_backend.gst_settings import GstSettings
 
 
 class GstBackend(Module, BaseBackend):
     def __init__(self):
         # Initialize GStreamer
-        Gst.init(None)
+        with StartupProfile.phase('Gst.init'):
+            Gst.init(None)
 
         # Register GStreamer settings widgets
         AppSettings.register_settings_widget(GstSettings)
@@ -51,6 +54,10 @@ class GstBackend(Module, BaseBackend):
 
         backend.set_backend(self)
 
+    def terminate(self):
+        # Release the output devices of the shared mixers
+        dispose_mixers()
+
     def uri_duration(self, uri):
         return gst_uri_duration(uri)
 
@@ -61,7 +68,7 @@ class GstBackend(Module, BaseBackend):
     def supported_extensions(self):
         extensions = {'audio': [], 'video': []}
 
-        for gst_mime, gst_extensions in gst_mime_types():
+        for gst_mime, gst_extensions in gst_cached_mime_types():
             for mime in ['audio', 'video']:
                 if gst_mime.startswith(mime):
                     extensions[mime].extend(gst_extensions)
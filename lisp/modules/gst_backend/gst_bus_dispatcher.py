@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import inspect
+import weakref
+from threading import Lock
+
+from lisp.core.util import weak_call_proxy
+from lisp.modules.gst_backend.gi_repository import Gst
+
+__all__ = ['GstBusDispatcher', 'bus_dispatcher']
+
+
+class GstBusDispatcher:
+    """Dispatch the messages of a pipeline bus to the interested callbacks.
+
+    A single signal-watch is used for the whole pipeline, and only the
+    detailed signals (e.g. "message::eos") of the subscribed message types
+    are connected, this way the other messages never reach Python.
+    Every message is delivered once, to the callbacks subscribed for its type
+    and source (or for any source).
+
+    Callbacks are referenced weakly, and receive the message as the only
+    argument.
+
+    .. Usage::
+
+        dispatcher = bus_dispatcher(pipeline)
+        dispatcher.subscribe(Gst.MessageType.EOS, self.__on_eos, pipeline)
+    """
+
+    def __init__(self, bus):
+        self._bus = bus
+        self._lock = Lock()
+        # {message_type: [(src, callback_reference), ...]}
+        self._subscribers = {}
+        # {message_type: signal_handler_id}
+        self._handlers = {}
+        self._watching = False
+
+    def subscribe(self, message_type, callback, src=None):
+        """Call `callback(message)` for the messages of the given type.
+
+        :param message_type: the type of the messages
+        :type message_type: Gst.MessageType
+        :param callback: a function or method (referenced weakly)
+        :param src: deliver only the messages from this source (None for any)
+        :type src: Gst.Object
+        """
+        if inspect.ismethod(callback):
+            reference = weakref.WeakMethod(callback)
+        else:
+            reference = weakref.ref(callback)
+
+        with self._lock:
+            subscribers = self._subscribers.setdefault(message_type, [])
+            subscribers.append((src, reference))
+
+            if message_type not in self._handlers:
+                if not self._watching:
+                    self._bus.add_signal_watch()
+                    self._watching = True
+
+                # Use a weakref or the dispatcher cannot be garbage-collected
+                detail = Gst.MessageType.get_name(message_type)
+                self._handlers[message_type] = self._bus.connect(
+                    'message::' + detail,
+                    weak_call_proxy(weakref.WeakMethod(self.__dispatch)))
+
+    def unsubscribe(self, message_type, callback, src=None):
+        """Remove a subscription, and the dead (garbage-collected) ones."""
+        with self._lock:
+            subscribers = self._subscribers.get(message_type, [])
+            subscribers[:] = [
+                (s, r) for s, r in subscribers
+                if r() is not None and not (s == src and r() == callback)]
+
+            self.__prune(message_type)
+
+    def dispose(self):
+        """Remove all the subscriptions, and the bus signal-watch."""
+        with self._lock:
+            self._subscribers.clear()
+            for message_type in list(self._handlers.keys()):
+                self.__prune(message_type)
+
+    def __prune(self, message_type):
+        # Disconnect the signals (and the watch) no more needed
+        if not self._subscribers.get(message_type):
+            self._subscribers.pop(message_type, None)
+
+            handler = self._handlers.pop(message_type, None)
+            if handler is not None:
+                self._bus.disconnect(handler)
+
+            if not self._handlers and self._watching:
+                self._bus.remove_signal_watch()
+                self._watching = False
+
+    def __dispatch(self, bus, message):
+        with self._lock:
+            subscribers = self._subscribers.get(message.type, ()).copy()
+
+        for src, reference in subscribers:
+            if src is None or message.src == src:
+                callback = reference()
+                if callback is not None:
+                    callback(message)
+
+
+__dispatchers = weakref.WeakKeyDictionary()
+__dispatchers_lock = Lock()
+
+
+def bus_dispatcher(pipeline):
+    """Return the dispatcher of the `pipeline` bus, creating it if needed.
+
+    :type pipeline: Gst.Pipeline
+    :rtype: GstBusDispatcher
+    """
+    with __dispatchers_lock:
+        dispatcher = __dispatchers.get(pipeline)
+        if dispatcher is None:
+            dispatcher = GstBusDispatcher(pipeline.get_bus())
+            __dispatchers[pipeline] = dispatcher
+
+        return dispatcher
@@ -36,7 +36,8 @@ def uri_audio(id=None, uri=None):
     cue = gst_media(id=id, pipeline=compose_pipeline('UriInput'))
 
     if uri is not None:
-        cue.media.element('UriInput').uri = uri
+        # Do not build a "lazy" pipeline only to set the uri
+        cue.media.update_elements({'UriInput': {'uri': uri}})
 
     return cue
 
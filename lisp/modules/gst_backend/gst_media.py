@@ -18,11 +18,20 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 import weakref
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
 
 from lisp.backend.media import Media, MediaState
+from lisp.core.configuration import config
+from lisp.core.decorators import async_in_pool
+from lisp.core.go_latency import GoLatency
 from lisp.core.has_properties import Property
 from lisp.modules.gst_backend import elements
 from lisp.modules.gst_backend.gi_repository import Gst
+from lisp.modules.gst_backend.gst_bus_dispatcher import bus_dispatcher
+from lisp.modules.gst_backend.elements.uri_input import check_uri
+from lisp.modules.gst_backend.gst_pipeline_manager import PipelineManager
+from lisp.modules.gst_backend.gst_utils import gst_uri_duration
 
 
 def validate_pipeline(pipe, rebuild=False):
@@ -49,7 +58,18 @@ def validate_pipeline(pipe, rebuild=False):
 
 
 class GstMedia(Media):
-    """Media implementation based on the GStreamer framework."""
+    """Media implementation based on the GStreamer framework.
+
+    When `[Gst] LazyPipeline` is enabled, the first configuration of the
+    elements is only stored, and the pipeline is built when the media is
+    played, armed, edited or one of its elements is requested. Meanwhile
+    the input file is checked, and its duration computed, as `UriInput`
+    does.
+
+    Built pipelines are tracked by the `PipelineManager`, that can release
+    (set to NULL) the least recently used ones, a released media remains
+    `Stopped` (see `released`).
+    """
 
     pipe = Property(default=())
 
@@ -60,19 +80,35 @@ class GstMedia(Media):
         self._elements = []
         self._old_pipe = ''
         self._loop_count = 0
+        self._output_probe = None
+        self._armed = False
+        # Arming step in progress (see `arm`), None when not arming
+        self._arming = None
+        self._released = False
+
+        # Elements properties of a pipeline not yet built (lazy)
+        self._lazy = config['Gst'].getboolean('LazyPipeline')
+        self._pending = None
+        self._configured = False
+        self._pipe_lock = RLock()
 
         self._gst_pipe = Gst.Pipeline()
         self._gst_state = Gst.State.NULL
         self._time_query = Gst.Query.new_position(Gst.Format.TIME)
 
-        bus = self._gst_pipe.get_bus()
-        bus.add_signal_watch()
-
-        # Use a weakref instead of the method or the object will not be
-        # garbage-collected
-        on_message = weakref.WeakMethod(self.__on_message)
-        handler = bus.connect('message', lambda *args: on_message()(*args))
-        weakref.finalize(self, self.__finalizer, self._gst_pipe, handler,
+        # The dispatcher keep only weak references to the callbacks
+        dispatcher = bus_dispatcher(self._gst_pipe)
+        dispatcher.subscribe(Gst.MessageType.STATE_CHANGED,
+                             self.__on_state_changed, self._gst_pipe)
+        dispatcher.subscribe(Gst.MessageType.EOS, self.__on_eos,
+                             self._gst_pipe)
+        dispatcher.subscribe(Gst.MessageType.CLOCK_LOST,
+                             self.__on_clock_lost, self._gst_pipe)
+        dispatcher.subscribe(Gst.MessageType.ASYNC_DONE,
+                             self.__on_async_done, self._gst_pipe)
+        dispatcher.subscribe(Gst.MessageType.ERROR, self.__on_error)
+
+        weakref.finalize(self, self.__finalizer, self._gst_pipe, dispatcher,
                          self._elements)
 
         self.changed('loop').connect(self.__prepare_loops)
@@ -94,34 +130,128 @@ class GstMedia(Media):
             if not pipe:
                 raise ValueError('Invalid pipeline "{0}"'.format(pipe))
 
-            # Build the pipeline
-            elements_properties = self.elements_properties()
-            self.__build_pipeline()
-            self.update_elements(elements_properties)
+            with self._pipe_lock:
+                if self._lazy and not self._elements:
+                    # Delay the pipeline creation (see __materialize)
+                    if self._pending is None:
+                        self._pending = {}
+                    self._state = MediaState.Stopped
+                else:
+                    self.__build(self.elements_properties())
+
+    def __build(self, elements_properties):
+        self.__build_pipeline()
+        self.update_elements(elements_properties)
+
+        self._elements[0].changed('duration').connect(self.__duration_changed)
+        self.__duration_changed(self._elements[0].duration)
+
+    def __materialize(self):
+        """Build the pipeline of a "lazy" media, if not already done."""
+        if self._pending is not None:
+            with self._pipe_lock:
+                if self._pending is not None:
+                    elements_properties, self._pending = self._pending, None
+                    self.__build(elements_properties)
+
+    def __warm_up(self):
+        """Build the pipeline if needed, and mark it as recently used."""
+        if self._pending is not None:
+            self.__materialize()
+        else:
+            PipelineManager.touch(self)
 
-            self._elements[0].changed('duration').connect(
-                self.__duration_changed)
-            self.__duration_changed(self._elements[0].duration)
+        # From NULL the pipeline is brought to the needed state by the caller
+        self._released = False
 
     def current_time(self):
         ok, position = self._gst_pipe.query_position(Gst.Format.TIME)
         return position // Gst.MSECOND if ok else 0
 
+    @property
+    def armed(self):
+        """True if the pipeline is prerolled (PAUSED) at the start position,
+        or is seeking the start position after the preroll."""
+        return self._armed
+
+    def arm(self):
+        """Preroll the pipeline, the playback can start immediately.
+
+        The method doesn't wait the preroll, that is completed on the
+        ASYNC_DONE bus message (see `__arm_step`).
+        """
+        with self._pipe_lock:
+            if (self.state == MediaState.Stopped and not self._armed and
+                    self._arming is None):
+                self.__warm_up()
+
+                self._arming = 'preroll'
+                result = self._gst_pipe.set_state(Gst.State.PAUSED)
+                if result == Gst.StateChangeReturn.FAILURE:
+                    self._arming = None
+                    self._gst_pipe.set_state(Gst.State.READY)
+                elif result != Gst.StateChangeReturn.ASYNC:
+                    # Already prerolled, no ASYNC_DONE will be posted
+                    self.__arm_step()
+
+        PipelineManager.release_exceeding()
+
+    def disarm(self):
+        with self._pipe_lock:
+            if self._armed or self._arming is not None:
+                self._armed = False
+                self._arming = None
+                if self.state == MediaState.Stopped:
+                    self._gst_pipe.set_state(Gst.State.READY)
+
+    def __arm_step(self):
+        # Must be called holding the pipeline lock
+        if (self._arming == 'preroll' and
+                (self.start_time > 0 or self.stop_time > 0)):
+            # Seek now, the playback will not "blip" from the beginning,
+            # the pipeline is prerolled again after the flush
+            self._arming = 'seek'
+            self._armed = True
+            if self.__seek(self.start_time):
+                return
+
+        self._arming = None
+        self._armed = True
+
     def play(self):
-        if self.state == MediaState.Stopped or self.state == MediaState.Paused:
+        with self._pipe_lock:
+            if (self.state != MediaState.Stopped and
+                    self.state != MediaState.Paused):
+                return
+
+            self.__warm_up()
             self.on_play.emit(self)
 
             for element in self._elements:
                 element.play()
 
+            if GoLatency.enabled:
+                self.__probe_output()
+
+            # When armed the pipeline is already at the start position
+            armed = self._armed
+            self._armed = False
+            self._arming = None
+
             self._state = MediaState.Playing
             self._gst_pipe.set_state(Gst.State.PLAYING)
-            self._gst_pipe.get_state(Gst.SECOND)
 
-            if self.start_time > 0 or self.stop_time > 0:
-                self.seek(self.start_time)
+        # Wait outside the lock, the bus handlers (e.g. ASYNC_DONE) need it
+        self._gst_pipe.get_state(Gst.SECOND)
+        GoLatency.mark(self, 'playing')
+
+        if not armed and (self.start_time > 0 or self.stop_time > 0):
+            self.seek(self.start_time)
+
+        self.played.emit(self)
 
-            self.played.emit(self)
+        # Now that the media is playing, make room for it
+        PipelineManager.release_exceeding()
 
     def pause(self):
         if self.state == MediaState.Playing:
@@ -150,7 +280,8 @@ class GstMedia(Media):
 
     def __seek(self, position):
         # FIXME: not working when in pause (fix or disallow)
-        if self.state == MediaState.Playing or self.state == MediaState.Paused:
+        if (self.state == MediaState.Playing or
+                self.state == MediaState.Paused or self._armed):
             max_position = self.duration
             if 0 < self.stop_time < self.duration:
                 max_position = self.stop_time
@@ -185,14 +316,23 @@ class GstMedia(Media):
             self.sought.emit(self, position)
 
     def element(self, class_name):
+        # The caller may need a "live" element (e.g. to change the volume)
+        self.__materialize()
+
         for element in self._elements:
             if type(element).__name__ == class_name:
                 return element
 
     def elements(self):
+        """Return the built elements, empty if the pipeline is not built."""
         return self._elements.copy()
 
     def elements_properties(self, only_changed=False):
+        if self._pending is not None:
+            with self._pipe_lock:
+                if self._pending is not None:
+                    return self.__pending_properties(only_changed)
+
         properties = {}
 
         for element in self._elements:
@@ -204,6 +344,9 @@ class GstMedia(Media):
 
     def input_uri(self):
         try:
+            if self._pending is not None:
+                return self._pending.get(self.pipe[0], {}).get('uri')
+
             return self._elements[0].input_uri()
         except Exception:
             pass
@@ -214,12 +357,20 @@ class GstMedia(Media):
 
         state = self._state
 
+        self._armed = False
+        self._arming = None
+        self._released = False
         self._gst_pipe.set_state(Gst.State.NULL)
         if dispose:
             self._state = MediaState.Null
+            PipelineManager.discard(self)
         else:
             self._gst_pipe.set_state(Gst.State.READY)
             self._state = MediaState.Stopped
+            if self._elements:
+                # The pipeline is warm again, also if it was released
+                PipelineManager.track(self)
+                PipelineManager.release_exceeding()
 
         self._loop_count = self.loop
 
@@ -227,12 +378,56 @@ class GstMedia(Media):
                      state == MediaState.Paused):
             self.interrupted.emit(self)
 
+    def releasable(self):
+        """True if the pipeline is built but not in use (see `release`)."""
+        return (self._state == MediaState.Stopped and not self._armed and
+                self._arming is None and not self._released and bool(self._elements))
+
+    @property
+    def released(self):
+        """True if the pipeline has been released (it's in the NULL state)."""
+        return self._released
+
+    def release(self):
+        """Set the pipeline to NULL, if not in use, to free its resources.
+
+        The pipeline is brought back to the needed state when used again.
+
+        :return: True if the pipeline has been released
+        """
+        # If the lock is taken, the media is in use
+        if self._pipe_lock.acquire(blocking=False):
+            try:
+                if self.releasable():
+                    self._gst_pipe.set_state(Gst.State.NULL)
+                    self._released = True
+                    return True
+            finally:
+                self._pipe_lock.release()
+
+        return False
+
     def properties(self, only_changed=False):
         properties = super().properties(only_changed).copy()
         properties['elements'] = self.elements_properties(only_changed)
         return properties
 
     def update_elements(self, properties):
+        with self._pipe_lock:
+            if self._pending is not None:
+                if not self._configured:
+                    # First configuration (e.g. the session loading)
+                    self._configured = True
+                    for name, e_properties in properties.items():
+                        self._pending.setdefault(name, {}).update(
+                            e_properties)
+
+                    self.__check_pending_input()
+                    return
+
+                # Edited, build the pipeline to apply the changes
+                self.__materialize()
+
         for element in self._elements:
             if type(element).__name__ in properties:
                 element.update_properties(properties[type(element).__name__])
@@ -246,6 +441,46 @@ class GstMedia(Media):
         if self.state == MediaState.Null or self.state == MediaState.Error:
             self._state = MediaState.Stopped
 
+    def __check_pending_input(self):
+        input_properties = self._pending.setdefault(self.pipe[0], {})
+        uri = input_properties.get('uri')
+        if uri:
+            mtime, outdated = check_uri(uri,
+                                        input_properties.get('_mtime', -1),
+                                        input_properties.get('duration', 0))
+            if mtime != -1:
+                input_properties['_mtime'] = mtime
+            if outdated:
+                self.__probe_duration(uri)
+
+    @async_in_pool(pool=ThreadPoolExecutor(1))
+    def __probe_duration(self, uri):
+        duration = gst_uri_duration(uri)
+
+        with self._pipe_lock:
+            if self._pending is None:
+                # Built in the meantime, the element computes the duration
+                return
+
+            self._pending.setdefault(self.pipe[0], {})['duration'] = duration
+
+        self.duration = duration
+
+    def __pending_properties(self, only_changed):
+        pipe_elements = self._pipe_elements()
+        properties = {}
+
+        for name in self.pipe:
+            e_properties = {}
+            if not only_changed:
+                e_properties.update(pipe_elements[name].properties_defaults())
+            e_properties.update(self._pending.get(name, {}))
+
+            if e_properties:
+                properties[name] = e_properties
+
+        return properties
+
     @staticmethod
     def _pipe_elements():
         tmp = {}
@@ -272,6 +507,10 @@ class GstMedia(Media):
     def __build_pipeline(self):
         # Set to NULL the pipeline
         self.interrupt(dispose=True)
+        # Remove the pending output probe
+        if self._output_probe is not None:
+            self._output_probe[0].remove_probe(self._output_probe[1])
+            self._output_probe = None
         # Remove all pipeline children
         for __ in range(self._gst_pipe.get_children_count()):
             self._gst_pipe.remove(self._gst_pipe.get_child_by_index(0))
@@ -287,45 +526,69 @@ class GstMedia(Media):
         # Set to Stopped/READY the pipeline
         self._state = MediaState.Stopped
         self._gst_pipe.set_state(Gst.State.READY)
+        PipelineManager.touch(self)
+        PipelineManager.release_exceeding()
 
         self.elements_changed.emit(self)
 
-    def __on_message(self, bus, message):
-        if message.src == self._gst_pipe:
-            if message.type == Gst.MessageType.STATE_CHANGED:
-                self._gst_state = message.parse_state_changed()[1]
-            elif message.type == Gst.MessageType.EOS:
-                self.__on_eos()
-            elif message.type == Gst.MessageType.CLOCK_LOST:
-                self._gst_pipe.set_state(Gst.State.PAUSED)
-                self._gst_pipe.set_state(Gst.State.PLAYING)
-
-        if message.type == Gst.MessageType.ERROR:
-            err, debug = message.parse_error()
-            self._state = MediaState.Error
-            self.interrupt(dispose=True, emit=False)
-            self.error.emit(self, str(err), str(debug))
-
-    def __on_eos(self):
+    def __probe_output(self):
+        """Mark the first buffer reaching the output element."""
+        if self._output_probe is not None or not self._elements:
+            return
+
+        sink = self._elements[-1].sink()
+        pad = sink.get_static_pad('sink') if sink is not None else None
+        if pad is not None:
+            # Use a weakref, the probe may be never called
+            media = weakref.ref(self)
+
+            def probe(pad, info):
+                if media() is not None:
+                    media()._output_probe = None
+                    GoLatency.mark(media(), 'output')
+
+                return Gst.PadProbeReturn.REMOVE
+
+            self._output_probe = (
+                pad, pad.add_probe(Gst.PadProbeType.BUFFER, probe))
+
+    def __on_state_changed(self, message):
+        self._gst_state = message.parse_state_changed()[1]
+
+    def __on_async_done(self, message):
+        with self._pipe_lock:
+            if self._arming is not None:
+                self.__arm_step()
+
+    def __on_clock_lost(self, message):
+        self._gst_pipe.set_state(Gst.State.PAUSED)
+        self._gst_pipe.set_state(Gst.State.PLAYING)
+
+    def __on_error(self, message):
+        err, debug = message.parse_error()
+        self._state = MediaState.Error
+        self.interrupt(dispose=True, emit=False)
+        self.error.emit(self, str(err), str(debug))
+
+    def __on_eos(self, message):
         if self._loop_count != 0:
             self._loop_count -= 1
             self.seek(self.start_time)
         else:
             self._state = MediaState.Stopped
-            self.eos.emit(self)
+            # Reset the pipeline before notifying, so that handlers can
+            # use (e.g. arm) the media
             self.interrupt(emit=False)
+            self.eos.emit(self)
 
     def __duration_changed(self, duration):
         self.duration = duration
 
     @staticmethod
-    def __finalizer(pipeline, connection_handler, media_elements):
+    def __finalizer(pipeline, dispatcher, media_elements):
         # Allow pipeline resources to be released
         pipeline.set_state(Gst.State.NULL)
-
-        bus = pipeline.get_bus()
-        bus.remove_signal_watch()
-        bus.disconnect(connection_handler)
+        dispatcher.dispose()
 
         for element in media_elements:
             element.dispose()
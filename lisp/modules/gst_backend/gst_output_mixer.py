@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+from threading import Lock
+
+from lisp.modules.gst_backend.gi_repository import Gst
+
+# {device: GStreamer sink factory}
+MIXER_SINKS = {
+    'auto': 'autoaudiosink',
+    'pulse': 'pulsesink',
+    'alsa': 'alsasink',
+    'jack': 'jackaudiosink'
+}
+
+
+def set_inter_latency(element, latency):
+    """Set the buffering times of an interaudiosrc/interaudiosink.
+
+    The audio is moved between the pipelines in chunks of `latency`, that
+    is the delay added to the output. The default (100ms) is too much for
+    a cue, lower values cost more wake-ups (CPU) and, if too low, cause
+    audio drop-outs on a loaded system.
+
+    :param latency: the latency in milliseconds
+    """
+    latency *= Gst.MSECOND
+    element.set_property('latency-time', latency)
+    element.set_property('period-time', latency // 2)
+    element.set_property('buffer-time', latency * 10)
+
+
+class GstOutputMixer:
+    """Long-lived output pipeline, mixing the audio of many media.
+
+    Media pipelines send the audio to an "interaudiosink" with an unique
+    channel name, when connected the mixer adds a branch reading that
+    channel to the "audiomixer", so the device (e.g. a JACK client) is
+    opened only once for all the media.
+
+    A silent source keep the mixer running when no media is connected.
+    """
+
+    JACK_CLIENT_NAME = 'linux-show-player-mixer'
+    JACK_CONNECT_MODE = 'auto'
+
+    def __init__(self, device):
+        self.device = device
+
+        self._lock = Lock()
+        self._branches = {}
+
+        self._pipe = Gst.Pipeline()
+        self._mixer = Gst.ElementFactory.make('audiomixer', None)
+        self._convert = Gst.ElementFactory.make('audioconvert', None)
+        self._resample = Gst.ElementFactory.make('audioresample', None)
+        self._sink = Gst.ElementFactory.make(MIXER_SINKS[device], None)
+        if device == 'jack':
+            self._sink.set_property('client-name', self.JACK_CLIENT_NAME)
+            self._sink.set_property('connect', self.JACK_CONNECT_MODE)
+
+        self._silence = Gst.ElementFactory.make('audiotestsrc', None)
+        self._silence.set_property('wave', 'silence')
+        self._silence.set_property('is-live', True)
+
+        for element in (self._silence, self._mixer, self._convert,
+                        self._resample, self._sink):
+            self._pipe.add(element)
+
+        self._silence.link(self._mixer)
+        self._mixer.link(self._convert)
+        self._convert.link(self._resample)
+        self._resample.link(self._sink)
+
+        bus = self._pipe.get_bus()
+        bus.add_signal_watch()
+        bus.connect('message::error', self.__on_error)
+
+        self._pipe.set_state(Gst.State.PLAYING)
+
+    def connect(self, channel, latency):
+        """Start mixing the audio sent to the given inter-channel.
+
+        :param latency: the inter-channel latency (see `set_inter_latency`)
+        """
+        with self._lock:
+            if channel in self._branches:
+                return
+
+            source = Gst.ElementFactory.make('interaudiosrc', None)
+            source.set_property('channel', channel)
+            set_inter_latency(source, latency)
+            convert = Gst.ElementFactory.make('audioconvert', None)
+            resample = Gst.ElementFactory.make('audioresample', None)
+
+            elements = (source, convert, resample)
+            for element in elements:
+                self._pipe.add(element)
+
+            source.link(convert)
+            convert.link(resample)
+
+            pad = self._mixer.get_request_pad('sink_%u')
+            resample.get_static_pad('src').link(pad)
+
+            for element in elements:
+                element.sync_state_with_parent()
+
+            self._branches[channel] = (elements, pad)
+
+    def disconnect(self, channel):
+        """Stop mixing the given inter-channel."""
+        with self._lock:
+            branch = self._branches.pop(channel, None)
+            if branch is None:
+                return
+
+            elements, pad = branch
+
+            # Stop the branch before unlinking it
+            for element in elements:
+                element.set_state(Gst.State.NULL)
+
+            elements[-1].get_static_pad('src').unlink(pad)
+            self._mixer.release_request_pad(pad)
+
+            for element in elements:
+                self._pipe.remove(element)
+
+    def connected(self):
+        """Return the number of connected channels."""
+        return len(self._branches)
+
+    def dispose(self):
+        with self._lock:
+            self._branches.clear()
+            self._pipe.set_state(Gst.State.NULL)
+            self._pipe.get_bus().remove_signal_watch()
+
+    def __on_error(self, bus, message):
+        error, debug = message.parse_error()
+        logging.error('GST: OUTPUT-MIXER ({}): {}\n{}'.format(
+            self.device, error, debug))
+
+
+__MIXERS = {}
+__MIXERS_LOCK = Lock()
+
+
+def output_mixer(device):
+    """Return the mixer of the given device, created when first needed.
+
+    :rtype: GstOutputMixer
+    """
+    with __MIXERS_LOCK:
+        mixer = __MIXERS.get(device)
+        if mixer is None:
+            mixer = __MIXERS[device] = GstOutputMixer(device)
+
+        return mixer
+
+
+def dispose_mixers():
+    with __MIXERS_LOCK:
+        for mixer in __MIXERS.values():
+            mixer.dispose()
+
+        __MIXERS.clear()
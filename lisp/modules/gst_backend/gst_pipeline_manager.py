@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import weakref
+from collections import OrderedDict
+from threading import Lock
+
+from lisp.core.configuration import config
+from lisp.core.worker_pool import WorkerPool
+
+
+class GstPipelineManager:
+    """Keep a limited number of media pipelines "warm" (READY or PAUSED).
+
+    Media "touch" the manager every time their pipeline is used (built,
+    armed or played), when the number of warm pipelines exceed the budget,
+    the least recently used are released (set to NULL).
+    Playing, paused and armed media are never released, this way the
+    pipelines near to the current cue (armed by the layout) are kept warm.
+
+    The release is requested by the media (`release_exceeding`) after using
+    the pipeline, and is executed by a worker thread, this way the
+    (blocking) state changes are kept out of the "GO" path.
+    """
+
+    def __init__(self, budget=0):
+        """
+        :param budget: maximum number of warm pipelines (0 means unlimited)
+        """
+        self._budget = budget
+        self._lock = Lock()
+        self._warm = OrderedDict()
+        self._release_scheduled = False
+        self._pool = WorkerPool(1, name='PipelineManager')
+
+        # Statistics
+        self._rebuilds = 0
+        self._avoided = 0
+        self._released = 0
+
+    @property
+    def budget(self):
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget):
+        self._budget = max(0, budget)
+        self.release_exceeding()
+
+    def touch(self, media):
+        """Notify the usage of `media` pipeline, it's now the most recent.
+
+        :type media: lisp.modules.gst_backend.gst_media.GstMedia
+        """
+        key = id(media)
+
+        with self._lock:
+            if key in self._warm:
+                self._avoided += 1
+                self._warm.move_to_end(key)
+            else:
+                self._rebuilds += 1
+                self._warm[key] = weakref.ref(media, self.__collected(key))
+
+    def track(self, media):
+        """Track `media`, if not already, without counting a "use".
+
+        Used when a pipeline become warm again without being used,
+        e.g. an interrupted (released) media is moved to READY.
+        """
+        key = id(media)
+
+        with self._lock:
+            if key not in self._warm:
+                self._warm[key] = weakref.ref(media, self.__collected(key))
+
+    def release_exceeding(self):
+        """Release, in background, the pipelines exceeding the budget."""
+        with self._lock:
+            if (self._release_scheduled or self._budget <= 0 or
+                    len(self._warm) <= self._budget):
+                return
+
+            self._release_scheduled = True
+
+        self._pool.submit(self.__release_exceeding)
+
+    def discard(self, media):
+        """Stop tracking `media`, e.g. because its pipeline is disposed."""
+        with self._lock:
+            self._warm.pop(id(media), None)
+
+    def stats(self):
+        """Return the manager statistics.
+
+        :return: {'budget', 'live', 'rebuilds', 'avoided', 'released'}
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'budget': self._budget,
+                'live': len(self._warm),
+                'rebuilds': self._rebuilds,
+                'avoided': self._avoided,
+                'released': self._released
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._rebuilds = 0
+            self._avoided = 0
+            self._released = 0
+
+    def __release_exceeding(self):
+        with self._lock:
+            self._release_scheduled = False
+
+        self.__release(self.__exceeding())
+
+    def __exceeding(self):
+        """Return the media to release, least recent first."""
+        victims = []
+
+        with self._lock:
+            exceeding = len(self._warm) - self._budget
+            if self._budget > 0 and exceeding > 0:
+                # The most recent is never released, it's going to be used
+                for key, ref in list(self._warm.items())[:-1]:
+                    media = ref()
+                    if media is None:
+                        self._warm.pop(key)
+                        exceeding -= 1
+                    elif media.releasable():
+                        victims.append(media)
+                        exceeding -= 1
+
+                    if exceeding <= 0:
+                        break
+
+        return victims
+
+    def __release(self, victims):
+        # Released outside the lock, media can touch the manager
+        for media in victims:
+            if media.release():
+                with self._lock:
+                    if self._warm.pop(id(media), None) is not None:
+                        self._released += 1
+
+    def __collected(self, key):
+        manager = weakref.ref(self)
+
+        def callback(ref):
+            if manager() is not None:
+                with manager()._lock:
+                    if manager()._warm.get(key) is ref:
+                        manager()._warm.pop(key)
+
+        return callback
+
+
+PipelineManager = GstPipelineManager(config['Gst'].getint('WarmPipelines'))
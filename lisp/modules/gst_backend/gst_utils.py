@@ -17,11 +17,18 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>
 
+import glob
+import json
+import logging
+import os
 from urllib.parse import unquote, quote
 
 from lisp.backend.audio_utils import uri_duration
+from lisp.core.configuration import CFG_DIR
 from lisp.modules.gst_backend.gi_repository import Gst, GstPbutils
 
+GST_CACHE_PATH = os.path.join(CFG_DIR, 'gst_cache.json')
+
 
 def gst_uri_duration(uri):
     # First try to use the base implementation, because it's faster
@@ -44,6 +51,63 @@ def gst_mime_types():
                 yield mime, extensions
 
 
+def gst_registry_files():
+    """Return the paths of the GStreamer registry files (one per arch)."""
+    path = os.environ.get('GST_REGISTRY_1_0', os.environ.get('GST_REGISTRY'))
+    if path is not None:
+        return [path]
+
+    cache_dir = os.environ.get('XDG_CACHE_HOME',
+                               os.path.join(os.path.expanduser('~'), '.cache'))
+    return glob.glob(
+        os.path.join(cache_dir, 'gstreamer-1.0', 'registry.*.bin'))
+
+
+def gst_registry_key():
+    """Return a key that change when GStreamer or its plugins change.
+
+    GStreamer rewrites its registry when the plugins change, the key is
+    based on the registry files mtime and size, and on GStreamer version.
+    """
+    key = [Gst.version_string()]
+
+    for path in sorted(gst_registry_files()):
+        try:
+            stat = os.stat(path)
+            key.append('{}:{}:{}'.format(path, stat.st_mtime, stat.st_size))
+        except OSError:
+            pass
+
+    return '|'.join(key)
+
+
+def gst_cached_mime_types():
+    """Same as `gst_mime_types`, but cached on disk.
+
+    The cache is invalidated when GStreamer, or its plugins, change.
+    """
+    key = gst_registry_key()
+
+    try:
+        with open(GST_CACHE_PATH, mode='r', encoding='utf-8') as file:
+            cache = json.load(file)
+        if cache.get('key') == key:
+            return [tuple(entry) for entry in cache['mime_types']]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    mime_types = [(mime, list(extensions))
+                  for mime, extensions in gst_mime_types()]
+
+    try:
+        with open(GST_CACHE_PATH, mode='w', encoding='utf-8') as file:
+            json.dump({'key': key, 'mime_types': mime_types}, file)
+    except OSError:
+        logging.warning('GST: cannot write the cache ' + GST_CACHE_PATH)
+
+    return mime_types
+
+
 def gst_uri_metadata(uri):
     """Discover media-file metadata using GStreamer."""
     discoverer = GstPbutils.Discoverer()
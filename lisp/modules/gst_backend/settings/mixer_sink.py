@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QGroupBox, QHBoxLayout, QComboBox, QVBoxLayout, \
+    QSpinBox, QLabel
+
+from lisp.modules.gst_backend.elements.mixer_sink import MixerSink
+from lisp.modules.gst_backend.gst_output_mixer import MIXER_SINKS, \
+    GstOutputMixer
+from lisp.ui.settings.settings_page import SettingsPage
+from lisp.ui.ui_utils import translate
+
+
+class MixerSinkSettings(SettingsPage):
+    ELEMENT = MixerSink
+    Name = ELEMENT.Name
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.setLayout(QVBoxLayout())
+        self.layout().setAlignment(Qt.AlignTop)
+
+        self.deviceGroup = QGroupBox(self)
+        self.deviceGroup.setTitle(
+            translate('MixerSinkSettings', 'Shared output'))
+        self.deviceGroup.setLayout(QHBoxLayout())
+        self.layout().addWidget(self.deviceGroup)
+
+        self.device = QComboBox(self.deviceGroup)
+        self.device.addItems(sorted(MIXER_SINKS.keys()))
+        self.device.setCurrentText('auto')
+        self.device.setToolTip(
+            translate('MixerSinkSettings', 'All the cues using the same '
+                                           'output are mixed together'))
+        self.device.currentTextChanged.connect(self.__device_changed)
+        self.deviceGroup.layout().addWidget(self.device)
+
+        # Per-cue JACK connections are not available with the shared output
+        self.jackWarning = QLabel(
+            translate('MixerSinkSettings',
+                      'The cues share the "{}" JACK client, per-cue '
+                      'connections are not available, connect the shared '
+                      'client instead').format(
+                GstOutputMixer.JACK_CLIENT_NAME),
+            self)
+        self.jackWarning.setWordWrap(True)
+        self.jackWarning.setVisible(False)
+        self.layout().addWidget(self.jackWarning)
+
+        self.latencyGroup = QGroupBox(self)
+        self.latencyGroup.setTitle(translate('MixerSinkSettings', 'Latency'))
+        self.latencyGroup.setLayout(QHBoxLayout())
+        self.layout().addWidget(self.latencyGroup)
+
+        self.latencySpin = QSpinBox(self.latencyGroup)
+        self.latencySpin.setRange(5, 200)
+        self.latencySpin.setValue(20)
+        self.latencySpin.setToolTip(
+            translate('MixerSinkSettings', 'Lower values reduce the output '
+                                           'delay but use more CPU, too low '
+                                           'values can cause audio drop-outs'))
+        self.latencyGroup.layout().addWidget(self.latencySpin)
+
+        self.latencyLabel = QLabel(
+            translate('MixerSinkSettings', 'Mixer latency (ms)'),
+            self.latencyGroup)
+        self.latencyLabel.setAlignment(Qt.AlignCenter)
+        self.latencyGroup.layout().addWidget(self.latencyLabel)
+
+    def __device_changed(self, device):
+        self.jackWarning.setVisible(device == 'jack')
+
+    def enable_check(self, enable):
+        self.deviceGroup.setCheckable(enable)
+        self.deviceGroup.setChecked(False)
+
+        self.latencyGroup.setCheckable(enable)
+        self.latencyGroup.setChecked(False)
+
+    def load_settings(self, settings):
+        self.device.setCurrentText(settings.get('device', 'auto'))
+        self.latencySpin.setValue(settings.get('latency', 20))
+
+    def get_settings(self):
+        settings = {}
+
+        if not (self.deviceGroup.isCheckable() and
+                not self.deviceGroup.isChecked()):
+            settings['device'] = self.device.currentText()
+        if not (self.latencyGroup.isCheckable() and
+                not self.latencyGroup.isChecked()):
+            settings['latency'] = self.latencySpin.value()
+
+        return settings
@@ -0,0 +1 @@
+from .latency_monitor import LatencyMonitor
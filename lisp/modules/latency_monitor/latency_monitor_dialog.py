@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTreeWidget, \
+    QTreeWidgetItem, QPushButton, QCheckBox, QDialogButtonBox, QFileDialog, \
+    QHeaderView
+
+from lisp.core.go_latency import GoLatency
+from lisp.ui import elogging
+from lisp.ui.ui_utils import translate
+
+
+class LatencyMonitorDialog(QDialog):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.resize(900, 500)
+        self.setLayout(QVBoxLayout())
+
+        # OPTIONS
+        self.optionsLayout = QHBoxLayout()
+        self.layout().addLayout(self.optionsLayout)
+
+        self.enableCheck = QCheckBox(self)
+        self.enableCheck.setChecked(GoLatency.enabled)
+        self.enableCheck.toggled.connect(GoLatency.enable)
+        self.optionsLayout.addWidget(self.enableCheck)
+        self.optionsLayout.addStretch()
+
+        self.refreshButton = QPushButton(self)
+        self.refreshButton.clicked.connect(self.refresh)
+        self.optionsLayout.addWidget(self.refreshButton)
+
+        self.resetButton = QPushButton(self)
+        self.resetButton.clicked.connect(self.reset)
+        self.optionsLayout.addWidget(self.resetButton)
+
+        # STATISTICS
+        self.statsTree = QTreeWidget(self)
+        self.statsTree.setAlternatingRowColors(True)
+        self.statsTree.setColumnCount(5)
+        self.statsTree.header().setSectionResizeMode(
+            QHeaderView.ResizeToContents)
+        self.layout().addWidget(self.statsTree)
+
+        self.buttons = QDialogButtonBox(self)
+        self.buttons.setStandardButtons(QDialogButtonBox.Close)
+        self.buttons.rejected.connect(self.reject)
+        self.layout().addWidget(self.buttons)
+
+        self.exportButton = self.buttons.addButton(
+            '', QDialogButtonBox.ActionRole)
+        self.exportButton.clicked.connect(self.export)
+
+        self.retranslateUi()
+        self.refresh()
+
+    def retranslateUi(self):
+        self.enableCheck.setText(
+            translate('LatencyMonitor', 'Enable latency tracing'))
+        self.refreshButton.setText(translate('LatencyMonitor', 'Refresh'))
+        self.resetButton.setText(translate('LatencyMonitor', 'Reset'))
+        self.exportButton.setText(translate('LatencyMonitor', 'Export CSV'))
+        self.statsTree.setToolTip(
+            translate('LatencyMonitor', 'Only the cues started (by a GO or '
+                                        'by other means) are measured'))
+        self.statsTree.setHeaderLabels([
+            translate('LatencyMonitor', 'Cue type / Stage'),
+            translate('LatencyMonitor', 'Count'),
+            translate('LatencyMonitor', 'Avg. (ms)'),
+            translate('LatencyMonitor', 'Max (ms)'),
+            translate('LatencyMonitor', 'Histogram')
+        ])
+
+    def refresh(self):
+        self.statsTree.clear()
+
+        report = GoLatency.report()
+        for cue_type in sorted(report):
+            item = QTreeWidgetItem(self.statsTree)
+            item.setText(0, cue_type)
+            item.setExpanded(True)
+
+            for stage in GoLatency.STAGES:
+                stats = report[cue_type].get(stage)
+                if stats is None:
+                    continue
+
+                child = QTreeWidgetItem(item)
+                child.setText(0, stage)
+                child.setText(1, str(stats['count']))
+                child.setText(2, '{:.3f}'.format(
+                    stats['total'] / stats['count'] * 1000))
+                child.setText(3, '{:.3f}'.format(stats['max'] * 1000))
+                child.setText(4, ' '.join(
+                    '{}:{}'.format(bucket, stats['histogram'][bucket])
+                    for bucket in GoLatency.BUCKETS_NAMES
+                    if stats['histogram'][bucket]))
+
+    def reset(self):
+        GoLatency.reset()
+        self.refresh()
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(parent=self, filter='*.csv',
+                                              directory=os.getenv('HOME'))
+        if path:
+            if not path.endswith('.csv'):
+                path += '.csv'
+
+            try:
+                GoLatency.dump_csv(path)
+            except OSError as e:
+                elogging.exception(
+                    translate('LatencyMonitor', 'Cannot export the traces'), e)
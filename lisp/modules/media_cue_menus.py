@@ -25,6 +25,7 @@ from PyQt5.QtWidgets import QFileDialog, QApplication, QMessageBox
 
 from lisp.backend import get_backend
 from lisp.application import Application
+from lisp.core.actions_handler import MainActionsHandler
 from lisp.core.module import Module
 from lisp.cues.cue_factory import CueFactory
 from lisp.ui.mainwindow import MainWindow
@@ -64,10 +65,13 @@ class MediaCueMenus(Module):
         QApplication.setOverrideCursor(QCursor(Qt.WaitCursor))
 
         # Create media cues, and add them to the Application cue_model
-        for file in files:
-            cue = CueFactory.create_cue('URIAudioCue', uri='file://' + file)
-            # Use the filename without extension as cue name
-            cue.name = os.path.splitext(os.path.basename(file))[0]
-            Application().cue_model.add(cue)
+        with MainActionsHandler.transaction(
+                translate('MediaCueMenus', 'Media cues added')):
+            for file in files:
+                cue = CueFactory.create_cue('URIAudioCue',
+                                            uri='file://' + file)
+                # Use the filename without extension as cue name
+                cue.name = os.path.splitext(os.path.basename(file))[0]
+                Application().cue_model.add(cue)
 
         QApplication.restoreOverrideCursor()
@@ -26,6 +26,7 @@ from PyQt5.QtWidgets import QFileDialog
 from PyQt5.QtWidgets import QHBoxLayout
 
 from lisp.application import Application
+from lisp.core.actions_handler import MainActionsHandler
 from lisp.core.util import natural_keys
 from lisp.cues.cue import Cue
 from lisp.cues.cue_factory import CueFactory
@@ -308,8 +309,10 @@ class PresetsDialog(QDialog):
             load_preset_error(e, preset_name, parent=self)
 
     def __cue_from_selected(self):
-        for item in self.presetsList.selectedItems():
-            self.__cue_from_preset(item.text())
+        with MainActionsHandler.transaction(
+                translate('Presets', 'Cues created from presets')):
+            for item in self.presetsList.selectedItems():
+                self.__cue_from_preset(item.text())
 
     def __load_on_selected(self):
         item = self.presetsList.currentItem()
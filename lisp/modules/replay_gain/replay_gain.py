@@ -42,31 +42,22 @@ from .gain_ui import GainUi, GainProgressDialog
 
 
 class GainAction(Action):
-    __slots__ = ('__media_list', '__new_volumes', '__old_volumes')
+    __slots__ = ('__media', '__new_volume', '__old_volume')
 
-    def __init__(self):
-        self.__media_list = []
-        self.__new_volumes = []
-        self.__old_volumes = []
-
-    def add_media(self, media, new_volume):
-        volume = media.element('Volume')
-        if volume is not None:
-            self.__media_list.append(media)
-            self.__new_volumes.append(new_volume)
-            self.__old_volumes.append(volume.normal_volume)
+    def __init__(self, media, new_volume):
+        self.__media = media
+        self.__new_volume = new_volume
+        self.__old_volume = media.element('Volume').normal_volume
 
     def do(self):
-        for n, media in enumerate(self.__media_list):
-            volume = media.element('Volume')
-            if volume is not None:
-                volume.normal_volume = self.__new_volumes[n]
+        volume = self.__media.element('Volume')
+        if volume is not None:
+            volume.normal_volume = self.__new_volume
 
     def undo(self):
-        for n, media in enumerate(self.__media_list):
-            volume = media.element('Volume')
-            if volume is not None:
-                volume.normal_volume = self.__old_volumes[n]
+        volume = self.__media.element('Volume')
+        if volume is not None:
+            volume.normal_volume = self.__old_volume
 
     def redo(self):
         self.do()
@@ -75,6 +66,17 @@ class GainAction(Action):
         return 'Replay gain volume adjusted'
 
 
+def apply_gain(volumes):
+    """Set the given volumes, as a single (undoable) action.
+
+    :param volumes: iterable of (media, volume) pairs
+    """
+    with MainActionsHandler.transaction('Replay gain volume adjusted'):
+        for media, volume in volumes:
+            if media.element('Volume') is not None:
+                MainActionsHandler.do_action(GainAction(media, volume))
+
+
 class GainMainThread(Thread):
     MAX_GAIN = 20  # dB
 
@@ -84,7 +86,7 @@ class GainMainThread(Thread):
 
         self._futures = {}
         self._running = False
-        self._action = GainAction()
+        self._volumes = []
 
         # file -> media {'filename1': [media1, media2], 'filename2': [media3]}
         self.files = files
@@ -94,6 +96,9 @@ class GainMainThread(Thread):
         self.norm_level = norm_level
 
         self.on_progress = Signal()
+        # Emitted with the computed (media, volume) pairs, the gain must be
+        # applied from the main (Qt) thread, as any other undoable action
+        self.on_completed = Signal()
 
     def stop(self):
         self._running = False
@@ -120,12 +125,13 @@ class GainMainThread(Thread):
                     break
 
         if self._running:
-            MainActionsHandler.do_action(self._action)
+            self.on_completed.emit(self._volumes)
         else:
             logging.info('REPLY-GAIN:: Stopped by user')
 
         self.on_progress.emit(-1)
         self.on_progress.disconnect()
+        self.on_completed.disconnect()
 
     def _post_process(self, gained, gain, peak, uri):
         if gained:
@@ -138,7 +144,7 @@ class GainMainThread(Thread):
                 volume = 1 / peak * pow(10, self.norm_level / 20)
 
             for media in self.files[uri]:
-                self._action.add_media(media, volume)
+                self._volumes.append((media, volume))
 
             logging.info('REPLY-GAIN:: completed ' + uri)
         else:
@@ -205,6 +211,8 @@ class ReplayGain(Module):
             self._progress = GainProgressDialog(len(files))
             self._gain_thread.on_progress.connect(self._progress.on_progress,
                                                   mode=Connection.QtQueued)
+            self._gain_thread.on_completed.connect(apply_gain,
+                                                   mode=Connection.QtQueued)
 
             self._progress.show()
             self._gain_thread.start()
@@ -224,10 +232,7 @@ class ReplayGain(Module):
         self._reset(Application().cue_model.filter(MediaCue))
 
     def _reset(self, cues):
-        action = GainAction()
-        for cue in cues:
-            action.add_media(cue.media, 1.0)
-        MainActionsHandler.do_action(action)
+        apply_gain((cue.media, 1.0) for cue in cues)
 
 
 class GstGain:
@@ -0,0 +1 @@
+from .signals_profiler import SignalsProfiler
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt5.QtWidgets import QAction
+
+from lisp.core.module import Module
+from lisp.ui.mainwindow import MainWindow
+from lisp.ui.ui_utils import translate
+from .signals_profiler_dialog import SignalsProfilerDialog
+
+
+class SignalsProfiler(Module):
+    Name = 'Signals Profiler'
+
+    def __init__(self):
+        self.menuAction = QAction(translate('SignalsProfiler',
+                                            'Signals profiler'), MainWindow())
+        self.menuAction.triggered.connect(self.show_dialog)
+
+        MainWindow().menuTools.addAction(self.menuAction)
+
+    def show_dialog(self):
+        dialog = SignalsProfilerDialog(parent=MainWindow())
+        dialog.exec_()
+
+    def terminate(self):
+        MainWindow().menuTools.removeAction(self.menuAction)
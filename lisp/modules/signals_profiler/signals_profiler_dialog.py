@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTreeWidget, \
+    QTreeWidgetItem, QPushButton, QCheckBox, QDialogButtonBox, QFileDialog, \
+    QHeaderView
+
+from lisp.core.signal import Instrumentation
+from lisp.ui import elogging
+from lisp.ui.ui_utils import translate
+
+
+class SignalsProfilerDialog(QDialog):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.resize(900, 500)
+        self.setLayout(QVBoxLayout())
+
+        # OPTIONS
+        self.optionsLayout = QHBoxLayout()
+        self.layout().addLayout(self.optionsLayout)
+
+        self.enableCheck = QCheckBox(self)
+        self.enableCheck.setChecked(Instrumentation.enabled)
+        self.enableCheck.toggled.connect(Instrumentation.enable)
+        self.optionsLayout.addWidget(self.enableCheck)
+        self.optionsLayout.addStretch()
+
+        self.refreshButton = QPushButton(self)
+        self.refreshButton.clicked.connect(self.refresh)
+        self.optionsLayout.addWidget(self.refreshButton)
+
+        self.resetButton = QPushButton(self)
+        self.resetButton.clicked.connect(self.reset)
+        self.optionsLayout.addWidget(self.resetButton)
+
+        # STATISTICS
+        self.statsTree = QTreeWidget(self)
+        self.statsTree.setAlternatingRowColors(True)
+        self.statsTree.setColumnCount(8)
+        self.statsTree.header().setSectionResizeMode(
+            QHeaderView.ResizeToContents)
+        self.layout().addWidget(self.statsTree)
+
+        self.buttons = QDialogButtonBox(self)
+        self.buttons.setStandardButtons(QDialogButtonBox.Close)
+        self.buttons.rejected.connect(self.reject)
+        self.layout().addWidget(self.buttons)
+
+        self.saveButton = self.buttons.addButton(QDialogButtonBox.Save)
+        self.saveButton.clicked.connect(self.save)
+
+        self.retranslateUi()
+        self.refresh()
+
+    def retranslateUi(self):
+        self.enableCheck.setText(
+            translate('SignalsProfiler', 'Enable instrumentation'))
+        self.refreshButton.setText(translate('SignalsProfiler', 'Refresh'))
+        self.resetButton.setText(translate('SignalsProfiler', 'Reset'))
+        self.statsTree.setHeaderLabels([
+            translate('SignalsProfiler', 'Signal / Slot'),
+            translate('SignalsProfiler', 'Mode'),
+            translate('SignalsProfiler', 'Emits / Calls'),
+            translate('SignalsProfiler', 'Slots'),
+            translate('SignalsProfiler', 'Total (ms)'),
+            translate('SignalsProfiler', 'Max (ms)'),
+            translate('SignalsProfiler', 'Histogram'),
+            translate('SignalsProfiler', 'Avg. delivery (ms)')
+        ])
+
+    def refresh(self):
+        self.statsTree.clear()
+
+        report = Instrumentation.report()
+
+        def signal_time(name):
+            return sum(slot['total'] for slot in
+                       report[name]['connections'].values())
+
+        # The "heaviest" signals first
+        for name in sorted(report, key=signal_time, reverse=True):
+            stats = report[name]
+            item = QTreeWidgetItem(self.statsTree)
+            item.setText(0, name)
+            item.setText(2, str(stats['emits']))
+            item.setText(3, str(stats['slots']))
+            item.setText(4, '{:.3f}'.format(signal_time(name) * 1000))
+
+            connections = stats['connections']
+            for slot_name in sorted(connections,
+                                    key=lambda n: connections[n]['total'],
+                                    reverse=True):
+                slot = connections[slot_name]
+                child = QTreeWidgetItem(item)
+                child.setText(0, slot_name)
+                child.setText(1, slot['mode'])
+                child.setText(2, str(slot['calls']))
+                child.setText(4, '{:.3f}'.format(slot['total'] * 1000))
+                child.setText(5, '{:.3f}'.format(slot['max'] * 1000))
+                child.setText(6, ' '.join(
+                    '{}:{}'.format(bucket, slot['histogram'][bucket])
+                    for bucket in Instrumentation.BUCKETS_NAMES
+                    if slot['histogram'][bucket]))
+
+                if slot['deliveries']:
+                    child.setText(7, '{:.3f}'.format(
+                        slot['delivery_total'] / slot['deliveries'] * 1000))
+
+    def reset(self):
+        Instrumentation.reset()
+        self.refresh()
+
+    def save(self):
+        path, _ = QFileDialog.getSaveFileName(parent=self, filter='*.json',
+                                              directory=os.getenv('HOME'))
+        if path:
+            if not path.endswith('.json'):
+                path += '.json'
+
+            try:
+                Instrumentation.dump(path)
+            except OSError as e:
+                elogging.exception(
+                    translate('SignalsProfiler', 'Cannot save the report'), e)
@@ -17,8 +17,8 @@
 # You should have received a copy of the GNU General Public License
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
-import json
-
+from lisp.core.session_file import read_session, write_session, \
+    is_compressed
 from lisp.modules.uri_changer.json_utils import json_deep_search, \
     json_deep_replace
 
@@ -28,14 +28,15 @@ class Session:
     def __init__(self, file):
         self.file = file
         self.session = {}
+        self.compressed = False
         self.prefixes = set()
 
         self.load()
 
     def load(self):
         # Read the file content
-        with open(self.file, mode='r', encoding='utf-8') as file:
-            self.session = json.load(file)
+        self.compressed = is_compressed(self.file)
+        self.session = read_session(self.file)
 
     def analyze(self):
         self.prefixes = set()
@@ -59,5 +60,5 @@ class Session:
         json_deep_replace(self.session, 'uri', replace)
 
     def save(self, file):
-        with open(file, mode='w', encoding='utf-8') as new_file:
-            new_file.write(json.dumps(self.session, sort_keys=True, indent=4))
+        # Keep the format of the original file
+        write_session(file, self.session, compressed=self.compressed)
@@ -19,20 +19,100 @@
 
 import os
 
-from lisp.core.loading import load_classes
+from PyQt5.QtWidgets import QAction
+
+from lisp.core.configuration import config, CFG_DIR
+from lisp.core.manifest import DeferredLoader, Manifest
+from lisp.cues.cue import Cue
+from lisp.layouts.cue_layout import CueLayout
 from lisp.ui import elogging
+from lisp.ui.mainwindow import MainWindow
+from lisp.ui.settings.app_settings import AppSettings
+from lisp.ui.settings.cue_settings import CueSettingsRegistry
 
 __PLUGINS = {}
+# True when the plugins are initialized for the current session
+__INITIALIZED = False
+
+
+def __create(name, plugin):
+    try:
+        __PLUGINS[name] = plugin()
+        elogging.debug('PLUGINS: Loaded "{0}"'.format(name))
+    except Exception as e:
+        elogging.exception('PLUGINS: Failed "{0}" load'.format(name), e)
+        return False
+
+    # Loaded on demand, when the session is already initialized
+    if __INITIALIZED:
+        return __init_plugin(name)
+
+    return True
+
+
+def __init_plugin(name):
+    try:
+        __PLUGINS[name].init()
+        elogging.debug('PLUGINS: Initialized "{0}"'.format(name))
+        return True
+    except Exception as e:
+        __PLUGINS.pop(name)
+        elogging.exception('PLUGINS: Failed "{0}" init'.format(name), e)
+        return False
+
+
+def __cue_settings_pages():
+    registry = CueSettingsRegistry()
+    return [page.__name__ for ref_class in list(registry.ref_classes())
+            for page in registry.filter(ref_class)]
+
+
+def __cue_menu_entries():
+    registry = CueLayout.cm_registry
+    return [item.text() if isinstance(item, QAction) else item.title()
+            for ref_class in list(registry.ref_classes())
+            for item in registry.filter(ref_class)
+            if not (isinstance(item, QAction) and item.isSeparator())]
+
+
+__LOADER = DeferredLoader(
+    __package__, os.path.dirname(__file__),
+    Manifest(os.path.join(CFG_DIR, 'plugins_manifest.json')),
+    __create,
+    probes={
+        'cue_properties': lambda: Cue.properties_defaults().keys(),
+        'settings': lambda: [w.__name__ for w in AppSettings.SettingsWidgets],
+        'cue_settings': lambda: __cue_settings_pages(),
+        'cue_menus': lambda: __cue_menu_entries(),
+        'menus': lambda: [a.text() for a in MainWindow().menus_actions()],
+        'shortcuts': lambda: [a.shortcut().toString()
+                              for a in MainWindow().menus_actions()
+                              if not a.shortcut().isEmpty()]
+    },
+    # Shortcuts are available only when the modules are loaded
+    eager=('shortcuts', ),
+    deferred=config['Modules'].getboolean('Deferred'))
 
 
 def load_plugins():
-    """Load available plugins."""
-    for name, plugin in load_classes(__package__, os.path.dirname(__file__)):
-        try:
-            __PLUGINS[name] = plugin()
-            elogging.debug('PLUGINS: Loaded "{0}"'.format(name))
-        except Exception as e:
-            elogging.exception('PLUGINS: Failed "{0}" load'.format(name), e)
+    """Load available plugins, the ones in the manifest are loaded when needed.
+
+    Deferred plugins are loaded when one of the features they provide is
+    required, e.g. a cue property used in the session, a menu or a settings
+    page (see `require`), and initialized if a session already exists.
+    """
+    __LOADER.load()
+
+
+def require(feature, names=None):
+    """Load the deferred plugins providing the given feature.
+
+    :param feature: one of "cue_properties", "settings", "cue_settings",
+                    "cue_menus" or "menus"
+    :param names: the needed names, if None any plugin providing the
+                  feature is loaded
+    """
+    __LOADER.require(feature, names)
 
 
 def translations():
@@ -44,22 +124,19 @@ def translations():
 
 
 def init_plugins():
-    """Initialize all the plugins."""
-    failed = []
-    for plugin in __PLUGINS:
-        try:
-            __PLUGINS[plugin].init()
-            elogging.debug('PLUGINS: Initialized "{0}"'.format(plugin))
-        except Exception as e:
-            failed.append(plugin)
-            elogging.exception('PLUGINS: Failed "{0}" init'.format(plugin), e)
+    """Initialize all the (loaded) plugins."""
+    global __INITIALIZED
+    __INITIALIZED = True
 
-    for plugin in failed:
-        __PLUGINS.pop(plugin)
+    for plugin in list(__PLUGINS):
+        __init_plugin(plugin)
 
 
 def reset_plugins():
     """Resets all the plugins."""
+    global __INITIALIZED
+    __INITIALIZED = False
+
     for plugin in __PLUGINS:
         try:
             __PLUGINS[plugin].reset()
@@ -69,6 +146,10 @@ def reset_plugins():
 
 
 def set_plugins_settings(settings):
+    # The plugins with saved settings are needed
+    for name in settings:
+        __LOADER.require_class(name)
+
     for plugin in __PLUGINS.values():
         if plugin.Name in settings:
             try:
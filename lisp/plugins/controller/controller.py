@@ -41,6 +41,7 @@ class Controller(Plugin):
 
         # Listen cue_model changes
         Application().cue_model.item_added.connect(self.__cue_added)
+        Application().cue_model.items_added.connect(self.__cues_added)
         Application().cue_model.item_removed.connect(self.__cue_removed)
 
         # Register settings-page
@@ -52,6 +53,9 @@ class Controller(Plugin):
         for protocol in self.__protocols.values():
             protocol.init()
 
+        # Cues added before the plugin is loaded (loaded on demand)
+        self.__cues_added(Application().cue_model)
+
     def reset(self):
         self.__map.clear()
         self.__actions_map.clear()
@@ -59,18 +63,21 @@ class Controller(Plugin):
         for protocol in self.__protocols.values():
             protocol.reset()
 
-    def cue_changed(self, cue, property_name, value):
-        if property_name == 'controller':
+    def cue_changed(self, cue, properties):
+        if 'controller' in properties:
             self.delete_from_map(cue)
 
             for protocol in self.__protocols:
-                for key, action in value.get(protocol, []):
+                for key, action in properties['controller'].get(protocol, []):
                     if key not in self.__map:
                         self.__map[key] = set()
 
                     self.__map[key].add(cue)
                     self.__actions_map[(key, cue)] = CueAction(action)
 
+    def __cue_property_changed(self, cue, property_name, value):
+        self.cue_changed(cue, {property_name: value})
+
     def delete_from_map(self, cue):
         for key in self.__map:
             self.__map[key].discard(cue)
@@ -81,11 +88,17 @@ class Controller(Plugin):
             cue.execute(self.__actions_map[(key, cue)])
 
     def __cue_added(self, cue):
-        cue.property_changed.connect(self.cue_changed)
-        self.cue_changed(cue, 'controller', cue.controller)
+        cue.property_changed.connect(self.__cue_property_changed)
+        cue.properties_changed.connect(self.cue_changed)
+        self.cue_changed(cue, {'controller': cue.controller})
+
+    def __cues_added(self, cues):
+        for cue in cues:
+            self.__cue_added(cue)
 
     def __cue_removed(self, cue):
-        cue.property_changed.disconnect(self.cue_changed)
+        cue.property_changed.disconnect(self.__cue_property_changed)
+        cue.properties_changed.disconnect(self.cue_changed)
         self.delete_from_map(cue)
 
     def __load_protocols(self):
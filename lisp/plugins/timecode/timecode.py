@@ -169,6 +169,7 @@ class Timecode(Plugin):
 
         # Watch cue-model changes
         Application().cue_model.item_added.connect(self.__cue_added)
+        Application().cue_model.items_added.connect(self.__cues_added)
         Application().cue_model.item_removed.connect(self.__cue_removed)
 
     def init(self):
@@ -177,22 +178,33 @@ class Timecode(Plugin):
         elif not self.__client.status():
             logging.info('TIMECODE: disabled, OLA not running')
 
+        # Cues added before the plugin is loaded (loaded on demand)
+        self.__cues_added(Application().cue_model)
+
     def reset(self):
         self.__cues.clear()
         self.__client.stop_timecode(rclient=True, rcue=True)
 
-    def __cue_changed(self, cue, property_name, value):
-        if property_name == 'timecode':
-            if value.get('enabled', False):
+    def __cue_changed(self, cue, properties):
+        if 'timecode' in properties:
+            if properties['timecode'].get('enabled', False):
                 if cue.id not in self.__cues:
                     self.__cues.add(cue.id)
                     cue.started.connect(self.__cue_started, Connection.QtQueued)
             else:
                 self.__cue_removed(cue)
 
+    def __cue_property_changed(self, cue, property_name, value):
+        self.__cue_changed(cue, {property_name: value})
+
     def __cue_added(self, cue):
-        cue.property_changed.connect(self.__cue_changed)
-        self.__cue_changed(cue, 'timecode', cue.timecode)
+        cue.property_changed.connect(self.__cue_property_changed)
+        cue.properties_changed.connect(self.__cue_changed)
+        self.__cue_changed(cue, {'timecode': cue.timecode})
+
+    def __cues_added(self, cues):
+        for cue in cues:
+            self.__cue_added(cue)
 
     def __cue_removed(self, cue):
         try:
@@ -201,7 +213,8 @@ class Timecode(Plugin):
                 self.__client.stop_timecode(rcue=True)
 
             cue.started.disconnect(self.__cue_started)
-            cue.property_changed.disconnect(self.__cue_changed)
+            cue.property_changed.disconnect(self.__cue_property_changed)
+            cue.properties_changed.disconnect(self.__cue_changed)
         except KeyError:
             pass
 
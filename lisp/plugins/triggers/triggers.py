@@ -41,22 +41,36 @@ class Triggers(Plugin):
         CueSettingsRegistry().add_item(TriggersSettings)
 
         Application().cue_model.item_added.connect(self.__cue_added)
+        Application().cue_model.items_added.connect(self.__cues_added)
         Application().cue_model.item_removed.connect(self.__cue_removed)
 
+    def init(self):
+        # Cues added before the plugin is loaded (loaded on demand)
+        self.__cues_added(Application().cue_model)
+
     def reset(self):
         self.__handlers.clear()
 
-    def __cue_changed(self, cue, property_name, value):
-        if property_name == 'triggers':
+    def __cue_changed(self, cue, properties):
+        if 'triggers' in properties:
             if cue.id in self.__handlers:
                 self.__handlers[cue.id].triggers = cue.triggers
             else:
                 self.__handlers[cue.id] = CueHandler(cue, cue.triggers)
 
+    def __cue_property_changed(self, cue, property_name, value):
+        self.__cue_changed(cue, {property_name: value})
+
     def __cue_added(self, cue):
-        cue.property_changed.connect(self.__cue_changed)
-        self.__cue_changed(cue, 'triggers', cue.triggers)
+        cue.property_changed.connect(self.__cue_property_changed)
+        cue.properties_changed.connect(self.__cue_changed)
+        self.__cue_changed(cue, {'triggers': cue.triggers})
+
+    def __cues_added(self, cues):
+        for cue in cues:
+            self.__cue_added(cue)
 
     def __cue_removed(self, cue):
-        cue.property_changed.disconnect(self.__cue_changed)
+        cue.property_changed.disconnect(self.__cue_property_changed)
+        cue.properties_changed.disconnect(self.__cue_changed)
         self.__handlers.pop(cue.id, None)
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import logging
+import os
+import traceback
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+from weakref import WeakKeyDictionary
+
+from lisp.cues.media_cue import MediaCue
+
+
+def journal_path(session_file):
+    return session_file + '.journal'
+
+
+def replay_journal(session, session_file):
+    """Apply the journal of `session_file` (if any) to the given session.
+
+    A partially written record (e.g. after a crash) ends the replay.
+
+    :return: the number of applied records
+    :rtype: int
+    """
+    path = journal_path(session_file)
+    if not os.path.exists(path):
+        return 0
+
+    cues = OrderedDict((cue['id'], cue) for cue in session['cues'])
+    count = 0
+
+    with open(path, mode='r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+
+            if 'add' in record:
+                cues[record['add']['id']] = record['add']
+            elif 'remove' in record:
+                cues.pop(record['remove'], None)
+            elif 'set' in record:
+                if record['set'] in cues:
+                    _merge(cues[record['set']], record['properties'])
+            elif 'shift' in record:
+                _shift(cues.values(), *record['shift'])
+            elif 'indices' in record:
+                for cue_id, index in record['indices'].items():
+                    if cue_id in cues:
+                        cues[cue_id]['index'] = index
+
+            count += 1
+
+    session['cues'] = sorted(cues.values(), key=lambda c: c.get('index', -1))
+    return count
+
+
+def _shift(cues, start, stop, delta):
+    for cue in cues:
+        index = cue.get('index', -1)
+        if index >= start and (stop == -1 or index < stop):
+            cue['index'] = index + delta
+
+
+def _merge(target, source):
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+class SessionJournal:
+    """Append the changes of the session to a journal, next to its file.
+
+    The added/removed cues and the changes of cues, media and elements
+    properties are appended as small JSON records (one per line). Records
+    are written, and synced to disk, in batches every `interval` seconds.
+
+    The journal is compacted (emptied) when the session is saved, and
+    replayed (see `replay_journal`) when the session is opened again.
+
+    ..note::
+        Cues positions can be updated without notifications (see
+        CueListModel), the shifts notified by the layout `model_adapter`
+        are recorded instead, this way the cost of every record is
+        independent from the size of the session.
+    """
+
+    def __init__(self, session_file, cue_model, model_adapter, interval=1):
+        self.path = journal_path(session_file)
+        self.cue_model = cue_model
+        self.model_adapter = model_adapter
+        self.interval = interval
+
+        self._lock = Lock()
+        self._file_lock = Lock()
+        self._buffer = []
+        self._closed = False
+        self._wake = Event()
+
+        # {media: cue_id}, {element: (cue_id, element_name)}
+        self._media = WeakKeyDictionary()
+        self._elements = WeakKeyDictionary()
+
+        self.cue_model.item_added.connect(self.__cue_added)
+        self.cue_model.items_added.connect(self.__cues_added)
+        self.cue_model.item_removed.connect(self.__cue_removed)
+        self.model_adapter.positions_shifted.connect(self.__shifted)
+        self.model_adapter.item_moved.connect(self.__cue_moved)
+
+        for cue in self.cue_model:
+            self.__track(cue)
+
+        Thread(target=self.__writer, daemon=True,
+               name='SessionJournal').start()
+
+    def compact(self):
+        """Empty the journal, to be called after the session is saved."""
+        with self._file_lock:
+            with self._lock:
+                self._buffer.clear()
+
+            if os.path.exists(self.path):
+                open(self.path, mode='w').close()
+
+    def discard(self):
+        """Stop recording and remove the journal."""
+        self.close()
+
+        with self._file_lock:
+            with self._lock:
+                self._buffer.clear()
+
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def close(self):
+        """Stop recording, the pending records are written."""
+        if self._closed:
+            return
+
+        self.cue_model.item_added.disconnect(self.__cue_added)
+        self.cue_model.items_added.disconnect(self.__cues_added)
+        self.cue_model.item_removed.disconnect(self.__cue_removed)
+        self.model_adapter.positions_shifted.disconnect(self.__shifted)
+        self.model_adapter.item_moved.disconnect(self.__cue_moved)
+
+        for cue in self.cue_model:
+            self.__untrack(cue)
+
+        self._closed = True
+        self._wake.set()
+
+    def __record(self, record):
+        # Serialized now, the record can contain "live" (mutable) values
+        try:
+            line = json.dumps(record, sort_keys=True)
+        except Exception:
+            logging.warning('JOURNAL: cannot record {}'.format(record))
+            return
+
+        with self._lock:
+            if not self._closed:
+                self._buffer.append(line)
+
+    def __track(self, cue):
+        cue.property_changed.connect(self.__property_changed)
+        cue.properties_changed.connect(self.__cue_changed)
+
+        if isinstance(cue, MediaCue):
+            self._media[cue.media] = cue.id
+            cue.media.property_changed.connect(self.__property_changed)
+            cue.media.properties_changed.connect(self.__media_changed)
+            cue.media.elements_changed.connect(self.__elements_changed)
+            self.__elements_changed(cue.media)
+
+    def __untrack(self, cue):
+        cue.property_changed.disconnect(self.__property_changed)
+        cue.properties_changed.disconnect(self.__cue_changed)
+
+        if isinstance(cue, MediaCue):
+            self._media.pop(cue.media, None)
+            cue.media.property_changed.disconnect(self.__property_changed)
+            cue.media.properties_changed.disconnect(self.__media_changed)
+            cue.media.elements_changed.disconnect(self.__elements_changed)
+            for element in cue.media.elements():
+                self._elements.pop(element, None)
+                element.property_changed.disconnect(self.__property_changed)
+                element.properties_changed.disconnect(self.__element_changed)
+
+    def __cue_added(self, cue):
+        self.__cues_added((cue, ))
+
+    def __cues_added(self, cues):
+        for cue in cues:
+            self.__track(cue)
+            self.__record({'add': cue.properties(only_changed=True)})
+
+    def __cue_removed(self, cue):
+        self.__untrack(cue)
+        self.__record({'remove': cue.id})
+
+    def __shifted(self, start, stop, delta):
+        self.__record({'shift': [start, stop, delta]})
+
+    def __cue_moved(self, old_index, new_index):
+        # The moved cue position is updated silently as well
+        cue = self.model_adapter.item(new_index)
+        self.__record({'indices': {cue.id: new_index}})
+
+    def __property_changed(self, instance, name, value):
+        # A single change (outside a batch) of a cue, media or element
+        if instance in self._elements:
+            self.__element_changed(instance, {name: value})
+        elif instance in self._media:
+            self.__media_changed(instance, {name: value})
+        else:
+            self.__cue_changed(instance, {name: value})
+
+    def __cue_changed(self, cue, changes):
+        self.__record({'set': cue.id, 'properties': changes})
+
+    def __media_changed(self, media, changes):
+        cue_id = self._media.get(media)
+        if cue_id is not None:
+            self.__record({'set': cue_id, 'properties': {'_media_': changes}})
+
+    def __elements_changed(self, media):
+        cue_id = self._media.get(media)
+        if cue_id is not None:
+            for element in media.elements():
+                if element not in self._elements:
+                    self._elements[element] = (cue_id, type(element).__name__)
+                    element.property_changed.connect(self.__property_changed)
+                    element.properties_changed.connect(self.__element_changed)
+
+    def __element_changed(self, element, changes):
+        cue_id, element_name = self._elements.get(element, (None, None))
+        if cue_id is not None:
+            self.__record({'set': cue_id, 'properties': {
+                '_media_': {'elements': {element_name: changes}}}})
+
+    def __writer(self):
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+            # An error must not stop the journaling
+            try:
+                self.__write()
+            except Exception:
+                logging.error(traceback.format_exc())
+
+    def __write(self):
+        # Records are buffered while the file is written
+        with self._file_lock:
+            with self._lock:
+                lines, self._buffer = self._buffer, []
+
+            if lines:
+                with open(self.path, mode='a', encoding='utf-8') as file:
+                    file.write('\n'.join(lines) + '\n')
+                    file.flush()
+                    os.fsync(file.fileno())
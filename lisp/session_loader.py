@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from threading import Thread
+
+from PyQt5.QtCore import QTimer
+
+from lisp import modules, plugins
+from lisp.core.actions_handler import MainActionsHandler
+from lisp.core.session_file import read_session
+from lisp.core.signal import Signal, Connection
+from lisp.cues.cue_factory import CueFactory
+from lisp.session_journal import replay_journal
+from lisp.ui import elogging
+
+class SessionLoader:
+    """Load a session file in background.
+
+    The file is read by a worker thread, then the cues are built (and their
+    properties applied) and added to the model in the Qt thread, in session
+    order, in chunks between the iterations of the event-loop. This way the
+    UI remains responsive and the first cues can be used while the others
+    are loading.
+
+    .. Usage::
+
+        loader = SessionLoader(session_file, cue_model)
+        loader.parsed.connect(init_session)
+        loader.finished.connect(session_loaded)
+        loader.start()
+    """
+
+    # Maximum number of cues built, and added to the model, in a single chunk
+    ChunkSize = 50
+
+    def __init__(self, session_file, cue_model):
+        self.session_file = session_file
+        self.cue_model = cue_model
+
+        self.parsed = Signal()
+        """Emitted, in the Qt thread, when the file is parsed
+        (loader, session)"""
+        self.progress = Signal()
+        """Emitted after every chunk of cues (loaded, total)"""
+        self.finished = Signal()
+        """Emitted at the end of the loading (loader, completed)"""
+        self.failed = Signal()
+        """Emitted when the file cannot be read (loader, exception)"""
+
+        self._descriptors = []
+        self._next = 0
+        self._total = 0
+        self._done = False
+        self._cancelled = False
+        # Number of changes recovered from the session journal
+        self.recovered = 0
+
+        # Used to move the results from the reader to the Qt thread
+        self.__read_done = Signal()
+        self.__read_done.connect(self.__parsed, Connection.QtQueued)
+        self.__read_fail = Signal()
+        self.__read_fail.connect(self.__failed, Connection.QtQueued)
+
+    @property
+    def total(self):
+        """The number of cues in the session"""
+        return self._total
+
+    def start(self):
+        Thread(target=self.__read, daemon=True, name='SessionLoader').start()
+
+    def cancel(self):
+        """Stop the loading, the already loaded cues are kept."""
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def __read(self):
+        try:
+            session = read_session(self.session_file)
+            self.recovered = replay_journal(session, self.session_file)
+
+            self._descriptors = session.pop('cues')
+            self._total = len(self._descriptors)
+        except Exception as e:
+            self.__read_fail.emit(e)
+            return
+
+        self.__read_done.emit(session)
+
+    def __parsed(self, session):
+        if self._cancelled:
+            self.__finish(False)
+            return
+
+        self.parsed.emit(self, session)
+
+        # Load the (deferred) modules and plugins providing the session cues
+        # types and properties
+        modules.require_cue_types(
+            set(cue.get('_type_') for cue in self._descriptors))
+        plugins.require(
+            'cue_properties',
+            set(name for cue in self._descriptors for name in cue))
+
+        self.__add_chunk()
+
+    def __failed(self, exception):
+        self.failed.emit(self, exception)
+
+    def __add_chunk(self):
+        if self._done:
+            return
+        if self._cancelled:
+            self.__finish(False)
+            return
+
+        # Build the next cues, in session order
+        cues = []
+        while self._next < self._total and len(cues) < self.ChunkSize:
+            cue_conf = self._descriptors[self._next]
+            self._descriptors[self._next] = None
+            self._next += 1
+
+            try:
+                cue_type = cue_conf.pop('_type_', 'Undefined')
+                cue = CueFactory.create_cue(cue_type, cue_id=cue_conf.pop('id'))
+                cue.update_properties(cue_conf)
+                cues.append(cue)
+            except Exception as e:
+                elogging.exception('Unable to create the cue', e)
+
+        try:
+            if cues:
+                self.__add_cues(cues)
+                self.progress.emit(self._next, self._total)
+        finally:
+            # Also after an error, the loading must proceed (and end)
+            if self._next >= self._total:
+                self.__finish(True)
+            else:
+                QTimer.singleShot(0, self.__add_chunk)
+
+    def __add_cues(self, cues):
+        # Loading a session cannot be undone
+        with MainActionsHandler.suspended():
+            try:
+                self.cue_model.add_many(cues)
+            except ValueError:
+                # Some cue is invalid (e.g. duplicated id), nothing has been
+                # added, add the cues one by one, skipping the invalid ones
+                for cue in cues:
+                    try:
+                        self.cue_model.add(cue)
+                    except Exception as e:
+                        elogging.exception('Unable to add the cue', e)
+
+    def __finish(self, completed):
+        if not self._done:
+            self._done = True
+            self.finished.emit(self, completed)
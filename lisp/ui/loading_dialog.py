@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QProgressDialog
+
+from lisp.ui.ui_utils import translate
+
+
+class LoadingDialog(QProgressDialog):
+    """Non-modal progress dialog for the session loading."""
+
+    def __init__(self, loader, parent=None):
+        """
+        :type loader: lisp.session_loader.SessionLoader
+        """
+        super().__init__(parent)
+        self._loader = loader
+
+        self.setWindowModality(Qt.NonModal)
+        self.setWindowTitle(translate('SessionLoading', 'Loading session'))
+        self.setLabelText(translate('SessionLoading', 'Reading the file ...'))
+        self.setCancelButtonText(translate('SessionLoading', 'Cancel'))
+        self.setMinimumWidth(320)
+        # Show the dialog only for "long" loadings
+        self.setMinimumDuration(500)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        # Undefined range (busy indicator) until the file is read
+        self.setRange(0, 0)
+
+        self.canceled.connect(self._loader.cancel)
+        self._loader.progress.connect(self.on_progress)
+        self._loader.finished.connect(self.on_finished)
+        self._loader.failed.connect(self.on_finished)
+
+    def on_progress(self, loaded, total):
+        self.setMaximum(total)
+        self.setValue(loaded)
+        self.setLabelText(
+            translate('SessionLoading', 'Loading cues: {} / {}').format(
+                loaded, total))
+
+    def on_finished(self, *args):
+        self.close()
+        self.deleteLater()
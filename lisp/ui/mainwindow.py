@@ -37,6 +37,7 @@ from lisp.ui.ui_utils import translate
 class MainWindow(QMainWindow, metaclass=QSingleton):
     new_session = pyqtSignal()
     save_session = pyqtSignal(str)
+    export_session = pyqtSignal(str)
     open_session = pyqtSignal(str)
 
     def __init__(self):
@@ -75,6 +76,10 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
 
         self.setMenuBar(self.menubar)
 
+        # The menus entries of deferred modules/plugins are added when needed
+        self.menuEdit.aboutToShow.connect(self._require_menus)
+        self.menuTools.aboutToShow.connect(self._require_menus)
+
         # menuFile
         self.newSessionAction = QAction(self)
         self.newSessionAction.triggered.connect(self._new_session)
@@ -84,6 +89,8 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
         self.saveSessionAction.triggered.connect(self._save)
         self.saveSessionWithName = QAction(self)
         self.saveSessionWithName.triggered.connect(self._save_with_name)
+        self.exportSessionAction = QAction(self)
+        self.exportSessionAction.triggered.connect(self._export)
         self.editPreferences = QAction(self)
         self.editPreferences.triggered.connect(self._show_preferences)
         self.fullScreenAction = QAction(self)
@@ -97,6 +104,7 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.saveSessionAction)
         self.menuFile.addAction(self.saveSessionWithName)
+        self.menuFile.addAction(self.exportSessionAction)
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.editPreferences)
         self.menuFile.addSeparator()
@@ -156,6 +164,8 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
         self.editPreferences.setShortcut(QKeySequence.Preferences)
         self.saveSessionWithName.setText(translate('MainWindow', 'Save as'))
         self.saveSessionWithName.setShortcut(QKeySequence.SaveAs)
+        self.exportSessionAction.setText(
+            translate('MainWindow', 'Export (uncompressed)'))
         self.fullScreenAction.setText(translate('MainWindow', 'Full Screen'))
         self.fullScreenAction.setShortcut(QKeySequence.FullScreen)
         self.exitAction.setText(translate('MainWindow', 'Exit'))
@@ -237,6 +247,19 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
         else:
             self.menuEdit.insertAction(self.cueSeparator, action)
 
+    def menus_actions(self):
+        """Return the actions of the menus, sub-menus included."""
+        actions = []
+        menus = [self.menubar]
+        while menus:
+            for action in menus.pop().actions():
+                if action.menu() is not None:
+                    menus.append(action.menu())
+                elif not action.isSeparator():
+                    actions.append(action)
+
+        return actions
+
     def update_window_title(self):
         saved = MainActionsHandler.is_saved()
         if not saved and not self.windowTitle()[0] == '*':
@@ -274,13 +297,37 @@ class MainWindow(QMainWindow, metaclass=QSingleton):
             self.filename = filename
             self._save()
 
+    def _export(self):
+        filename, _ = QFileDialog.getSaveFileName(parent=self,
+                                                  filter='*.lsp',
+                                                  directory=os.getenv('HOME'))
+        if filename != '':
+            if not filename.endswith('.lsp'):
+                filename += '.lsp'
+            self.export_session.emit(filename)
+
     def _show_preferences(self):
+        # Imported here, modules and plugins import this module
+        from lisp import modules, plugins
+
+        # All the settings pages are needed
+        modules.require('settings')
+        plugins.require('settings')
+
         prefUi = AppSettings(configuration.config_to_dict(), parent=self)
         prefUi.exec_()
 
         if prefUi.result() == QDialog.Accepted:
             configuration.update_config_from_dict(prefUi.get_configuraton())
 
+    @staticmethod
+    def _require_menus():
+        # Imported here, modules and plugins import this module
+        from lisp import modules, plugins
+
+        modules.require('menus')
+        plugins.require('menus')
+
     def _load_from_file(self):
         if self._check_saved():
             path, _ = QFileDialog.getOpenFileName(self, filter='*.lsp',
@@ -59,6 +59,13 @@ class CueSettings(QDialog):
         """
         super().__init__(**kwargs)
 
+        # Imported here, modules and plugins import this module
+        from lisp import modules, plugins
+
+        # Add the pages of the deferred modules/plugins
+        modules.require('cue_settings')
+        plugins.require('cue_settings')
+
         if cue is not None:
             cue_class = cue.__class__
             cue_properties = deepcopy(cue.properties())
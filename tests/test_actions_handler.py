@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from threading import Thread
+
+from lisp.core.action import Action, CompoundAction
+from lisp.core.actions_handler import ActionsHandler
+
+
+class CountAction(Action):
+    def __init__(self):
+        self.done = 0
+
+    def do(self):
+        self.done += 1
+
+
+class ActionsHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = ActionsHandler()
+
+    def _do_in_thread(self, action):
+        thread = Thread(target=self.handler.do_action, args=(action,))
+        thread.start()
+        thread.join()
+
+    def test_transaction(self):
+        with self.handler.transaction('Test'):
+            self.handler.do_action(CountAction())
+            self.handler.do_action(CountAction())
+
+        self.assertEqual(len(self.handler._undo), 1)
+        self.assertIsInstance(self.handler._undo[0], CompoundAction)
+
+    def test_transaction_other_thread(self):
+        inner = CountAction()
+        other = CountAction()
+
+        with self.handler.transaction('Test'):
+            self.handler.do_action(inner)
+            # Done by another thread, must not be part of the transaction
+            self._do_in_thread(other)
+
+        self.assertEqual(len(self.handler._undo), 2)
+        self.assertIs(self.handler._undo[0], other)
+        self.assertIsInstance(self.handler._undo[1], CompoundAction)
+
+    def test_suspended_other_thread(self):
+        other = CountAction()
+
+        with self.handler.suspended():
+            self.handler.do_action(CountAction())
+            self._do_in_thread(other)
+
+        self.assertEqual(list(self.handler._undo), [other])
+        self.assertEqual(other.done, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+import unittest
+from unittest import mock
+
+try:
+    from lisp.modules.gst_backend.gi_repository import Gst
+    Gst.init(None)
+except Exception:
+    Gst = None
+
+
+@unittest.skipIf(Gst is None, 'GStreamer is not available')
+class LazyPipelineTest(unittest.TestCase):
+
+    def setUp(self):
+        from lisp.core.configuration import config
+        from lisp.modules.gst_backend import elements
+
+        elements.load()
+        self._lazy = config['Gst']['LazyPipeline']
+        config['Gst']['LazyPipeline'] = 'True'
+
+    def tearDown(self):
+        from lisp.core.configuration import config
+        config['Gst']['LazyPipeline'] = self._lazy
+
+    def test_lazy_cue_duration(self):
+        from lisp.modules.gst_backend.gst_cue_factories import uri_audio
+
+        with mock.patch('lisp.modules.gst_backend.gst_media.gst_uri_duration',
+                        return_value=4242):
+            cue = uri_audio(uri='http://localhost/track.wav')
+
+            deadline = time.monotonic() + 5
+            while cue.duration != 4242 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        # The duration is known, but the pipeline is not built
+        self.assertEqual(cue.duration, 4242)
+        self.assertEqual(cue.media.elements(), [])
+        self.assertEqual(cue.media.input_uri(), 'http://localhost/track.wav')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from lisp.core.has_properties import HasProperties, Property
+
+
+class Model(HasProperties):
+    i = Property(default=0)
+    l = Property(default=[])
+
+
+class ChangedPropertiesTest(unittest.TestCase):
+
+    def test_unchanged(self):
+        self.assertEqual(Model().properties(only_changed=True), {})
+
+    def test_immutable_reset(self):
+        model = Model()
+        model.i = 1
+        model.i = 0
+
+        self.assertEqual(model.properties(only_changed=True), {})
+
+    def test_mutable_in_place(self):
+        model = Model()
+        model.l.append(5)
+
+        self.assertEqual(model.properties(only_changed=True), {'l': [5]})
+
+    def test_mutable_reset_then_in_place(self):
+        model = Model()
+        model.l = [1]
+        model.l = []
+        model.l.append(5)
+
+        self.assertEqual(model.l, [5])
+        self.assertEqual(model.properties(only_changed=True), {'l': [5]})
+
+
+if __name__ == '__main__':
+    unittest.main()
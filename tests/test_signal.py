@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Linux Show Player
+#
+# Copyright 2012-2017 Francesco Ceruti <ceppofrancy@gmail.com>
+#
+# Linux Show Player is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Linux Show Player is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from lisp.core.signal import Signal, Instrumentation
+
+
+class Receiver:
+    def __init__(self):
+        self.calls = 0
+
+    def slot(self):
+        self.calls += 1
+
+
+class SignalNameTest(unittest.TestCase):
+
+    def tearDown(self):
+        Instrumentation.enable(False)
+        Instrumentation.reset()
+
+    def test_explicit_name(self):
+        self.assertEqual(Signal(name='named').name, 'named')
+
+    def test_creation_site_name(self):
+        # Created before the instrumentation is enabled
+        signal = Signal()
+        receiver = Receiver()
+        signal.connect(receiver.slot)
+
+        Instrumentation.reset()
+        Instrumentation.enable()
+        signal.emit()
+
+        self.assertEqual(receiver.calls, 1)
+        self.assertRegex(signal.name, r'^tests\.test_signal:\d+$')
+        self.assertIn(signal.name, Instrumentation.report())
+        self.assertNotIn('Unnamed', Instrumentation.report())
+
+
+if __name__ == '__main__':
+    unittest.main()
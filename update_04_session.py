@@ -19,10 +19,11 @@
 # along with Linux Show Player.  If not, see <http://www.gnu.org/licenses/>.
 
 import argparse
-import json
 import os
 import sys
 
+from lisp.core.session_file import is_compressed, read_session, write_session
+
 parser = argparse.ArgumentParser(
     description='Update LiSP 0.4 sessions to 0.4.1')
 parser.add_argument('sessions', nargs='+', help='Session files to be converted')
@@ -38,9 +39,9 @@ REPLACE = {
 
 for session in args.sessions:
     if os.path.exists(session):
-        content = {}
-        with open(session, mode='r') as sf:
-            content.update(json.load(sf))
+        # Sessions can be gzip-compressed, the format is preserved
+        compressed = is_compressed(session)
+        content = read_session(session)
 
         for cue in content.get('cues', []):
             pipe = cue.get('_media_', {}).get('pipe', [])
@@ -55,8 +56,7 @@ for session in args.sessions:
                         elements[new_key] = elements.pop(old_key)
 
         new_session = os.path.splitext(session)[0] + '_041.lsp'
-        with open(new_session, mode='w') as sf:
-            json.dump(content, sf, sort_keys=True, indent=4)
+        write_session(new_session, content, compressed=compressed)
 
         print('{} updated'.format(session))
     else: